@@ -0,0 +1,100 @@
+""" 
+The :mod:`~uo.algorithm.exact.branch_and_bound.bb_operations_support` module describes the class :class:`~uo.algorithm.exact.branch_and_bound.bb_operations_support.BbOperationsSupport`.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from abc import ABCMeta, abstractmethod
+from typing import TypeVar, Generic
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.algorithm.algorithm import Algorithm
+
+R_co = TypeVar("R_co", covariant=True) 
+A_co = TypeVar("A_co", covariant=True)
+
+class BbOperationsSupport(Generic[R_co,A_co], metaclass=ABCMeta):
+    """
+    Operations of the branch and bound algorithm, over partial assignments - nodes of the search tree, where the 
+    root leaves all decisions open, and complete assignments are leaves
+    """
+    
+    @abstractmethod
+    def copy(self):
+        """
+        Copy the current object
+
+        :return: new  instance with the same properties
+        :rtype: :class:`BbOperationsSupport`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def root(self, problem:Problem, optimizer:Algorithm)->R_co:
+        """
+        Partial assignment where no decision is made - root of the search tree
+
+        :param `Problem` problem: problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: root partial assignment
+        :rtype: R_co
+        """        
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_complete(self, problem:Problem, node:R_co, optimizer:Algorithm)->bool:
+        """
+        Check if all decisions are made within partial assignment, so it represents solution
+
+        :param `Problem` problem: problem that is solved
+        :param R_co node: partial assignment
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: if partial assignment is complete
+        :rtype: bool
+        """        
+        raise NotImplementedError
+
+    @abstractmethod
+    def branch(self, problem:Problem, node:R_co, optimizer:Algorithm)->list[R_co]:
+        """
+        Partial assignments obtained by making one more decision within the given one - children in the search tree
+
+        :param `Problem` problem: problem that is solved
+        :param R_co node: partial assignment that is not complete
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: children partial assignments
+        :rtype: list[R_co]
+        """        
+        raise NotImplementedError
+
+    @abstractmethod
+    def bound(self, problem:Problem, node:R_co, optimizer:Algorithm)->float:
+        """
+        Optimistic bound of the partial assignment - no completion of the partial assignment has fitness greater 
+        than the bound
+
+        :param `Problem` problem: problem that is solved
+        :param R_co node: partial assignment
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: upper bound of the fitness of all completions
+        :rtype: float
+        """        
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, problem:Problem, node:R_co, solution:Solution[R_co,A_co], optimizer:Algorithm)->None:
+        """
+        Sets the solution to the complete assignment and evaluates it
+
+        :param `Problem` problem: problem that is solved
+        :param R_co node: complete assignment
+        :param `Solution[R_co,A_co]` solution: solution that is set
+        :param `Algorithm` optimizer: optimizer that is executed
+        """        
+        raise NotImplementedError
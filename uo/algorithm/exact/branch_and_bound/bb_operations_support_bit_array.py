@@ -0,0 +1,171 @@
+""" 
+..  _py_bb_operations_support_bit_array:
+
+The :mod:`~uo.algorithm.exact.branch_and_bound.bb_operations_support_bit_array` contains class 
+:class:`~uo.algorithm.exact.branch_and_bound.bb_operations_support_bit_array.BbOperationsSupportBitArray`, 
+that represents supporting parts of the `Branch and bound` algorithm, where solution have `BitArray` representation.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+from typing import Callable, TypeVar
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.algorithm.algorithm import Algorithm
+from uo.algorithm.exact.branch_and_bound.bb_operations_support import BbOperationsSupport
+
+A_co = TypeVar("A_co", covariant=True)
+
+class BbOperationsSupportBitArray(BbOperationsSupport[BitArray,A_co]):
+    """
+    Branch and bound operations, where partial assignment is bit array with values of the first positions, and 
+    branching appends value of the next position
+    """
+    
+    def __init__(self, bound_function:Callable[[Problem, BitArray], float])->None:
+        """
+        Create new `BbOperationsSupportBitArray` instance
+
+        :param Callable[[Problem, BitArray], float] bound_function: function that returns upper bound of the fitness 
+        of all solutions whose first positions have the values of the given bit array
+        """
+        if not callable(bound_function):
+            raise TypeError('Parameter \'bound_function\' must be callable.')
+        self.__bound_function:Callable[[Problem, BitArray], float] = bound_function
+
+    def copy(self):
+        """
+        Copy the `BbOperationsSupportBitArray` instance
+
+        :return: new `BbOperationsSupportBitArray` instance with the same properties
+        :rtype: `BbOperationsSupportBitArray`
+        """
+        return BbOperationsSupportBitArray(self.__bound_function)
+
+    @property
+    def bound_function(self)->Callable[[Problem, BitArray], float]:
+        """
+        Property getter for the bound function
+
+        :return: function that returns upper bound of the fitness of all completions of the partial assignment
+        :rtype: Callable[[Problem, BitArray], float]
+        """
+        return self.__bound_function
+
+    def root(self, problem:Problem, optimizer:Algorithm)->BitArray:
+        """
+        Partial assignment where no position has value - root of the search tree
+
+        :param `Problem` problem: problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: empty bit array
+        :rtype: BitArray
+        """        
+        return BitArray()
+
+    def is_complete(self, problem:Problem, node:BitArray, optimizer:Algorithm)->bool:
+        """
+        Check if all positions have values within partial assignment
+
+        :param `Problem` problem: problem that is solved
+        :param BitArray node: partial assignment
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: if partial assignment is complete
+        :rtype: bool
+        """        
+        return len(node) >= problem.dimension
+
+    def branch(self, problem:Problem, node:BitArray, optimizer:Algorithm)->list[BitArray]:
+        """
+        Partial assignments obtained by setting the next position to `0` and to `1`
+
+        :param `Problem` problem: problem that is solved
+        :param BitArray node: partial assignment that is not complete
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: children partial assignments
+        :rtype: list[BitArray]
+        """        
+        return [node + '0b0', node + '0b1']
+
+    def bound(self, problem:Problem, node:BitArray, optimizer:Algorithm)->float:
+        """
+        Optimistic bound of the partial assignment, calculated by bound function
+
+        :param `Problem` problem: problem that is solved
+        :param BitArray node: partial assignment
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: upper bound of the fitness of all completions
+        :rtype: float
+        """        
+        return self.__bound_function(problem, node)
+
+    def complete(self, problem:Problem, node:BitArray, solution:Solution, optimizer:Algorithm)->None:
+        """
+        Sets the solution to the complete assignment and evaluates it
+
+        :param `Problem` problem: problem that is solved
+        :param BitArray node: complete assignment
+        :param `Solution` solution: solution that is set
+        :param `Algorithm` optimizer: optimizer that is executed
+        """        
+        solution.init_from(node, problem)
+        optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+        optimizer.evaluation += 1
+        solution.evaluate(problem)
+        optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
+        group_end:str ='}')->str:
+        """
+        String representation of the bb support structure
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string 
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string 
+        :type group_end: str, optional, default value '}'
+        :return: string representation of bb support instance
+        :rtype: str
+        """        
+        return 'BbOperationsSupportBitArray'
+
+    def __str__(self)->str:
+        """
+        String representation of the bb support instance
+
+        :return: string representation of the bb support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        Representation of the bb support instance
+
+        :return: string representation of the bb support instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the bb support instance
+
+        :param str spec: format specification
+        :return: formatted bb support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
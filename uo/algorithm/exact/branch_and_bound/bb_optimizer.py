@@ -0,0 +1,294 @@
+"""
+The :mod:`~uo.algorithm.exact.branch_and_bound.bb_optimizer` module describes the class :class:`~uo.algorithm.exact.branch_and_bound.bb_optimizer.BbOptimizer`.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+from datetime import datetime
+
+from typing import Optional
+
+from dataclasses import dataclass
+
+from uo.utils.logger import logger
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+
+from uo.algorithm.output_control import OutputControl
+from uo.algorithm.algorithm import Algorithm
+from uo.algorithm.exact.branch_and_bound.bb_operations_support import BbOperationsSupport
+
+@dataclass
+class BbOptimizerConstructionParameters:
+    """
+    Instance of the class :class:`~uo.algorithm.exact.branch_and_bound.bb_optimizer.BbOptimizerConstructionParameters` represents constructor parameters for branch and bound algorithm.
+    """
+    bb_operations_support:BbOperationsSupport = None
+    problem:Optional[Problem] = None
+    solution_template:Optional[Solution] = None
+    output_control:Optional[OutputControl] = None
+
+class BbOptimizer(Algorithm):
+    """
+    This class represent branch and bound algorithm - search tree of partial assignments is traversed depth first,
+    children of the node are visited from the one with the best bound, and the node is pruned when its bound
+    shows that no completion can be better than the best solution found so far
+    """
+
+    def __init__(self,
+            bb_operations_support:BbOperationsSupport,
+            problem:Problem,
+            solution_template:Optional[Solution],
+            output_control:Optional[OutputControl]=None
+            )->None:
+        """
+        Create new BbOptimizer instance
+
+        :param `BbOperationsSupport` bb_operations_support: placeholder for operations, specific for B&B
+        :param `Problem` problem: problem to be solved
+        :param `Optional[Solution]` solution_template: solution from which algorithm started
+        :param `Optional[OutputControl]` output_control: structure that controls output
+        """
+        if not isinstance(bb_operations_support, BbOperationsSupport):
+                raise TypeError('Parameter \'bb_operations_support\' must be \'BbOperationsSupport\'.')
+        super().__init__(name='branch_and_bound',
+                output_control=output_control,
+                problem=problem,
+                solution_template=solution_template)
+        self.__bb_operations_support:BbOperationsSupport = bb_operations_support
+        # current solution
+        self.__current_solution:Optional[Solution] = None
+        # statistics of the search tree
+        self.__nodes_visited:int = 0
+        self.__nodes_pruned:int = 0
+
+    def copy(self):
+        """
+        Internal copy of the current instance of class
+
+        :return: new instance  with the same properties
+        """
+        bos:Optional[BbOperationsSupport] = None
+        if self.__bb_operations_support is not None:
+            bos = self.__bb_operations_support.copy()
+        pr:Optional[Problem] = None
+        if self.problem is not None:
+            pr = self.problem.copy()
+        st:Optional[Solution] = None
+        if self.solution_template is not None:
+            st = self.solution_template.copy()
+        oc:Optional[OutputControl] = None
+        if self.output_control is not None:
+            oc = self.output_control.copy()
+        bb_opt:'BbOptimizer' = BbOptimizer(bos,
+                                    pr,
+                                    st,
+                                    oc)
+        if self.__current_solution is not None:
+            bb_opt.__current_solution = self.__current_solution.copy()
+        return bb_opt
+
+    @classmethod
+    def from_construction_tuple(cls, construction_tuple:BbOptimizerConstructionParameters):
+        """
+        Additional constructor, that creates new instance of class :class:`~uo.algorithm.exact.branch_and_bound.bb_optimizer.BbOptimizer`.
+
+        :param `BbOptimizerConstructionParameters` construction_tuple: tuple with all constructor parameters
+        """
+        return cls(
+            construction_tuple.bb_operations_support,
+            construction_tuple.problem,
+            construction_tuple.solution_template,
+            construction_tuple.output_control)
+
+    @property
+    def bb_operations_support(self)->BbOperationsSupport:
+        """
+        Property getter for the placeholder for operations, specific for B&B
+
+        :return: operations support of the branch and bound
+        :rtype: :class:`BbOperationsSupport`
+        """
+        return self.__bb_operations_support
+
+    @property
+    def current_solution(self)->Optional[Solution]:
+        """
+        Property getter for the current solution used during B&B execution
+
+        :return: instance of the :class:`uo.solution.Solution` class subtype -- current solution of the problem
+        :rtype: :class:`Optional[Solution]`
+        """
+        return self.__current_solution
+
+    @current_solution.setter
+    def current_solution(self, value:Optional[Solution])->None:
+        """
+        Property setter for the current solution used during B&B execution
+
+        :param value: the current solution
+        :type value: :class:`Optional[Solution]`
+        """
+        if not isinstance(value, Solution) and value is not None:
+            raise TypeError('Parameter \'current_solution\' must have type \'Solution\' or be None.')
+        self.__current_solution = value
+
+    @property
+    def nodes_visited(self)->int:
+        """
+        Property getter for the number of nodes of the search tree that are visited
+
+        :return: number of visited nodes
+        :rtype: int
+        """
+        return self.__nodes_visited
+
+    @property
+    def nodes_pruned(self)->int:
+        """
+        Property getter for the number of nodes of the search tree that are pruned, because of their bound
+
+        :return: number of pruned nodes
+        :rtype: int
+        """
+        return self.__nodes_pruned
+
+    def init(self):
+        """
+        Initialization of the branch and bound algorithm
+        """
+        super().init()
+        self.current_solution = self.solution_template.copy()
+        self.evaluation = 0
+        self.iteration = 0
+        self.__nodes_visited = 0
+        self.__nodes_pruned = 0
+
+    def __can_be_pruned(self, bound:float, incumbent:Optional[Solution])->bool:
+        """
+        Check if no completion of the node with the given bound can be better than the incumbent solution
+        """
+        return incumbent is not None and incumbent.fitness_value is not None and \
+                bound <= incumbent.fitness_value
+
+    def optimize(self)->Solution:
+        """
+        Executing branch and bound - nodes are explored depth first, starting from the root, and children of the
+        node are visited in best-first order, i.e. the child with the largest bound is visited first. Node is pruned
+        when its bound is less than or equal to the fitness of the best solution found so far - bound is checked
+        both when child is created and again when it is taken from the stack, as the best solution could be
+        improved in the meantime. Complete nodes are turned into solutions, that replace the best one if better.
+        The best solution of the previous execution, if any, is not taken into account.
+
+        :return: the best solution found
+        :rtype: `Solution`
+        """
+        self.init()
+        self.write_output_headers_if_needed()
+        self.write_output_values_if_needed("before_algorithm", "b_a")
+        root = self.__bb_operations_support.root(self.problem, self)
+        # incumbent of this execution - the best solution of the previous one must not prune the tree
+        incumbent:Optional[Solution] = None
+        # stack of nodes with their bounds, so the node on top is visited next
+        stack:list = [(self.__bb_operations_support.bound(self.problem, root, self), root)]
+        while stack:
+            bound, node = stack.pop()
+            # bound is checked again, as the best solution could be improved after the node was pushed
+            if self.__can_be_pruned(bound, incumbent):
+                self.__nodes_pruned += 1
+                continue
+            self.write_output_values_if_needed("before_iteration", "b_i")
+            self.iteration += 1
+            self.__nodes_visited += 1
+            if self.__bb_operations_support.is_complete(self.problem, node, self):
+                self.__bb_operations_support.complete(self.problem, node, self.current_solution, self)
+                if incumbent is None or self.current_solution.is_better(incumbent, self.problem):
+                    incumbent = self.current_solution.copy()
+                    self.best_solution = incumbent
+                    self.evaluation_best_found = self.evaluation
+                    self.iteration_best_found = self.iteration
+            else:
+                children:list = []
+                for child in self.__bb_operations_support.branch(self.problem, node, self):
+                    child_bound:float = self.__bb_operations_support.bound(self.problem, child, self)
+                    if self.__can_be_pruned(child_bound, incumbent):
+                        self.__nodes_pruned += 1
+                    else:
+                        children.append((child_bound, child))
+                # child with the best bound is pushed last, so it is visited first
+                children.sort(key=lambda bound_node: bound_node[0])
+                stack.extend(children)
+            self.write_output_values_if_needed("after_iteration", "a_i")
+        logger.debug('Nodes visited: {}, nodes pruned: {}'.format(self.__nodes_visited, self.__nodes_pruned))
+        self.execution_ended = datetime.now()
+        self.write_output_values_if_needed("after_algorithm", "a_a")
+        return self.best_solution
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{',
+        group_end:str ='}')->str:
+        """
+        String representation of the 'BbOptimizer' instance
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string
+        :type group_end: str, optional, default value '}'
+        :return: string representation of instance that controls output
+        :rtype: str
+        """
+        s = super().string_rep(delimiter, indentation, indentation_symbol, '', '')
+        s += delimiter
+        if self.current_solution is not None:
+            s += 'current_solution=' + self.current_solution.string_rep(delimiter, indentation + 1,
+                    indentation_symbol, group_start, group_end) + delimiter
+        else:
+            s += 'current_solution=None' + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'nodes_visited=' + str(self.__nodes_visited) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'nodes_pruned=' + str(self.__nodes_pruned) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_end
+        return s
+
+    def __str__(self)->str:
+        """
+        String representation of the 'BbOptimizer' instance
+
+        :return: string representation of the 'BbOptimizer' instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        Representation of the 'BbOptimizer' instance
+
+        :return: string representation of the 'BbOptimizer' instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted 'BbOptimizer' instance
+
+        :param str spec: format specification
+        :return: formatted 'BbOptimizer' instance
+        :rtype: str
+        """
+        return self.string_rep('|')
@@ -0,0 +1,152 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.solution.quality_of_solution import QualityOfSolution
+
+from uo.algorithm.exact.branch_and_bound.bb_operations_support import BbOperationsSupport
+from uo.algorithm.exact.branch_and_bound.bb_operations_support_bit_array import BbOperationsSupportBitArray
+from uo.algorithm.exact.branch_and_bound.bb_optimizer import BbOptimizer, BbOptimizerConstructionParameters
+from uo.algorithm.exact.total_enumeration.te_operations_support_bit_array import TeOperationsSupportBitArray
+from uo.algorithm.exact.total_enumeration.te_optimizer import TeOptimizer
+
+from uo.algorithm.exact.total_enumeration.test_te_optimizer_parallel import ProblemWithDimension
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+WEIGHTS = [5, 4, 6, 3, 7, 2, 8, 4]
+VALUES = [10, 7, 12, 4, 13, 3, 15, 6]
+CAPACITY = 17
+
+class SolutionKnapsackBitArray(SolutionWeightedOnesBitArray):
+    """
+    Solution of small knapsack problem - fitness is total value, or negative total weight when capacity is exceeded
+    """
+
+    def copy(self)->'SolutionKnapsackBitArray':
+        obj = SolutionKnapsackBitArray(self.representation.copy())
+        obj.copy_from(self)
+        return obj
+
+    def calculate_quality_directly(self, representation:BitArray, problem:Problem)->QualityOfSolution:
+        weight:int = sum(WEIGHTS[i] for i in representation.findall('0b1'))
+        if weight > CAPACITY:
+            return QualityOfSolution(-weight, None, -weight, None, False)
+        value:int = sum(VALUES[i] for i in representation.findall('0b1'))
+        return QualityOfSolution(value, None, value, None, True)
+
+def knapsack_bound(problem:Problem, node:BitArray)->float:
+    weight:int = sum(WEIGHTS[i] for i in node.findall('0b1'))
+    if weight > CAPACITY:
+        return -weight
+    value:int = sum(VALUES[i] for i in node.findall('0b1'))
+    return value + sum(VALUES[len(node):])
+
+class TestBbOperationsSupportBitArray(unittest.TestCase):
+
+    # branching appends value of the next position
+    def test_branch_should_append_next_position(self):
+        # Arrange
+        support = BbOperationsSupportBitArray(knapsack_bound)
+        problem = ProblemWithDimension(3)
+        # Act
+        children = support.branch(problem, BitArray(bin='10'), mocker.MagicMock())
+        # Assert
+        self.assertEqual([c.bin for c in children], ['100', '101'])
+        self.assertTrue(support.is_complete(problem, children[0], mocker.MagicMock()))
+        self.assertFalse(support.is_complete(problem, support.root(problem, mocker.MagicMock()),
+                mocker.MagicMock()))
+
+    # bound function that is not callable raises TypeError
+    def test_not_callable_bound_function_should_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            BbOperationsSupportBitArray(42)
+
+class TestBbOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemWithDimension(len(WEIGHTS))
+        self.solution_template = SolutionKnapsackBitArray(BitArray(length=len(WEIGHTS)))
+
+    # branch and bound finds the same best fitness as total enumeration, with fewer evaluations
+    def test_optimize_should_find_optimum_with_pruning(self):
+        # Arrange
+        te_optimizer = TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template)
+        bb_optimizer = BbOptimizer(BbOperationsSupportBitArray(knapsack_bound), self.problem, 
+                self.solution_template)
+        # Act
+        te_best = te_optimizer.optimize()
+        bb_best = bb_optimizer.optimize()
+        # Assert
+        self.assertEqual(bb_best.fitness_value, te_best.fitness_value)
+        self.assertGreater(bb_optimizer.nodes_pruned, 0)
+        self.assertLess(bb_optimizer.evaluation, pow(2, len(WEIGHTS)))
+        self.assertEqual(bb_optimizer.iteration, bb_optimizer.nodes_visited)
+
+    # without pruning, all leaves are evaluated
+    def test_optimize_with_trivial_bound_should_visit_whole_tree(self):
+        # Arrange
+        bb_optimizer = BbOptimizer(BbOperationsSupportBitArray(lambda problem, node: float('inf')), 
+                self.problem, self.solution_template)
+        # Act
+        bb_optimizer.optimize()
+        # Assert
+        self.assertEqual(bb_optimizer.evaluation, pow(2, len(WEIGHTS)))
+        self.assertEqual(bb_optimizer.nodes_visited, pow(2, len(WEIGHTS) + 1) - 1)
+        self.assertEqual(bb_optimizer.nodes_pruned, 0)
+
+    # repeated execution searches the whole tree again, regardless of the best solution of the previous one
+    def test_optimize_again_should_ignore_previous_best_solution(self):
+        # Arrange
+        bb_optimizer = BbOptimizer(BbOperationsSupportBitArray(knapsack_bound), self.problem,
+                self.solution_template)
+        first_best = bb_optimizer.optimize()
+        nodes_visited = bb_optimizer.nodes_visited
+        evaluation_best_found = bb_optimizer.evaluation_best_found
+        stale_best = self.solution_template.copy()
+        stale_best.fitness_value = 1000
+        bb_optimizer.best_solution = stale_best
+        # Act
+        best = bb_optimizer.optimize()
+        # Assert
+        self.assertEqual(best.fitness_value, first_best.fitness_value)
+        self.assertEqual(best.representation, first_best.representation)
+        self.assertEqual(bb_optimizer.nodes_visited, nodes_visited)
+        self.assertEqual(bb_optimizer.evaluation_best_found, evaluation_best_found)
+        self.assertGreater(bb_optimizer.evaluation_best_found, 0)
+        self.assertLessEqual(bb_optimizer.evaluation_best_found, bb_optimizer.evaluation)
+
+    # copy does not share the current solution
+    def test_copy_should_copy_current_solution(self):
+        # Arrange
+        bb_optimizer = BbOptimizer(BbOperationsSupportBitArray(knapsack_bound), self.problem,
+                self.solution_template)
+        bb_optimizer.optimize()
+        # Act
+        bb_optimizer_copy = bb_optimizer.copy()
+        # Assert
+        self.assertIsNot(bb_optimizer_copy.current_solution, bb_optimizer.current_solution)
+        self.assertEqual(bb_optimizer_copy.current_solution.representation,
+                bb_optimizer.current_solution.representation)
+
+    # operations support of the wrong type raises TypeError
+    def test_wrong_operations_support_should_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            BbOptimizer(mocker.MagicMock(), self.problem, self.solution_template)
+
+    # construction tuple and copy keep operations support
+    def test_from_construction_tuple_and_copy(self):
+        # Arrange
+        construction_tuple = BbOptimizerConstructionParameters(BbOperationsSupportBitArray(knapsack_bound),
+                self.problem, self.solution_template)
+        # Act
+        bb_optimizer = BbOptimizer.from_construction_tuple(construction_tuple)
+        bb_optimizer_copy = bb_optimizer.copy()
+        # Assert
+        self.assertIsInstance(bb_optimizer_copy.bb_operations_support, BbOperationsSupport)
+        self.assertIs(bb_optimizer_copy.bb_operations_support.bound_function, knapsack_bound)
+
+if __name__ == '__main__':
+    unittest.main()
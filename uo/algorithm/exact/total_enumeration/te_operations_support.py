@@ -82,3 +82,63 @@ class TeOperationsSupport(Generic[R_co,A_co], metaclass=ABCMeta):
         :rtype: int
         """        
         raise NotImplementedError
+
+    def split(self, problem:Problem, prefix_length:int)->list['TeOperationsSupport[R_co,A_co]']:
+        """
+        Splits the space of the total enumeration into shards, by fixing values at the highest positions. Each
+        shard is enumerated by its own operations support, independently of others.
+
+        :param `Problem` problem: problem that is solved
+        :param int prefix_length: number of the highest positions whose values are fixed within each shard
+        :return: operations supports, one for each shard
+        :rtype: list[TeOperationsSupport[R_co,A_co]]
+        """
+        raise NotImplementedError
+
+    def checkpoint_state(self, problem:Problem, solution:Solution[R_co,A_co], optimizer:Algorithm)->dict:
+        """
+        Returns internal state of the total enumerator, so the process can be resumed later. State must be 
+        serializable as JSON.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution[R_co,A_co]` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: internal state of the total enumerator
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def representation_state(self, representation:R_co)->object:
+        """
+        Returns representation in the form that is serializable as JSON, so the best solution can be written to 
+        the checkpoint - string representation of the solution is not used, as it describes the argument of the 
+        solution, which can not be always converted back to representation
+
+        :param R_co representation: native representation of the solution
+        :return: representation, serializable as JSON
+        :rtype: object
+        """
+        raise NotImplementedError
+
+    def representation_from_state(self, state:object)->R_co:
+        """
+        Restores native representation, previously returned by `representation_state`
+
+        :param object state: representation, serializable as JSON
+        :return: native representation of the solution
+        :rtype: R_co
+        """
+        raise NotImplementedError
+
+    def restore_state(self, problem:Problem, solution:Solution[R_co,A_co], optimizer:Algorithm, 
+            state:dict)->None:
+        """
+        Restores internal state of the total enumerator, previously returned by `checkpoint_state`. Internal 
+        state of the solution will be set to reflect the restored configuration.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution[R_co,A_co]` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :param dict state: internal state of the total enumerator
+        """
+        raise NotImplementedError
@@ -35,10 +35,24 @@ A_co = TypeVar("A_co", covariant=True)
 
 class TeOperationsSupportBitArray(TeOperationsSupport[BitArray,A_co]):
     
-    def __init__(self)->None:
+    def __init__(self, prefix_length:int=0, prefix:int=0)->None:
         """
         Create new `TeOperationsSupportBitArray` instance
+
+        :param int prefix_length: number of the highest positions whose values are fixed, so only the shard of 
+        the space with the given prefix is enumerated
+        :param int prefix: values at the fixed highest positions
         """
+        if not isinstance(prefix_length, int):
+            raise TypeError('Parameter \'prefix_length\' must be \'int\'.')
+        if prefix_length < 0:
+            raise ValueError('Parameter \'prefix_length\' must not be negative.')
+        if not isinstance(prefix, int):
+            raise TypeError('Parameter \'prefix\' must be \'int\'.')
+        if prefix < 0 or prefix >= pow(2, prefix_length):
+            raise ValueError('Parameter \'prefix\' must be between 0 and 2^prefix_length-1.')
+        self.__prefix_length:int = prefix_length
+        self.__prefix:int = prefix
         self.__bit_array_counter = None
 
     def copy(self):
@@ -48,10 +62,31 @@ class TeOperationsSupportBitArray(TeOperationsSupport[BitArray,A_co]):
         :return: new `MaxOnesCountProblemBitArraySolutionTeSupport` instance with the same properties
         :rtype: `TeOperationsSupportBitArray`
         """
-        sol:'TeOperationsSupportBitArray' = TeOperationsSupportBitArray()
-        sol.__bit_array_counter = self.__bit_array_counter.copy()
+        sol:'TeOperationsSupportBitArray' = TeOperationsSupportBitArray(self.__prefix_length, self.__prefix)
+        if self.__bit_array_counter is not None:
+            sol.__bit_array_counter = self.__bit_array_counter.copy()
         return sol
 
+    @property
+    def prefix_length(self)->int:
+        """
+        Property getter for the number of the highest positions with fixed values
+
+        :return: number of the highest positions with fixed values
+        :rtype: int
+        """
+        return self.__prefix_length
+
+    @property
+    def prefix(self)->int:
+        """
+        Property getter for the values at the fixed highest positions
+
+        :return: values at the fixed highest positions
+        :rtype: int
+        """
+        return self.__prefix
+
     def reset(self, problem:Problem, solution:Solution, optimizer:Algorithm)->None:
         """
         Resets internal counter of the total enumerator, so process will start over. Internal state of the solution 
@@ -61,7 +96,8 @@ class TeOperationsSupportBitArray(TeOperationsSupport[BitArray,A_co]):
         :param `MaxOnesCountProblemBitArraySolution` solution: solution used for the problem that is solved
         :param `Algorithm` optimizer: optimizer that is executed
         """        
-        self.__bit_array_counter = ComplexCounterBitArrayFull(problem.dimension)
+        self.__bit_array_counter = ComplexCounterBitArrayFull(problem.dimension, self.__prefix_length, 
+                self.__prefix)
         self.__bit_array_counter.reset()
         solution.init_from(self.__bit_array_counter.current_state(), problem)
         optimizer.write_output_values_if_needed("before_evaluation", "b_e")
@@ -107,7 +143,76 @@ class TeOperationsSupportBitArray(TeOperationsSupport[BitArray,A_co]):
         :return: overall number of evaluations required for finishing total enumeration process
         :rtype: int
         """        
-        return pow(2, problem.dimension)
+        return pow(2, problem.dimension - self.__prefix_length)
+
+    def checkpoint_state(self, problem:Problem, solution:Solution, optimizer:Algorithm)->dict:
+        """
+        Returns internal state of the total enumerator, so the process can be resumed later.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: state of the counter, with its prefix
+        :rtype: dict
+        """
+        return {'counters': self.__bit_array_counter.current_state().bin,
+                'prefix_length': self.__prefix_length,
+                'prefix': self.__prefix}
+
+    def restore_state(self, problem:Problem, solution:Solution, optimizer:Algorithm, state:dict)->None:
+        """
+        Restores internal state of the total enumerator, previously returned by `checkpoint_state`. Solution is 
+        set to the restored configuration, but it is not evaluated.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :param dict state: state of the counter, with its prefix
+        """
+        if state['prefix_length'] != self.__prefix_length or state['prefix'] != self.__prefix:
+            raise ValueError('Checkpoint is written for the different shard.')
+        self.__bit_array_counter = ComplexCounterBitArrayFull(problem.dimension, self.__prefix_length, 
+                self.__prefix)
+        self.__bit_array_counter.set_state(BitArray(bin=state['counters']))
+        solution.init_from(self.__bit_array_counter.current_state(), problem)
+
+    def representation_state(self, representation:BitArray)->str:
+        """
+        Returns representation in the form that is serializable as JSON
+
+        :param BitArray representation: native representation of the solution
+        :return: bits of the representation
+        :rtype: str
+        """
+        return representation.bin
+
+    def representation_from_state(self, state:str)->BitArray:
+        """
+        Restores native representation, previously returned by `representation_state`
+
+        :param str state: bits of the representation
+        :return: native representation of the solution
+        :rtype: BitArray
+        """
+        return BitArray(bin=state)
+
+    def split(self, problem:Problem, prefix_length:int)->list['TeOperationsSupportBitArray']:
+        """
+        Splits the space of the total enumeration into `2^prefix_length` shards, by fixing values at the highest 
+        positions. Each shard is enumerated by its own operations support, independently of others.
+
+        :param `Problem` problem: problem that is solved
+        :param int prefix_length: number of the highest positions whose values are fixed within each shard
+        :return: operations supports, one for each shard
+        :rtype: list[TeOperationsSupportBitArray]
+        """
+        if not isinstance(prefix_length, int):
+            raise TypeError('Parameter \'prefix_length\' must be \'int\'.')
+        if self.__prefix_length != 0:
+            raise ValueError('Operations support that is already a shard can not be split.')
+        if prefix_length < 0 or prefix_length > problem.dimension:
+            raise ValueError('Parameter \'prefix_length\' must be between 0 and problem dimension.')
+        return [TeOperationsSupportBitArray(prefix_length, prefix) for prefix in range(pow(2, prefix_length))]
 
     def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
         group_end:str ='}')->str:
@@ -127,7 +232,10 @@ class TeOperationsSupportBitArray(TeOperationsSupport[BitArray,A_co]):
         :return: string representation of vns support instance
         :rtype: str
         """        
-        return 'TeOperationsSupportBitArray'
+        if self.__prefix_length == 0:
+            return 'TeOperationsSupportBitArray'
+        return 'TeOperationsSupportBitArray(prefix_length=' + str(self.__prefix_length) + ', prefix=' + \
+                str(self.__prefix) + ')'
 
     def __str__(self)->str:
         """
@@ -0,0 +1,310 @@
+""" 
+..  _py_te_operations_support_gray_code_bit_array:
+
+The :mod:`~uo.algorithm.exact.total_enumeration.te_operations_support_gray_code_bit_array` contains class 
+:class:`~uo.algorithm.exact.total_enumeration.te_operations_support_gray_code_bit_array.TeOperationsSupportGrayCodeBitArray`, 
+that represents supporting parts of the `Total enumeration` algorithm, where solutions with `BitArray` representation 
+are visited in Gray code order.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+from typing import TypeVar
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.algorithm.algorithm import Algorithm
+from uo.algorithm.exact.total_enumeration.te_operations_support import TeOperationsSupport
+
+A_co = TypeVar("A_co", covariant=True)
+
+class TeOperationsSupportGrayCodeBitArray(TeOperationsSupport[BitArray,A_co]):
+    """
+    Total enumeration support where configurations are visited in reflected Gray code order - each step flips 
+    exactly one bit of the solution in place, and the solution is evaluated incrementally. Values at the highest
+    positions can be fixed, so only the shard of the space is enumerated.
+    """
+    
+    def __init__(self, prefix_length:int=0, prefix:int=0)->None:
+        """
+        Create new `TeOperationsSupportGrayCodeBitArray` instance
+
+        :param int prefix_length: number of the highest positions whose values are fixed, so only the shard of 
+        the space with the given prefix is enumerated
+        :param int prefix: values at the fixed highest positions - bit `i` of the prefix is the value at position
+        `dimension - prefix_length + i`
+        """
+        if not isinstance(prefix_length, int):
+            raise TypeError('Parameter \'prefix_length\' must be \'int\'.')
+        if prefix_length < 0:
+            raise ValueError('Parameter \'prefix_length\' must not be negative.')
+        if not isinstance(prefix, int):
+            raise TypeError('Parameter \'prefix\' must be \'int\'.')
+        if prefix < 0 or prefix >= pow(2, prefix_length):
+            raise ValueError('Parameter \'prefix\' must be between 0 and 2^prefix_length-1.')
+        self.__prefix_length:int = prefix_length
+        self.__prefix:int = prefix
+        self.__step:int = 0
+        self.__number_of_steps:int = 0
+
+    def copy(self):
+        """
+        Copy the `TeOperationsSupportGrayCodeBitArray` instance
+
+        :return: new `TeOperationsSupportGrayCodeBitArray` instance with the same properties
+        :rtype: `TeOperationsSupportGrayCodeBitArray`
+        """
+        sup:'TeOperationsSupportGrayCodeBitArray' = TeOperationsSupportGrayCodeBitArray(self.__prefix_length,
+                self.__prefix)
+        sup.__step = self.__step
+        sup.__number_of_steps = self.__number_of_steps
+        return sup
+
+    @property
+    def prefix_length(self)->int:
+        """
+        Property getter for the number of the highest positions with fixed values
+
+        :return: number of the highest positions with fixed values
+        :rtype: int
+        """
+        return self.__prefix_length
+
+    @property
+    def prefix(self)->int:
+        """
+        Property getter for the values at the fixed highest positions
+
+        :return: values at the fixed highest positions
+        :rtype: int
+        """
+        return self.__prefix
+
+    @property
+    def step(self)->int:
+        """
+        Property getter for the number of steps made since reset
+
+        :return: number of steps made since reset - Gray code of the step is the current configuration
+        :rtype: int
+        """
+        return self.__step
+
+    @staticmethod
+    def flipped_position(step:int)->int:
+        """
+        Position flipped at the given step of the Gray code enumeration - it is the position of the lowest set 
+        bit of the step
+
+        :param int step: step of the enumeration, greater than zero
+        :return: flipped position
+        :rtype: int
+        """
+        return (step & -step).bit_length() - 1
+
+    def configuration(self, problem:Problem, step:int)->BitArray:
+        """
+        Configuration visited at the given step - Gray code of the step at the free positions, and the prefix at
+        the fixed highest positions
+
+        :param `Problem` problem: problem that is solved
+        :param int step: step of the enumeration
+        :return: configuration visited at the step
+        :rtype: BitArray
+        """
+        free:int = problem.dimension - self.__prefix_length
+        gray:int = step ^ (step >> 1)
+        representation:BitArray = BitArray(problem.dimension)
+        for i in range(free):
+            representation[i] = bool(gray >> i & 1)
+        for i in range(self.__prefix_length):
+            representation[free + i] = bool(self.__prefix >> i & 1)
+        return representation
+
+    def reset(self, problem:Problem, solution:Solution, optimizer:Algorithm)->None:
+        """
+        Resets internal counter of the total enumerator, so process will start over, from the configuration with 
+        all zeros at the free positions. Solution is set to that configuration and fully evaluated.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        """        
+        if self.__prefix_length > problem.dimension:
+            raise ValueError('Prefix length must not be greater than problem dimension.')
+        self.__step = 0
+        self.__number_of_steps = pow(2, problem.dimension - self.__prefix_length) - 1
+        solution.init_from(self.configuration(problem, 0), problem)
+        optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+        optimizer.evaluation += 1
+        solution.evaluate(problem)
+        optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+
+    def progress(self, problem:Problem, solution:Solution, optimizer:Algorithm)->None:
+        """
+        Flips one bit of the solution in place, so the next configuration in Gray code order is taken into 
+        consideration, and evaluates solution incrementally.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        """        
+        if self.__step >= self.__number_of_steps:
+            return
+        self.__step += 1
+        position:int = self.flipped_position(self.__step)
+        solution.representation.invert(position)
+        optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+        optimizer.evaluation += 1
+        solution.evaluate_incrementally(problem, [position])
+        optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+
+    def can_progress(self, problem:Problem, solution:Solution, optimizer:Algorithm)->bool:
+        """
+        Check if total enumeration process is not at end.  
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: indicator if total enumeration process is not at end 
+        :rtype: bool
+        """        
+        return self.__step < self.__number_of_steps
+
+    def overall_number_of_evaluations(self, problem:Problem, solution:Solution, optimizer:Algorithm)->int:
+        """
+        Returns overall number of evaluations required for finishing total enumeration process.  
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: overall number of evaluations required for finishing total enumeration process
+        :rtype: int
+        """        
+        return pow(2, problem.dimension - self.__prefix_length)
+
+    def checkpoint_state(self, problem:Problem, solution:Solution, optimizer:Algorithm)->dict:
+        """
+        Returns internal state of the total enumerator, so the process can be resumed later - the step fully 
+        determines the current configuration.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :return: step of the enumeration, with the prefix
+        :rtype: dict
+        """
+        return {'step': self.__step,
+                'prefix_length': self.__prefix_length,
+                'prefix': self.__prefix}
+
+    def restore_state(self, problem:Problem, solution:Solution, optimizer:Algorithm, state:dict)->None:
+        """
+        Restores internal state of the total enumerator, previously returned by `checkpoint_state`. Solution is 
+        set to the configuration of the restored step and fully evaluated, as next steps evaluate it 
+        incrementally - that evaluation is not counted, as it was counted before the checkpoint.
+
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `Algorithm` optimizer: optimizer that is executed
+        :param dict state: step of the enumeration, with the prefix
+        """
+        if state['prefix_length'] != self.__prefix_length or state['prefix'] != self.__prefix:
+            raise ValueError('Checkpoint is written for the different shard.')
+        self.__number_of_steps = pow(2, problem.dimension - self.__prefix_length) - 1
+        self.__step = state['step']
+        solution.init_from(self.configuration(problem, self.__step), problem)
+        solution.evaluate(problem)
+
+    def split(self, problem:Problem, prefix_length:int)->list['TeOperationsSupportGrayCodeBitArray']:
+        """
+        Splits the space of the total enumeration into `2^prefix_length` shards, by fixing values at the highest 
+        positions. Each shard is enumerated by its own operations support, independently of others.
+
+        :param `Problem` problem: problem that is solved
+        :param int prefix_length: number of the highest positions whose values are fixed within each shard
+        :return: operations supports, one for each shard
+        :rtype: list[TeOperationsSupportGrayCodeBitArray]
+        """
+        if not isinstance(prefix_length, int):
+            raise TypeError('Parameter \'prefix_length\' must be \'int\'.')
+        if self.__prefix_length != 0:
+            raise ValueError('Operations support that is already a shard can not be split.')
+        if prefix_length < 0 or prefix_length > problem.dimension:
+            raise ValueError('Parameter \'prefix_length\' must be between 0 and problem dimension.')
+        return [TeOperationsSupportGrayCodeBitArray(prefix_length, prefix) for prefix in range(pow(2, prefix_length))]
+
+    def representation_state(self, representation:BitArray)->str:
+        """
+        Returns representation in the form that is serializable as JSON
+
+        :param BitArray representation: native representation of the solution
+        :return: bits of the representation
+        :rtype: str
+        """
+        return representation.bin
+
+    def representation_from_state(self, state:str)->BitArray:
+        """
+        Restores native representation, previously returned by `representation_state`
+
+        :param str state: bits of the representation
+        :return: native representation of the solution
+        :rtype: BitArray
+        """
+        return BitArray(bin=state)
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
+        group_end:str ='}')->str:
+        """
+        String representation of the te support structure
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string 
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string 
+        :type group_end: str, optional, default value '}'
+        :return: string representation of te support instance
+        :rtype: str
+        """        
+        return 'TeOperationsSupportGrayCodeBitArray'
+
+    def __str__(self)->str:
+        """
+        String representation of the te support instance
+
+        :return: string representation of the te support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        Representation of the te support instance
+
+        :return: string representation of the te support instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the te support instance
+
+        :param str spec: format specification
+        :return: formatted te support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
@@ -10,6 +10,8 @@ import sys
 sys.path.append(directory.parent)
 sys.path.append(directory.parent.parent)
 
+import json
+import os
 from random import random
 from random import randrange
 
@@ -42,6 +44,8 @@ class TeOptimizerConstructionParameters:
     problem:Optional[Problem] = None
     solution_template:Optional[Solution] = None
     output_control:Optional[OutputControl] = None
+    checkpoint_file_path:Optional[str] = None
+    checkpoint_interval:int = 0
 
 class TeOptimizer(Algorithm):
     """
@@ -52,7 +56,9 @@ class TeOptimizer(Algorithm):
             te_operations_support:TeOperationsSupport,
             problem:Problem,
             solution_template:Optional[Solution],
-            output_control:Optional[OutputControl]=None
+            output_control:Optional[OutputControl]=None,
+            checkpoint_file_path:Optional[str]=None,
+            checkpoint_interval:int=0
             )->None:
         """
         Create new TeOptimizer instance
@@ -61,9 +67,21 @@ class TeOptimizer(Algorithm):
         :param `Problem` problem: problem to be solved
         :param `Optional[Solution]` solution_template: solution from which algorithm started
         :param `Optional[OutputControl]` output_control: structure that controls output
+        :param `Optional[str]` checkpoint_file_path: path of the file where checkpoints are written, and from 
+        which enumeration is resumed
+        :param int checkpoint_interval: number of iterations between two checkpoints - if `0`, checkpoints are 
+        not written
         """
         if not isinstance(te_operations_support, TeOperationsSupport):
                 raise TypeError('Parameter \'te_operations_support\' must be \'TeOperationsSupport\'.')
+        if checkpoint_file_path is not None and not isinstance(checkpoint_file_path, str):
+                raise TypeError('Parameter \'checkpoint_file_path\' must be \'str\' or \'None\'.')
+        if not isinstance(checkpoint_interval, int):
+                raise TypeError('Parameter \'checkpoint_interval\' must be \'int\'.')
+        if checkpoint_interval < 0:
+                raise ValueError('Parameter \'checkpoint_interval\' must not be negative.')
+        if checkpoint_interval > 0 and checkpoint_file_path is None:
+                raise ValueError('Parameter \'checkpoint_file_path\' must be set when checkpoints are written.')
         super().__init__(name='total_enumerations', 
                 output_control=output_control, 
                 problem=problem,
@@ -75,6 +93,9 @@ class TeOptimizer(Algorithm):
         self.__can_progress_method = self.__te_operations_support.can_progress
         # current solution
         self.__current_solution:Optional[Solution] = None
+        # checkpoints
+        self.__checkpoint_file_path:Optional[str] = checkpoint_file_path
+        self.__checkpoint_interval:int = checkpoint_interval
 
     def copy(self):
         """
@@ -97,7 +118,9 @@ class TeOptimizer(Algorithm):
         te_opt:'TeOptimizer' = TeOptimizer(tos,
                                     pr,
                                     st,
-                                    oc)
+                                    oc,
+                                    self.__checkpoint_file_path,
+                                    self.__checkpoint_interval)
         te_opt.__current_solution = self.__current_solution
         return te_opt
 
@@ -112,7 +135,39 @@ class TeOptimizer(Algorithm):
             construction_tuple.te_operations_support,
             construction_tuple.problem, 
             construction_tuple.solution_template,
-            construction_tuple.output_control)
+            construction_tuple.output_control,
+            construction_tuple.checkpoint_file_path,
+            construction_tuple.checkpoint_interval)
+
+    @property
+    def te_operations_support(self)->TeOperationsSupport:
+        """
+        Property getter for the placeholder for operations, specific for TE
+
+        :return: operations support of the total enumeration
+        :rtype: :class:`TeOperationsSupport`
+        """
+        return self.__te_operations_support
+
+    @property
+    def checkpoint_file_path(self)->Optional[str]:
+        """
+        Property getter for the path of the checkpoint file
+
+        :return: path of the file where checkpoints are written
+        :rtype: Optional[str]
+        """
+        return self.__checkpoint_file_path
+
+    @property
+    def checkpoint_interval(self)->int:
+        """
+        Property getter for the number of iterations between two checkpoints
+
+        :return: number of iterations between two checkpoints, `0` if checkpoints are not written
+        :rtype: int
+        """
+        return self.__checkpoint_interval
 
     @property
     def current_solution(self)->Optional[Solution]:
@@ -150,13 +205,40 @@ class TeOptimizer(Algorithm):
         self.best_solution = self.current_solution
         self.iteration = 1
 
-    def optimize(self)->Solution:
-        self.init()
-        logger.debug('Overall number of evaluations: {}'.format(
-            self.__te_operations_support.overall_number_of_evaluations(self.problem, 
-            self.current_solution, self)))
-        self.write_output_headers_if_needed()
-        self.write_output_values_if_needed("before_algorithm", "b_a")
+    def write_checkpoint(self)->None:
+        """
+        Writes state of the enumeration - state of the enumerator, the best solution and counters of evaluations 
+        and iterations - to the checkpoint file. File is written atomically: content is written to temporary 
+        file, which then replaces the checkpoint file, so the previous checkpoint is kept if writing fails.
+        """
+        if self.__checkpoint_file_path is None:
+            raise ValueError('Checkpoint file path is not set.')
+        checkpoint:dict = {
+            'te_operations_support': self.__te_operations_support.checkpoint_state(self.problem, 
+                    self.current_solution, self),
+            'best_solution': {
+                'representation': self.__te_operations_support.representation_state(
+                        self.best_solution.representation),
+                'fitness_value': self.best_solution.fitness_value,
+                'objective_value': self.best_solution.objective_value,
+                'is_feasible': self.best_solution.is_feasible
+            },
+            'evaluation': self.evaluation,
+            'iteration': self.iteration,
+            'evaluation_best_found': self.evaluation_best_found,
+            'iteration_best_found': self.iteration_best_found
+        }
+        temporary_file_path:str = self.__checkpoint_file_path + '.tmp'
+        with open(temporary_file_path, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary_file_path, self.__checkpoint_file_path)
+
+    def __enumerate(self)->Solution:
+        """
+        Main loop of the total enumeration, that visits configurations until the enumerator is at end
+        """
         while True:
             self.write_output_values_if_needed("before_iteration", "b_i")
             self.iteration += 1
@@ -167,10 +249,62 @@ class TeOptimizer(Algorithm):
             self.write_output_values_if_needed("after_iteration", "a_i")
             if not self.__can_progress_method(self.problem,self.current_solution, self):
                 break
+            if self.__checkpoint_interval > 0 and self.iteration % self.__checkpoint_interval == 0:
+                self.write_checkpoint()
+        return self.__finish()
+
+    def __finish(self)->Solution:
+        """
+        Finalization of the total enumeration, after the enumerator is at end
+        """
+        if self.__checkpoint_interval > 0:
+            self.write_checkpoint()
         self.execution_ended = datetime.now()
         self.write_output_values_if_needed("after_algorithm", "a_a")
         return self.best_solution
 
+    def optimize(self)->Solution:
+        self.init()
+        logger.debug('Overall number of evaluations: {}'.format(
+            self.__te_operations_support.overall_number_of_evaluations(self.problem, 
+            self.current_solution, self)))
+        self.write_output_headers_if_needed()
+        self.write_output_values_if_needed("before_algorithm", "b_a")
+        return self.__enumerate()
+
+    def resume(self)->Solution:
+        """
+        Continues the total enumeration from the last checkpoint written to the checkpoint file
+
+        :return: the best solution
+        :rtype: `Solution`
+        """
+        if self.__checkpoint_file_path is None:
+            raise ValueError('Checkpoint file path is not set.')
+        with open(self.__checkpoint_file_path, 'r', encoding='utf-8') as checkpoint_file:
+            checkpoint:dict = json.load(checkpoint_file)
+        super().init()
+        self.current_solution = self.solution_template.copy()
+        self.__te_operations_support.restore_state(self.problem, self.current_solution, self,
+                checkpoint['te_operations_support'])
+        self.evaluation = checkpoint['evaluation']
+        self.iteration = checkpoint['iteration']
+        best:Solution = self.solution_template.copy()
+        best.init_from(self.__te_operations_support.representation_from_state(
+                checkpoint['best_solution']['representation']), self.problem)
+        best.fitness_value = checkpoint['best_solution']['fitness_value']
+        best.objective_value = checkpoint['best_solution']['objective_value']
+        best.is_feasible = checkpoint['best_solution']['is_feasible']
+        self.best_solution = best
+        self.evaluation_best_found = checkpoint['evaluation_best_found']
+        self.iteration_best_found = checkpoint['iteration_best_found']
+        logger.debug('Enumeration resumed at iteration: {}'.format(self.iteration))
+        self.write_output_headers_if_needed()
+        self.write_output_values_if_needed("before_algorithm", "b_a")
+        if not self.__can_progress_method(self.problem, self.current_solution, self):
+            return self.__finish()
+        return self.__enumerate()
+
     def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
         group_end:str ='}')->str:
         """
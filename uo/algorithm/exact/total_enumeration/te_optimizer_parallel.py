@@ -0,0 +1,260 @@
+"""
+The :mod:`~uo.algorithm.exact.total_enumeration.te_optimizer_parallel` module describes the class
+:class:`~uo.algorithm.exact.total_enumeration.te_optimizer_parallel.TeOptimizerParallel`, that represents total
+enumeration, where the space is split into shards that are enumerated in worker processes.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import repeat
+
+from typing import Optional
+
+from dataclasses import dataclass
+
+from uo.utils.logger import logger
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+
+from uo.algorithm.output_control import OutputControl
+from uo.algorithm.exact.total_enumeration.te_operations_support import TeOperationsSupport
+from uo.algorithm.exact.total_enumeration.te_optimizer import TeOptimizer
+
+def optimize_shard(te_operations_support:TeOperationsSupport, problem:Problem,
+        solution_template:Solution)->tuple[Solution, int, int]:
+    """
+    Executes total enumeration of one shard of the space
+
+    :param `TeOperationsSupport` te_operations_support: operations support that enumerates the shard
+    :param `Problem` problem: problem that is solved
+    :param `Solution` solution_template: solution from which algorithm started
+    :return: the best solution within the shard, number of evaluations and number of iterations
+    :rtype: tuple[Solution, int, int]
+    """
+    optimizer:TeOptimizer = TeOptimizer(te_operations_support, problem, solution_template)
+    best:Solution = optimizer.optimize()
+    return (best, optimizer.evaluation, optimizer.iteration)
+
+@dataclass
+class TeOptimizerParallelConstructionParameters:
+    """
+    Instance of the class :class:`~uo.algorithm.exact.total_enumeration.te_optimizer_parallel.TeOptimizerParallelConstructionParameters`
+    represents constructor parameters for parallel total enumeration algorithm.
+    """
+    te_operations_support:TeOperationsSupport = None
+    problem:Optional[Problem] = None
+    solution_template:Optional[Solution] = None
+    output_control:Optional[OutputControl] = None
+    prefix_length:int = 0
+    worker_count:int = 1
+
+class TeOptimizerParallel(TeOptimizer):
+    """
+    This class represent total enumeration algorithm, where values at the highest positions are fixed, so the space
+    is split into shards, each shard is enumerated independently in a worker process, and the best solutions of the
+    shards are merged
+    """
+
+    def __init__(self,
+            te_operations_support:TeOperationsSupport,
+            problem:Problem,
+            solution_template:Optional[Solution],
+            output_control:Optional[OutputControl]=None,
+            prefix_length:int=0,
+            worker_count:int=1
+            )->None:
+        """
+        Create new TeOptimizerParallel instance
+
+        :param `TeOperationsSupport` te_operations_support: placeholder for operations, specific for TE
+        :param `Problem` problem: problem to be solved
+        :param `Optional[Solution]` solution_template: solution from which algorithm started
+        :param `Optional[OutputControl]` output_control: structure that controls output
+        :param int prefix_length: number of the highest positions fixed within each shard - there are
+        `2^prefix_length` shards
+        :param int worker_count: number of worker processes - if `1`, shards are enumerated within current process
+        """
+        super().__init__(te_operations_support=te_operations_support,
+                problem=problem,
+                solution_template=solution_template,
+                output_control=output_control)
+        if not isinstance(prefix_length, int):
+            raise TypeError('Parameter \'prefix_length\' must be \'int\'.')
+        if prefix_length < 0:
+            raise ValueError('Parameter \'prefix_length\' must not be negative.')
+        if not isinstance(worker_count, int):
+            raise TypeError('Parameter \'worker_count\' must be \'int\'.')
+        if worker_count <= 0:
+            raise ValueError('Parameter \'worker_count\' must be positive.')
+        self.__prefix_length:int = prefix_length
+        self.__worker_count:int = worker_count
+
+    def copy(self):
+        """
+        Internal copy of the current instance of class
+
+        :return: new instance  with the same properties
+        """
+        tos:Optional[TeOperationsSupport] = None
+        if self.te_operations_support is not None:
+            tos = self.te_operations_support.copy()
+        pr:Optional[Problem] = None
+        if self.problem is not None:
+            pr = self.problem.copy()
+        st:Optional[Solution] = None
+        if self.solution_template is not None:
+            st = self.solution_template.copy()
+        oc:Optional[OutputControl] = None
+        if self.output_control is not None:
+            oc = self.output_control.copy()
+        te_opt:'TeOptimizerParallel' = TeOptimizerParallel(tos,
+                                    pr,
+                                    st,
+                                    oc,
+                                    self.__prefix_length,
+                                    self.__worker_count)
+        if self.current_solution is not None:
+            te_opt.current_solution = self.current_solution.copy()
+        return te_opt
+
+    @classmethod
+    def from_construction_tuple(cls, construction_tuple:TeOptimizerParallelConstructionParameters):
+        """
+        Additional constructor, that creates new instance of class
+        :class:`~uo.algorithm.exact.total_enumeration.te_optimizer_parallel.TeOptimizerParallel`.
+
+        :param `TeOptimizerParallelConstructionParameters` construction_tuple: tuple with all constructor parameters
+        """
+        return cls(
+            construction_tuple.te_operations_support,
+            construction_tuple.problem,
+            construction_tuple.solution_template,
+            construction_tuple.output_control,
+            construction_tuple.prefix_length,
+            construction_tuple.worker_count)
+
+    @property
+    def prefix_length(self)->int:
+        """
+        Property getter for the number of the highest positions fixed within each shard
+
+        :return: number of the highest positions fixed within each shard
+        :rtype: int
+        """
+        return self.__prefix_length
+
+    @property
+    def worker_count(self)->int:
+        """
+        Property getter for the number of worker processes
+
+        :return: number of worker processes
+        :rtype: int
+        """
+        return self.__worker_count
+
+    def optimize(self)->Solution:
+        """
+        Splits the space into shards, enumerates shards and merges their best solutions. Shards are merged in
+        order of their prefixes, which is the order in which they are visited by the sequential enumeration,
+        so ties are resolved in the same way. The best solution of the previous execution is not taken into 
+        account.
+
+        :return: the best solution
+        :rtype: `Solution`
+        """
+        self.execution_started = datetime.now()
+        self.evaluation = 0
+        self.iteration = 0
+        shards:list[TeOperationsSupport] = self.te_operations_support.split(self.problem, self.__prefix_length)
+        logger.debug('Number of shards: {}'.format(len(shards)))
+        self.write_output_headers_if_needed()
+        self.write_output_values_if_needed("before_algorithm", "b_a")
+        if self.__worker_count == 1 or len(shards) == 1:
+            results:list[tuple[Solution, int, int]] = [optimize_shard(shard, self.problem,
+                    self.solution_template) for shard in shards]
+        else:
+            with ProcessPoolExecutor(max_workers=self.__worker_count) as executor:
+                results:list[tuple[Solution, int, int]] = list(executor.map(optimize_shard, shards,
+                        repeat(self.problem), repeat(self.solution_template)))
+        # the best solution is merged from scratch, and assigned once all shards are merged
+        merged_best:Optional[Solution] = None
+        evaluation_best_found:int = 0
+        iteration_best_found:int = 0
+        for best, evaluation, iteration in results:
+            self.evaluation += evaluation
+            self.iteration += iteration
+            if merged_best is None or best.is_better(merged_best, self.problem):
+                merged_best = best
+                evaluation_best_found = self.evaluation
+                iteration_best_found = self.iteration
+        self.best_solution = merged_best
+        self.evaluation_best_found = evaluation_best_found
+        self.iteration_best_found = iteration_best_found
+        self.current_solution = self.best_solution.copy()
+        self.execution_ended = datetime.now()
+        self.write_output_values_if_needed("after_algorithm", "a_a")
+        return self.best_solution
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{',
+        group_end:str ='}')->str:
+        """
+        String representation of the 'TeOptimizerParallel' instance
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string
+        :type group_end: str, optional, default value '}'
+        :return: string representation of instance that controls output
+        :rtype: str
+        """
+        s = super().string_rep(delimiter, indentation, indentation_symbol, group_start, group_end)
+        s += delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'prefix_length=' + str(self.__prefix_length) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'worker_count=' + str(self.__worker_count) + delimiter
+        return s
+
+    def __str__(self)->str:
+        """
+        String representation of the 'TeOptimizerParallel' instance
+
+        :return: string representation of the 'TeOptimizerParallel' instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        Representation of the 'TeOptimizerParallel' instance
+
+        :return: string representation of the 'TeOptimizerParallel' instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted 'TeOptimizerParallel' instance
+
+        :param str spec: format specification
+        :return: formatted 'TeOptimizerParallel' instance
+        :rtype: str
+        """
+        return self.string_rep('|')
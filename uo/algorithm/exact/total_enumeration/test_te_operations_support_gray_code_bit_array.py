@@ -0,0 +1,184 @@
+import os
+import tempfile
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.solution.quality_of_solution import QualityOfSolution
+
+from uo.algorithm.exact.total_enumeration.te_operations_support_gray_code_bit_array import \
+        TeOperationsSupportGrayCodeBitArray
+from uo.algorithm.exact.total_enumeration.te_optimizer import TeOptimizer
+from uo.algorithm.exact.total_enumeration.te_optimizer_parallel import TeOptimizerParallel
+
+from uo.algorithm.exact.total_enumeration.test_te_optimizer_parallel import ProblemWithDimension
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class SolutionWeightedOnesIncrementalBitArray(SolutionWeightedOnesBitArray):
+    """
+    Solution where fitness is weighted count of ones, with incremental calculation after flips
+    """
+    direct_calculations:int = 0
+
+    def copy(self)->'SolutionWeightedOnesIncrementalBitArray':
+        obj = SolutionWeightedOnesIncrementalBitArray(self.representation.copy())
+        obj.copy_from(self)
+        return obj
+
+    def calculate_quality_directly(self, representation:BitArray, problem:Problem)->QualityOfSolution:
+        SolutionWeightedOnesIncrementalBitArray.direct_calculations += 1
+        return super().calculate_quality_directly(representation, problem)
+
+    def calculate_quality_incrementally(self, representation:BitArray, problem:Problem,
+            changed_positions:list[int])->QualityOfSolution:
+        value:float = self.fitness_value
+        for i in changed_positions:
+            value += (i + 1) if representation[i] else -(i + 1)
+        return QualityOfSolution(value, None, value, None, True)
+
+class TeOperationsSupportInterruptedGrayCodeBitArray(TeOperationsSupportGrayCodeBitArray):
+    """
+    Gray code operations support that fails after the given number of progress steps, as if the process was stopped
+    """
+
+    def __init__(self, steps_before_failure:int)->None:
+        super().__init__()
+        self.steps_before_failure = steps_before_failure
+
+    def progress(self, problem, solution, optimizer)->None:
+        if self.steps_before_failure == 0:
+            raise RuntimeError('Process is stopped.')
+        self.steps_before_failure -= 1
+        super().progress(problem, solution, optimizer)
+
+class TestTeOperationsSupportGrayCodeBitArray(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemWithDimension(5)
+        SolutionWeightedOnesIncrementalBitArray.direct_calculations = 0
+
+    # each configuration is visited exactly once, and consecutive configurations differ in one bit
+    def test_enumeration_should_visit_each_configuration_once_flipping_one_bit(self):
+        # Arrange
+        support = TeOperationsSupportGrayCodeBitArray()
+        solution = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+        optimizer_stub = mocker.MagicMock()
+        optimizer_stub.evaluation = 0
+        # Act
+        support.reset(self.problem, solution, optimizer_stub)
+        visited = [solution.representation.copy()]
+        while support.can_progress(self.problem, solution, optimizer_stub):
+            support.progress(self.problem, solution, optimizer_stub)
+            visited.append(solution.representation.copy())
+        # Assert
+        self.assertEqual(sorted(v.bin for v in visited), sorted(format(i, '05b') for i in range(32)))
+        for previous, current in zip(visited, visited[1:]):
+            self.assertEqual((previous ^ current).count(1), 1)
+        self.assertEqual(optimizer_stub.evaluation, 32)
+
+    # incrementally calculated fitness is the same as directly calculated fitness
+    def test_progress_should_keep_fitness_consistent(self):
+        # Arrange
+        support = TeOperationsSupportGrayCodeBitArray()
+        solution = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+        optimizer_stub = mocker.MagicMock()
+        optimizer_stub.evaluation = 0
+        support.reset(self.problem, solution, optimizer_stub)
+        # Act
+        for _ in range(20):
+            support.progress(self.problem, solution, optimizer_stub)
+        # Assert
+        expected = sum(i + 1 for i in solution.representation.findall('0b1'))
+        self.assertEqual(solution.fitness_value, expected)
+        self.assertEqual(support.step, 20)
+
+    # optimizer with Gray code support finds the same best solution, without direct evaluation of each configuration
+    def test_te_optimizer_should_find_best_with_incremental_evaluation(self):
+        # Arrange
+        solution_template = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+        te_optimizer = TeOptimizer(TeOperationsSupportGrayCodeBitArray(), self.problem, solution_template)
+        # Act
+        best = te_optimizer.optimize()
+        # Assert
+        self.assertEqual(best.representation.bin, '11111')
+        self.assertEqual(best.fitness_value, 15)
+        self.assertLessEqual(SolutionWeightedOnesIncrementalBitArray.direct_calculations, 2)
+
+    # configuration of the step is the one reached by progress
+    def test_configuration_should_be_equal_to_configuration_reached_by_progress(self):
+        # Arrange
+        support = TeOperationsSupportGrayCodeBitArray()
+        solution = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+        optimizer_stub = mocker.MagicMock()
+        optimizer_stub.evaluation = 0
+        support.reset(self.problem, solution, optimizer_stub)
+        # Act & Assert
+        for step in range(1, 32):
+            support.progress(self.problem, solution, optimizer_stub)
+            self.assertEqual(support.configuration(self.problem, step), solution.representation)
+
+    # shards together cover the whole space, each configuration exactly once
+    def test_shards_should_cover_whole_space(self):
+        # Arrange
+        optimizer_stub = mocker.MagicMock()
+        optimizer_stub.evaluation = 0
+        visited = []
+        # Act
+        shards = TeOperationsSupportGrayCodeBitArray().split(self.problem, 2)
+        for shard in shards:
+            solution = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+            shard.reset(self.problem, solution, optimizer_stub)
+            visited.append(solution.representation.bin)
+            while shard.can_progress(self.problem, solution, optimizer_stub):
+                shard.progress(self.problem, solution, optimizer_stub)
+                visited.append(solution.representation.bin)
+        # Assert
+        self.assertEqual(len(shards), 4)
+        self.assertEqual(sorted(visited), sorted(format(i, '05b') for i in range(32)))
+
+    # parallel optimizer with Gray code shards finds the same best solution
+    def test_te_optimizer_parallel_should_find_best(self):
+        # Arrange
+        solution_template = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+        te_optimizer = TeOptimizerParallel(TeOperationsSupportGrayCodeBitArray(), self.problem, solution_template,
+                prefix_length=2)
+        # Act
+        best = te_optimizer.optimize()
+        # Assert
+        self.assertEqual(best.representation.bin, '11111')
+        self.assertEqual(best.fitness_value, 15)
+
+    # interrupted enumeration, resumed from checkpoint, ends as the uninterrupted one
+    def test_resume_should_continue_from_last_checkpoint(self):
+        # Arrange
+        solution_template = SolutionWeightedOnesIncrementalBitArray(BitArray(length=5))
+        expected = TeOptimizer(TeOperationsSupportGrayCodeBitArray(), self.problem, solution_template)
+        expected_best = expected.optimize()
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file_path = os.path.join(directory, 'te_checkpoint.json')
+            interrupted = TeOptimizer(TeOperationsSupportInterruptedGrayCodeBitArray(17), self.problem,
+                    solution_template, checkpoint_file_path=checkpoint_file_path, checkpoint_interval=5)
+            with self.assertRaises(RuntimeError):
+                interrupted.optimize()
+            resumed = TeOptimizer(TeOperationsSupportGrayCodeBitArray(), self.problem, solution_template,
+                    checkpoint_file_path=checkpoint_file_path, checkpoint_interval=5)
+            # Act
+            best = resumed.resume()
+        # Assert
+        self.assertEqual(best.representation, expected_best.representation)
+        self.assertEqual(best.fitness_value, expected_best.fitness_value)
+        self.assertEqual(resumed.evaluation, expected.evaluation)
+        self.assertEqual(resumed.iteration, expected.iteration)
+        expected_fitness = sum(i + 1 for i in resumed.current_solution.representation.findall('0b1'))
+        self.assertEqual(resumed.current_solution.fitness_value, expected_fitness)
+
+    # flipped position is the position of the lowest set bit of the step
+    def test_flipped_position(self):
+        self.assertEqual([TeOperationsSupportGrayCodeBitArray.flipped_position(s) for s in range(1, 9)],
+                [0, 1, 0, 2, 0, 1, 0, 3])
+
+if __name__ == '__main__':
+    unittest.main()
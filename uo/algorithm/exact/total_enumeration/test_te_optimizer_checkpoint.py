@@ -0,0 +1,137 @@
+import os
+import json
+import tempfile
+import unittest
+
+from bitstring import BitArray
+
+from uo.algorithm.exact.total_enumeration.te_operations_support_bit_array import TeOperationsSupportBitArray
+from uo.algorithm.exact.total_enumeration.te_optimizer import TeOptimizer, TeOptimizerConstructionParameters
+
+from uo.algorithm.exact.total_enumeration.test_te_optimizer_parallel import ProblemWithDimension, \
+        SolutionDistanceToTargetBitArray
+
+class TeOperationsSupportInterruptedBitArray(TeOperationsSupportBitArray):
+    """
+    Operations support that fails after the given number of progress steps, as if the process was stopped
+    """
+
+    def __init__(self, steps_before_failure:int)->None:
+        super().__init__()
+        self.steps_before_failure = steps_before_failure
+
+    def progress(self, problem, solution, optimizer)->None:
+        if self.steps_before_failure == 0:
+            raise RuntimeError('Process is stopped.')
+        self.steps_before_failure -= 1
+        super().progress(problem, solution, optimizer)
+
+class SolutionDistanceToTargetUintArgumentBitArray(SolutionDistanceToTargetBitArray):
+    """
+    Solution whose argument is the unsigned int value of the representation, so string representation can not
+    be converted back to representation
+    """
+
+    def copy(self)->'SolutionDistanceToTargetUintArgumentBitArray':
+        obj = SolutionDistanceToTargetUintArgumentBitArray(self.representation.copy())
+        obj.copy_from(self)
+        return obj
+
+    def argument(self, representation:BitArray)->str:
+        return str(representation.uint)
+
+class TestTeOptimizerCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_file_path = os.path.join(self.directory.name, 'te_checkpoint.json')
+        self.problem = ProblemWithDimension(7)
+        self.solution_template = SolutionDistanceToTargetBitArray(BitArray(length=7))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # checkpoints are written atomically, without temporary file left behind
+    def test_optimize_should_write_final_checkpoint(self):
+        # Arrange
+        te_optimizer = TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template,
+                checkpoint_file_path=self.checkpoint_file_path, checkpoint_interval=10)
+        # Act
+        te_optimizer.optimize()
+        # Assert
+        with open(self.checkpoint_file_path, 'r', encoding='utf-8') as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        self.assertEqual(checkpoint['evaluation'], te_optimizer.evaluation)
+        self.assertEqual(checkpoint['best_solution']['representation'], format(43, '07b'))
+        self.assertEqual(checkpoint['te_operations_support']['counters'], '1111111')
+        self.assertFalse(os.path.exists(self.checkpoint_file_path + '.tmp'))
+
+    # interrupted enumeration, resumed from checkpoint, ends as the uninterrupted one
+    def test_resume_should_continue_from_last_checkpoint(self):
+        # Arrange
+        te_optimizer = TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template)
+        expected_best = te_optimizer.optimize()
+        interrupted = TeOptimizer(TeOperationsSupportInterruptedBitArray(75), self.problem, self.solution_template,
+                checkpoint_file_path=self.checkpoint_file_path, checkpoint_interval=10)
+        with self.assertRaises(RuntimeError):
+            interrupted.optimize()
+        resumed = TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template,
+                checkpoint_file_path=self.checkpoint_file_path, checkpoint_interval=10)
+        # Act
+        best = resumed.resume()
+        # Assert
+        self.assertEqual(best.representation, expected_best.representation)
+        self.assertEqual(best.fitness_value, expected_best.fitness_value)
+        self.assertEqual(resumed.evaluation, te_optimizer.evaluation)
+        self.assertEqual(resumed.iteration, te_optimizer.iteration)
+
+    # best solution is restored from its representation, even when its argument is not a representation code
+    def test_resume_should_restore_best_representation_independent_of_argument(self):
+        # Arrange
+        solution_template = SolutionDistanceToTargetUintArgumentBitArray(BitArray(length=7))
+        te_optimizer = TeOptimizer(TeOperationsSupportBitArray(), self.problem, solution_template)
+        expected_best = te_optimizer.optimize()
+        interrupted = TeOptimizer(TeOperationsSupportInterruptedBitArray(75), self.problem, solution_template,
+                checkpoint_file_path=self.checkpoint_file_path, checkpoint_interval=10)
+        with self.assertRaises(RuntimeError):
+            interrupted.optimize()
+        resumed = TeOptimizer(TeOperationsSupportBitArray(), self.problem, solution_template,
+                checkpoint_file_path=self.checkpoint_file_path, checkpoint_interval=10)
+        # Act
+        best = resumed.resume()
+        # Assert
+        self.assertEqual(best.representation, expected_best.representation)
+        self.assertEqual(best.string_representation(), '43')
+
+    # resume of finished enumeration returns the best solution without further evaluations
+    def test_resume_of_finished_enumeration_should_not_evaluate(self):
+        # Arrange
+        te_optimizer = TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template,
+                checkpoint_file_path=self.checkpoint_file_path, checkpoint_interval=50)
+        te_optimizer.optimize()
+        resumed = te_optimizer.copy()
+        # Act
+        best = resumed.resume()
+        # Assert
+        self.assertEqual(best.representation.uint, 43)
+        self.assertEqual(resumed.evaluation, te_optimizer.evaluation)
+
+    # checkpoint interval without checkpoint file raises ValueError
+    def test_checkpoint_interval_without_file_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template,
+                    checkpoint_interval=10)
+
+    # construction tuple keeps checkpoint parameters
+    def test_from_construction_tuple_should_keep_checkpoint_parameters(self):
+        # Arrange
+        construction_tuple = TeOptimizerConstructionParameters(TeOperationsSupportBitArray(), self.problem,
+                self.solution_template, None, self.checkpoint_file_path, 10)
+        # Act
+        te_optimizer = TeOptimizer.from_construction_tuple(construction_tuple)
+        # Assert
+        self.assertEqual(te_optimizer.checkpoint_file_path, self.checkpoint_file_path)
+        self.assertEqual(te_optimizer.checkpoint_interval, 10)
+
+if __name__ == '__main__':
+    unittest.main()
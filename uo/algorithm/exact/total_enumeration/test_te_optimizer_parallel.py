@@ -0,0 +1,154 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.quality_of_solution import QualityOfSolution
+
+from uo.algorithm.exact.total_enumeration.te_operations_support_bit_array import TeOperationsSupportBitArray
+from uo.algorithm.exact.total_enumeration.te_optimizer import TeOptimizer
+from uo.algorithm.exact.total_enumeration.te_optimizer_parallel import TeOptimizerParallel, \
+        TeOptimizerParallelConstructionParameters
+
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class ProblemWithDimension(ProblemVoidMinSO):
+
+    def __init__(self, dimension:int)->None:
+        super().__init__("a problem", False)
+        self.dimension = dimension
+
+    def copy(self):
+        return ProblemWithDimension(self.dimension)
+
+class SolutionDistanceToTargetBitArray(SolutionWeightedOnesBitArray):
+    """
+    Solution where fitness is negative distance between representation, as unsigned int, and the target 43
+    """
+
+    def copy(self)->'SolutionDistanceToTargetBitArray':
+        obj = SolutionDistanceToTargetBitArray(self.representation.copy())
+        obj.copy_from(self)
+        return obj
+
+    def calculate_quality_directly(self, representation:BitArray, problem:Problem)->QualityOfSolution:
+        value:int = -abs(representation.uint - 43)
+        return QualityOfSolution(value, None, value, None, True)
+
+class TestTeOperationsSupportBitArraySplit(unittest.TestCase):
+
+    # shards together cover the whole space, each configuration exactly once
+    def test_shards_should_cover_whole_space(self):
+        # Arrange
+        problem = ProblemWithDimension(5)
+        optimizer_stub = mocker.MagicMock()
+        visited = []
+        # Act
+        shards = TeOperationsSupportBitArray().split(problem, 2)
+        for shard in shards:
+            solution = SolutionWeightedOnesBitArray(BitArray(length=5))
+            shard.reset(problem, solution, optimizer_stub)
+            visited.append(solution.representation.bin)
+            while shard.can_progress(problem, solution, optimizer_stub):
+                shard.progress(problem, solution, optimizer_stub)
+                visited.append(solution.representation.bin)
+        # Assert
+        self.assertEqual(len(shards), 4)
+        self.assertEqual(sorted(visited), sorted(format(i, '05b') for i in range(32)))
+        self.assertEqual(shards[0].overall_number_of_evaluations(problem, None, optimizer_stub), 8)
+
+    # shard can not be split again
+    def test_split_of_shard_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            TeOperationsSupportBitArray(1, 1).split(ProblemWithDimension(5), 2)
+
+    # prefix outside of range raises ValueError
+    def test_prefix_outside_of_range_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            TeOperationsSupportBitArray(2, 4)
+
+class TestTeOptimizerParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemWithDimension(7)
+        self.solution_template = SolutionDistanceToTargetBitArray(BitArray(length=7))
+
+    # sharded enumeration finds the same best solution as sequential enumeration
+    def test_optimize_should_find_same_best_as_sequential(self):
+        # Arrange
+        te_optimizer = TeOptimizer(TeOperationsSupportBitArray(), self.problem, self.solution_template)
+        te_optimizer_parallel = TeOptimizerParallel(TeOperationsSupportBitArray(), self.problem,
+                self.solution_template, prefix_length=3)
+        # Act
+        best = te_optimizer.optimize()
+        best_parallel = te_optimizer_parallel.optimize()
+        # Assert
+        self.assertEqual(best_parallel.representation, best.representation)
+        self.assertEqual(best_parallel.representation.uint, 43)
+        self.assertEqual(te_optimizer_parallel.evaluation, 8 * (16 + 1))
+
+    # enumeration in worker processes finds the best solution
+    def test_optimize_with_workers_should_find_best(self):
+        # Arrange
+        te_optimizer_parallel = TeOptimizerParallel(TeOperationsSupportBitArray(), self.problem,
+                self.solution_template, prefix_length=2, worker_count=2)
+        # Act
+        best = te_optimizer_parallel.optimize()
+        # Assert
+        self.assertEqual(best.representation.uint, 43)
+        self.assertEqual(best.fitness_value, 0)
+
+    # repeated optimization does not take the best solution of the previous execution into account
+    def test_repeated_optimize_should_not_keep_previous_best(self):
+        # Arrange
+        te_optimizer_parallel = TeOptimizerParallel(TeOperationsSupportBitArray(), self.problem,
+                self.solution_template, prefix_length=2)
+        te_optimizer_parallel.optimize()
+        evaluation_best_found = te_optimizer_parallel.evaluation_best_found
+        stale_best = self.solution_template.copy()
+        stale_best.fitness_value = 1000
+        te_optimizer_parallel.best_solution = stale_best
+        # Act
+        best = te_optimizer_parallel.optimize()
+        # Assert
+        self.assertEqual(best.representation.uint, 43)
+        self.assertEqual(best.fitness_value, 0)
+        self.assertEqual(te_optimizer_parallel.evaluation_best_found, evaluation_best_found)
+
+    # copy does not share the current solution
+    def test_copy_should_copy_current_solution(self):
+        # Arrange
+        te_optimizer_parallel = TeOptimizerParallel(TeOperationsSupportBitArray(), self.problem,
+                self.solution_template, prefix_length=2)
+        te_optimizer_parallel.optimize()
+        # Act
+        te_optimizer_copy = te_optimizer_parallel.copy()
+        # Assert
+        self.assertIsNot(te_optimizer_copy.current_solution, te_optimizer_parallel.current_solution)
+        self.assertEqual(te_optimizer_copy.current_solution.representation,
+                te_optimizer_parallel.current_solution.representation)
+
+    # non-positive worker count raises ValueError
+    def test_non_positive_worker_count_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            TeOptimizerParallel(TeOperationsSupportBitArray(), self.problem, self.solution_template,
+                    worker_count=0)
+
+    # construction tuple and copy keep prefix length and worker count
+    def test_from_construction_tuple_and_copy_should_keep_parameters(self):
+        # Arrange
+        construction_tuple = TeOptimizerParallelConstructionParameters(TeOperationsSupportBitArray(),
+                self.problem, self.solution_template, None, 3, 2)
+        # Act
+        te_optimizer_parallel = TeOptimizerParallel.from_construction_tuple(construction_tuple)
+        te_optimizer_copy = te_optimizer_parallel.copy()
+        # Assert
+        self.assertEqual(te_optimizer_copy.prefix_length, 3)
+        self.assertEqual(te_optimizer_copy.worker_count, 2)
+        self.assertIsInstance(te_optimizer_copy, TeOptimizerParallel)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,8 @@ from abc import ABCMeta, abstractmethod
 from typing import TypeVar
 from typing import Generic
 
+import numpy as np
+
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
 from uo.algorithm.metaheuristic.population_based_metaheuristic import PopulationBasedMetaheuristic
@@ -44,4 +46,18 @@ class EmAttractionSupport(Generic[R_co,A_co], metaclass=ABCMeta):
         :param `Solution[R_co,A_co]` solution2: second parent
         :param `PopulationBasedMetaheuristic` optimizer: metaheuristic optimizer that is executed
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def attraction_matrix(self, problem:Problem, distances:np.ndarray, charges:np.ndarray,
+                optimizer:PopulationBasedMetaheuristic)->np.ndarray:
+        """
+        EM attraction between all pairs of particles, computed at once
+
+        :param `Problem` problem: problem that is solved
+        :param `np.ndarray` distances: matrix of distances between particles, as returned by direction support
+        :param `np.ndarray` charges: charges of the particles
+        :param `PopulationBasedMetaheuristic` optimizer: metaheuristic optimizer that is executed
+        :return: matrix of attraction magnitudes between particles
+        :rtype: `np.ndarray`
+        """
+        raise NotImplementedError
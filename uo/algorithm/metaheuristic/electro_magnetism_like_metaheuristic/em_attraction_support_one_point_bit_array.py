@@ -20,6 +20,8 @@ import numpy as np
 
 from bitstring import BitArray
 
+from uo.utils.hamming_distance import hamming_distance
+
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
 from uo.algorithm.metaheuristic.population_based_metaheuristic import PopulationBasedMetaheuristic
@@ -58,13 +60,29 @@ class EmAttractionSupportOnePointBitArray(EmAttractionSupport[BitArray,A_co]):
         """
         
         if solution1.representation is not None and solution2.representation is not None :
-            # POGLEDAJ POSLE RADI LI OVAJ DEO UOPSTE OVAKO ILI BI TREBALO NESTO DRUGACIJE DA SE URADI
-            distance = np.sum(np.abs(solution1.representation ^ solution2.representation))
+            distance = hamming_distance(solution1.representation, solution2.representation)
             if distance == 0:
                 return 0
             force = charge1 * charge2 / (distance**2)
             return force
 
+    def attraction_matrix(self, problem:Problem, distances:np.ndarray, charges:np.ndarray,
+                optimizer:PopulationBasedMetaheuristic)->np.ndarray:
+        """
+        Executes attraction within EM for all pairs of particles at once - attraction is product of charges,
+        divided by squared distance, and it is zero between equal particles
+
+        :param `Problem` problem: problem that is solved
+        :param `np.ndarray` distances: matrix of Hamming distances between particles
+        :param `np.ndarray` charges: charges of the particles
+        :param `PopulationBasedMetaheuristic` optimizer: optimizer that is executed
+        :return: matrix of attraction magnitudes between particles
+        :rtype: `np.ndarray`
+        """
+        squared:np.ndarray = np.square(distances, dtype=np.float64)
+        products:np.ndarray = np.outer(charges, charges)
+        return np.divide(products, squared, out=np.zeros_like(products), where=squared > 0)
+
     def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
         group_end:str ='}')->str:
         """
@@ -13,6 +13,8 @@ from abc import ABCMeta, abstractmethod
 from typing import TypeVar
 from typing import Generic
 
+import numpy as np
+
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
 from uo.algorithm.metaheuristic.population_based_metaheuristic import PopulationBasedMetaheuristic
@@ -44,4 +46,17 @@ class EmDirectionSupport(Generic[R_co,A_co], metaclass=ABCMeta):
         :param `Solution[R_co,A_co]` solution2: second parent
         :param `PopulationBasedMetaheuristic` optimizer: metaheuristic optimizer that is executed
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def direction_matrix(self, problem:Problem, population:np.ndarray,
+                optimizer:PopulationBasedMetaheuristic)->np.ndarray:
+        """
+        EM direction between all pairs of particles, computed at once
+
+        :param `Problem` problem: problem that is solved
+        :param `np.ndarray` population: population matrix, one particle per row
+        :param `PopulationBasedMetaheuristic` optimizer: metaheuristic optimizer that is executed
+        :return: matrix of direction values between particles
+        :rtype: `np.ndarray`
+        """
+        raise NotImplementedError
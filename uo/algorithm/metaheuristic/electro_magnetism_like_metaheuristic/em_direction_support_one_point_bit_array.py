@@ -21,6 +21,8 @@ import numpy as np
 
 from bitstring import BitArray
 
+from uo.utils.hamming_distance import hamming_distance, hamming_distance_matrix
+
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
 from uo.algorithm.metaheuristic.population_based_metaheuristic import PopulationBasedMetaheuristic
@@ -57,21 +59,23 @@ class EmDirectionSupportOnePointBitArray(EmDirectionSupport[BitArray,A_co]):
         """
         
         if solution1.representation is not None and solution2.representation is not None :
-            # POGLEDAJ POSLE RADI LI OVAJ DEO UOPSTE OVAKO ILI BI TREBALO NESTO DRUGACIJE DA SE URADI
-            bit_list1 = [int(bit) for bit in solution1.representation.bin]
-
-            # Convert the list to a numpy array
-            numpy_array1 = np.array(bit_list1)
-
-            bit_list2 = [int(bit) for bit in solution2.representation.bin]
-
-            # Convert the list to a numpy array
-            numpy_array2 = np.array(bit_list2)
-            force_direction = np.sum(np.abs(numpy_array1 - numpy_array2))
-            return force_direction
+            return hamming_distance(solution1.representation, solution2.representation)
         else:
             return 0
 
+    def direction_matrix(self, problem:Problem, population:np.ndarray,
+                optimizer:PopulationBasedMetaheuristic)->np.ndarray:
+        """
+        Executes direction within EM for all pairs of particles at once, as matrix of Hamming distances
+
+        :param `Problem` problem: problem that is solved
+        :param `np.ndarray` population: population matrix of bits, one particle per row
+        :param `PopulationBasedMetaheuristic` optimizer: optimizer that is executed
+        :return: matrix of Hamming distances between particles
+        :rtype: `np.ndarray`
+        """
+        return hamming_distance_matrix(np.packbits(population.astype(np.uint8), axis=1))
+
     def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
         group_end:str ='}')->str:
         """
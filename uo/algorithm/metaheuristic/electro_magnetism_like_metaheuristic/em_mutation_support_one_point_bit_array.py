@@ -23,6 +23,8 @@ from random import choice, random, randint
 
 from bitstring import BitArray
 
+from uo.utils.geometric_skip import geometric_skip_positions
+
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
 from uo.algorithm.metaheuristic.population_based_metaheuristic import PopulationBasedMetaheuristic
@@ -71,9 +73,9 @@ class EmMutationSupportOnePointBitArray(EmMutationSupport[BitArray,A_co]):
         """
         if solution.representation is None:
             return
-        for i in range(len(solution.representation)):
-            if random() < self.mutation_probability:
-                solution.representation.invert(i)
+        positions:list[int] = geometric_skip_positions(len(solution.representation), self.mutation_probability)
+        if len(positions) > 0:
+            solution.representation.invert(positions)
         optimizer.write_output_values_if_needed("before_evaluation", "b_e")
         optimizer.evaluation += 1
         solution.evaluate(problem)
@@ -196,8 +196,8 @@ class EmOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
         """
         Initialization of the EM algorithm
         """
+        self.init_population_randomly(self.__current_population)
         for i in range(self.population_size):
-            self.__current_population[i].init_random(self.problem)
             self.evaluation = 1
             self.__current_population[i].evaluate(self.problem)
         print(self.__current_population)
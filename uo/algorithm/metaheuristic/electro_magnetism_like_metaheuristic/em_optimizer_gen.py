@@ -124,6 +124,8 @@ class EmOptimizerGenerational(EmOptimizer):
                                                 oc,
                                                 self.random_seed,
                                                 asc)
+        if self.representation_sampler is not None:
+            em_opt.representation_sampler = self.representation_sampler.copy()
         return em_opt
 
     @classmethod
@@ -0,0 +1,338 @@
+"""
+..  _py_em_optimizer_vectorized:
+
+The :mod:`~uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_optimizer_vectorized` contains class
+:class:`~uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_optimizer_vectorized.EmOptimizerVectorized`,
+that implements algorithm :ref:`EM<Electro_magnetism_like_metaheuristic>` over population matrix of bits, where charges,
+forces and movement are computed by array operations.
+"""
+
+from pathlib import Path
+
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+import numpy as np
+
+from bitstring import BitArray
+
+from typing import Optional
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+
+from uo.algorithm.output_control import OutputControl
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.additional_statistics_control import AdditionalStatisticsControl
+
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_attraction_support import EmAttractionSupport
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_mutation_support import EmMutationSupport
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_direction_support import EmDirectionSupport
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_optimizer import EmOptimizer
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_optimizer import EmOptimizerConstructionParameters
+
+def population_matrix(representations:list[BitArray])->np.ndarray:
+    """
+    Packs bit array representations of the particles into population matrix
+
+    :param list[BitArray] representations: representations of the particles, all of the same length
+    :return: matrix of bits, with one particle per row
+    :rtype: `np.ndarray`
+    """
+    length:int = len(representations[0])
+    packed:np.ndarray = np.frombuffer(b''.join(r.tobytes() for r in representations),
+            dtype=np.uint8).reshape(len(representations), -1)
+    return np.unpackbits(packed, axis=1)[:, :length]
+
+def representations_from_matrix(matrix:np.ndarray)->list[BitArray]:
+    """
+    Unpacks population matrix into bit array representations of the particles
+
+    :param `np.ndarray` matrix: matrix of bits, with one particle per row
+    :return: representations of the particles
+    :rtype: list[BitArray]
+    """
+    length:int = matrix.shape[1]
+    packed:np.ndarray = np.packbits(matrix, axis=1)
+    return [BitArray(bytes=row.tobytes(), length=length) for row in packed]
+
+def em_charges(fitness:np.ndarray, dimension:int)->np.ndarray:
+    """
+    Charges of the particles - the best particle has charge one, and charge decreases exponentially with the gap
+    between fitness of the particle and the best fitness
+
+    :param `np.ndarray` fitness: fitness values of the particles (greater is better)
+    :param int dimension: dimension of the particles
+    :return: charges of the particles
+    :rtype: `np.ndarray`
+    """
+    gaps:np.ndarray = fitness.max() - fitness
+    total:float = gaps.sum()
+    if total <= 0:
+        return np.ones(len(fitness))
+    return np.exp(-dimension * gaps / total)
+
+def em_forces(population:np.ndarray, fitness:np.ndarray, attraction:np.ndarray)->np.ndarray:
+    """
+    Total forces on the particles - each particle is attracted by better particles and repelled by the others
+
+    :param `np.ndarray` population: matrix of bits, with one particle per row
+    :param `np.ndarray` fitness: fitness values of the particles (greater is better)
+    :param `np.ndarray` attraction: matrix of attraction magnitudes between particles
+    :return: matrix of forces, with one particle per row
+    :rtype: `np.ndarray`
+    """
+    signs:np.ndarray = np.where(fitness[np.newaxis, :] > fitness[:, np.newaxis], 1.0, -1.0)
+    weights:np.ndarray = signs * attraction
+    np.fill_diagonal(weights, 0.0)
+    positions:np.ndarray = population.astype(np.float64)
+    # sum over j of w_ij * (x_j - x_i)
+    return weights @ positions - weights.sum(axis=1)[:, np.newaxis] * positions
+
+def em_move(population:np.ndarray, forces:np.ndarray, steps:np.ndarray, fixed_index:int)->np.ndarray:
+    """
+    Moves particles in direction of the normalized forces, and rounds new positions to bits
+
+    :param `np.ndarray` population: matrix of bits, with one particle per row
+    :param `np.ndarray` forces: matrix of forces, with one particle per row
+    :param `np.ndarray` steps: random step lengths from [0,1), one per particle
+    :param int fixed_index: index of the particle that is not moved
+    :return: new matrix of bits
+    :rtype: `np.ndarray`
+    """
+    scale:np.ndarray = np.abs(forces).max(axis=1, keepdims=True)
+    direction:np.ndarray = np.divide(forces, scale, out=np.zeros_like(forces), where=scale > 0)
+    moved:np.ndarray = (population + steps[:, np.newaxis] * direction >= 0.5).astype(np.uint8)
+    moved[fixed_index] = population[fixed_index]
+    return moved
+
+class EmOptimizerVectorized(EmOptimizer):
+    """
+    Instance of the class :class:`~uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.EmOptimizerVectorized` 
+    encapsulate :ref:`Electro_magnetism_like_metaheuristic` optimization algorithm for bit array representations, 
+    where one generation is computed by a few array operations over population matrix, instead of pairwise calls 
+    of attraction and direction supports.
+    """
+
+    def __init__(self,
+            em_attraction_support:EmAttractionSupport,
+            em_mutation_support:EmMutationSupport,
+            em_direction_support:EmDirectionSupport,
+            population_size: int,
+            finish_control:FinishControl,
+            problem:Problem,
+            solution_template:Optional[Solution],
+            output_control:OutputControl=None,
+            random_seed:Optional[int]=None,
+            additional_statistics_control:Optional[AdditionalStatisticsControl]=None
+        )->None:
+        """
+        Create new instance of class :class:`~uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.EmOptimizerVectorized`. 
+        That instance implements :ref:`EM<Electro_magnetism_like_metaheuristic>` algorithm. 
+
+        :param `EmAttractionSupport` em_attraction_support: placeholder for additional methods, specific for EM attraction 
+        execution, which depend of precise solution type 
+        :param `EmMutationSupport` em_mutation_support: placeholder for additional methods, specific for EM mutation 
+        execution, which depend of precise solution type 
+        :param `EmDirectionSupport` em_direction_support: calculates direction of a particle
+        :param `int` population_size: size of the population
+        :param `FinishControl` finish_control: structure that control finish criteria for metaheuristic execution
+        :param `Problem` problem: problem to be solved
+        :param `Optional[Solution]` solution_template: initial solution of the problem
+        :param `Optional[OutputControl]` output_control: structure that controls output
+        :param Optional[int] random_seed: random seed for metaheuristic execution
+        :param `Optional[AdditionalStatisticsControl]` additional_statistics_control: structure that controls additional
+        statistics obtained during population-based metaheuristic execution
+        """
+        super().__init__( 
+                finish_control=finish_control,
+                random_seed=random_seed,
+                additional_statistics_control=additional_statistics_control,
+                output_control=output_control,
+                problem=problem,
+                solution_template=solution_template,
+                em_attraction_support=em_attraction_support,
+                em_mutation_support=em_mutation_support,
+                em_direction_support=em_direction_support,
+                population_size=population_size
+        )
+        # generator of step lengths of the movement, seeded again from random seed within each execution
+        self.__step_generator:np.random.Generator = np.random.default_rng(self.random_seed)
+
+    def copy(self):
+        """
+        Internal copy of the current instance 
+        :return: new instance of class 
+        """
+        eas:Optional[EmAttractionSupport] = None
+        if self.em_attraction_support is not None:
+            eas = self.em_attraction_support.copy()
+        ems:Optional[EmMutationSupport] = None
+        if self.em_mutation_support is not None:
+            ems = self.em_mutation_support.copy()
+        eds:Optional[EmDirectionSupport] = None
+        if self.em_direction_support is not None:
+            eds = self.em_direction_support.copy()
+        fc:Optional[FinishControl] = None
+        if self.finish_control is not None:
+            fc = self.finish_control.copy()
+        pr:Optional[Problem] = None
+        if self.problem is not None:
+            pr = self.problem.copy()
+        st:Optional[Solution] = None
+        if self.solution_template is not None:
+            st = self.solution_template.copy()
+        oc:Optional[OutputControl] = None
+        if self.output_control is not None:
+            oc = self.output_control.copy()
+        asc:Optional[AdditionalStatisticsControl] = None
+        if self.additional_statistics_control is not None:
+            asc = self.additional_statistics_control.copy()
+        em_opt:'EmOptimizerVectorized' = EmOptimizerVectorized(eas,
+                                                ems,
+                                                eds,
+                                                self.population_size,
+                                                fc,
+                                                pr,
+                                                st,
+                                                oc,
+                                                self.random_seed,
+                                                asc)
+        if self.representation_sampler is not None:
+            em_opt.representation_sampler = self.representation_sampler.copy()
+        return em_opt
+
+    @classmethod
+    def from_construction_tuple(cls, construction_tuple:EmOptimizerConstructionParameters):
+        """
+        Additional constructor, that creates new instance of class :class:`~uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.EmOptimizerVectorized`. 
+
+        :param `EmOptimizerConstructionParameters` construction_tuple: tuple with all constructor parameters
+        """
+        return cls(
+            construction_tuple.em_attraction_support,
+            construction_tuple.em_mutation_support,
+            construction_tuple.em_direction_support,
+            construction_tuple.population_size,
+            construction_tuple.finish_control,
+            construction_tuple.problem,
+            construction_tuple.solution_template,
+            construction_tuple.output_control,
+            construction_tuple.random_seed,
+            construction_tuple.additional_statistics_control
+        )
+
+    def init(self)->None:
+        """
+        Initialization of the vectorized EM algorithm
+        """
+        super().init()
+        self.__step_generator = np.random.default_rng(self.random_seed)
+
+    def population_fitness(self)->np.ndarray:
+        """
+        Fitness values of the current population, where missing fitness is treated as the worst
+
+        :return: fitness values of the particles
+        :rtype: `np.ndarray`
+        """
+        return np.array([-np.inf if p.fitness_value is None else p.fitness_value 
+                for p in self.current_population], dtype=np.float64)
+
+    def main_loop_iteration(self)->None:
+        """
+        One iteration within main loop of the vectorized EM algorithm
+        """
+        self.iteration += 1
+        self.write_output_values_if_needed("before_step_in_iteration", "charge_calculation")
+        population:np.ndarray = population_matrix([p.representation for p in self.current_population])
+        fitness:np.ndarray = self.population_fitness()
+        charges:np.ndarray = em_charges(fitness, population.shape[1])
+        self.write_output_values_if_needed("after_step_in_iteration", "charge_calculation")
+
+        # Apply attraction and repulsion forces between all pairs of particles at once
+        self.write_output_values_if_needed("before_step_in_iteration", "attraction_repulsion")
+        distances:np.ndarray = self.em_direction_support.direction_matrix(self.problem, population, self)
+        attraction:np.ndarray = self.em_attraction_support.attraction_matrix(self.problem, distances, charges, 
+                self)
+        forces:np.ndarray = em_forces(population, fitness, attraction)
+        self.write_output_values_if_needed("after_step_in_iteration", "attraction_repulsion")
+
+        # Update positions of the particles, except the best one, based on the calculated forces
+        self.write_output_values_if_needed("before_step_in_iteration", "movement_update")
+        best_index:int = int(np.argmax(fitness))
+        moved:np.ndarray = em_move(population, forces, self.__step_generator.random(self.population_size), best_index)
+        for i, representation in enumerate(representations_from_matrix(moved)):
+            if i != best_index:
+                self.current_population[i].representation = representation
+        self.write_output_values_if_needed("after_step_in_iteration", "movement_update")
+
+        self.write_output_values_if_needed("before_step_in_iteration", "mutation")
+        for i in range(self.population_size):
+            if i != best_index:
+                self.em_mutation_support.mutation(self.problem, self.current_population[i], self)
+        self.write_output_values_if_needed("after_step_in_iteration", "mutation")
+        for individual in self.current_population:
+            if individual.is_better(self.best_solution, self.problem):
+                self.update_additional_statistics_if_required(individual)
+                self.best_solution = individual
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='',group_start:str ='{', 
+        group_end:str ='}')->str:
+        """
+        String representation of the `EmOptimizerVectorized` instance
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string 
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string
+        :type group_end: str, optional, default value '}'
+        :return: string representation of instance that controls output
+        :rtype: str
+        """
+        s = delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_start
+        s = super().string_rep(delimiter, indentation, indentation_symbol, '', '')
+        s += delimiter
+        s += group_end
+        return s
+
+    def __str__(self)->str:
+        """
+        String representation of the `EmOptimizerVectorized` instance
+
+        :return: string representation of the `EmOptimizerVectorized` instance
+        :rtype: str
+        """
+        s = self.string_rep('|')
+        return s
+
+    def __repr__(self)->str:
+        """
+        String representation of the `EmOptimizerVectorized` instance
+
+        :return: string representation of the `EmOptimizerVectorized` instance
+        :rtype: str
+        """
+        s = self.string_rep('\n')
+        return s
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the EmOptimizerVectorized instance
+
+        :param spec: str -- format specification 
+        :return: formatted `EmOptimizerVectorized` instance
+        :rtype: str
+        """
+        return self.string_rep('\n',0,'   ','{', '}')
\ No newline at end of file
@@ -0,0 +1,181 @@
+from datetime import datetime
+import unittest
+import unittest.mock as mocker
+from random import seed
+
+import numpy as np
+
+from bitstring import BitArray
+
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_optimizer_vectorized import \
+        EmOptimizerVectorized, population_matrix, representations_from_matrix, em_charges, em_forces, em_move
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_attraction_support_one_point_bit_array \
+        import EmAttractionSupportOnePointBitArray
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_direction_support_one_point_bit_array \
+        import EmDirectionSupportOnePointBitArray
+from uo.algorithm.metaheuristic.electro_magnetism_like_metaheuristic.em_mutation_support_one_point_bit_array \
+        import EmMutationSupportOnePointBitArray
+
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.representation_sampler_bit_array import RepresentationSamplerBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class TestEmVectorizedKernels(unittest.TestCase):
+
+    # packing and unpacking of population matrix preserves representations
+    def test_population_matrix_round_trip_should_preserve_representations(self):
+        # Arrange
+        representations = [BitArray(bin='1011001110'), BitArray(bin='0000000001'), BitArray(bin='1111111111')]
+        # Act
+        matrix = population_matrix(representations)
+        restored = representations_from_matrix(matrix)
+        # Assert
+        self.assertEqual(matrix.shape, (3, 10))
+        self.assertEqual(list(matrix[0]), [1, 0, 1, 1, 0, 0, 1, 1, 1, 0])
+        self.assertEqual(restored, representations)
+
+    # matrix of directions contains Hamming distances between particles
+    def test_direction_matrix_should_contain_hamming_distances(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solutions = [SolutionWeightedOnesBitArray(BitArray(bin=b)) for b in ['1011', '0001', '1110']]
+        direction_support = EmDirectionSupportOnePointBitArray()
+        optimizer_stub = mocker.MagicMock()
+        # Act
+        distances = direction_support.direction_matrix(problem, 
+                population_matrix([s.representation for s in solutions]), optimizer_stub)
+        # Assert
+        for i in range(3):
+            for j in range(3):
+                self.assertEqual(distances[i, j], 
+                        (solutions[i].representation ^ solutions[j].representation).count(1))
+
+    # matrix of attractions is the same as pairwise attraction
+    def test_attraction_matrix_should_match_pairwise_attraction(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        attraction_support = EmAttractionSupportOnePointBitArray()
+        distances = np.array([[0, 2], [2, 0]])
+        charges = np.array([1.0, 0.5])
+        # Act
+        attraction = attraction_support.attraction_matrix(problem, distances, charges, mocker.MagicMock())
+        # Assert
+        self.assertEqual(attraction[0, 0], 0)
+        self.assertAlmostEqual(attraction[0, 1], 0.125)
+        self.assertAlmostEqual(attraction[1, 0], 0.125)
+
+    # the best particle has charge one, and worse particles have smaller charge
+    def test_charges_should_decrease_with_fitness_gap(self):
+        # Act
+        charges = em_charges(np.array([3.0, 10.0, 7.0]), 4)
+        # Assert
+        self.assertEqual(charges[1], 1.0)
+        self.assertLess(charges[0], charges[2])
+        self.assertLess(charges[2], 1.0)
+
+    # particle is attracted by the better particle, and the worse particle is repelled
+    def test_forces_should_attract_to_better_particle(self):
+        # Arrange
+        population = np.array([[0, 0], [1, 1]], dtype=np.uint8)
+        fitness = np.array([1.0, 5.0])
+        attraction = np.array([[0.0, 1.0], [1.0, 0.0]])
+        # Act
+        forces = em_forces(population, fitness, attraction)
+        # Assert
+        self.assertEqual(list(forces[0]), [1.0, 1.0])
+        self.assertEqual(list(forces[1]), [1.0, 1.0])
+
+    # particles move in direction of the forces, except the fixed particle
+    def test_move_should_follow_forces_except_fixed_particle(self):
+        # Arrange
+        population = np.array([[0, 1, 0], [0, 1, 0]], dtype=np.uint8)
+        forces = np.array([[2.0, -2.0, 0.5], [2.0, -2.0, 0.5]])
+        # Act
+        moved = em_move(population, forces, np.array([0.9, 0.9]), 1)
+        # Assert
+        self.assertEqual(list(moved[0]), [1, 0, 0])
+        self.assertEqual(list(moved[1]), [0, 1, 0])
+
+class TestEmOptimizerVectorized(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemVoidMinSO("a problem", False)
+        self.em_optimizer = EmOptimizerVectorized(
+                em_attraction_support=EmAttractionSupportOnePointBitArray(),
+                em_mutation_support=EmMutationSupportOnePointBitArray(0.1),
+                em_direction_support=EmDirectionSupportOnePointBitArray(),
+                population_size=6,
+                finish_control=FinishControl(criteria='iterations', iterations_max=30),
+                problem=self.problem,
+                solution_template=SolutionWeightedOnesBitArray(BitArray(length=12)))
+
+    # one iteration mutates and evaluates all particles except the best one
+    def test_main_loop_iteration_should_evaluate_all_but_best_particle(self):
+        # Arrange
+        self.em_optimizer.execution_started = datetime.now()
+        self.em_optimizer.init()
+        evaluation = self.em_optimizer.evaluation
+        # Act
+        self.em_optimizer.main_loop_iteration()
+        # Assert
+        self.assertEqual(self.em_optimizer.evaluation, evaluation + 5)
+        for individual in self.em_optimizer.current_population:
+            self.assertEqual(individual.fitness_value, 
+                    individual.calculate_quality_directly(individual.representation, self.problem).fitness_value)
+
+    # best solution is never worse than the best particle in the population
+    def test_optimize_should_keep_best_solution(self):
+        # Act
+        best = self.em_optimizer.optimize()
+        # Assert
+        self.assertGreaterEqual(best.fitness_value, 
+                max(p.fitness_value for p in self.em_optimizer.current_population))
+        self.assertGreater(best.fitness_value, 0)
+
+    # execution with the same random seed is reproducible
+    def test_optimize_should_be_reproducible_for_same_seed(self):
+        # Arrange
+        em_optimizers = [EmOptimizerVectorized(
+                em_attraction_support=EmAttractionSupportOnePointBitArray(),
+                em_mutation_support=EmMutationSupportOnePointBitArray(0.1),
+                em_direction_support=EmDirectionSupportOnePointBitArray(),
+                population_size=6,
+                finish_control=FinishControl(criteria='iterations', iterations_max=30),
+                problem=self.problem,
+                solution_template=SolutionWeightedOnesBitArray(BitArray(length=12)),
+                random_seed=17) for _ in range(2)]
+        populations = []
+        # Act
+        for em_optimizer in em_optimizers:
+            seed(5)
+            em_optimizer.optimize()
+            populations.append([p.representation for p in em_optimizer.current_population])
+        # Assert
+        self.assertEqual(populations[0], populations[1])
+
+    # population is initialized by representation sampler, when it is set
+    def test_init_should_use_representation_sampler(self):
+        # Arrange
+        sampler = RepresentationSamplerBitArray(12, random_seed=42, low_discrepancy=True)
+        expected = sampler.copy().sample(6)
+        self.em_optimizer.representation_sampler = sampler
+        self.em_optimizer.execution_started = datetime.now()
+        # Act
+        self.em_optimizer.init()
+        # Assert
+        self.assertEqual([p.representation for p in self.em_optimizer.current_population], expected)
+        self.assertIsNot(self.em_optimizer.copy().representation_sampler, sampler)
+
+    # copy keeps supports and population size
+    def test_copy_should_keep_supports(self):
+        # Act
+        em_optimizer_copy = self.em_optimizer.copy()
+        # Assert
+        self.assertIsNot(em_optimizer_copy, self.em_optimizer)
+        self.assertEqual(em_optimizer_copy.population_size, 6)
+        self.assertEqual(em_optimizer_copy.em_mutation_support.mutation_probability, 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
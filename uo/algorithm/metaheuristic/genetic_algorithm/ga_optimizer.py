@@ -12,10 +12,16 @@ sys.path.append(directory.parent)
 sys.path.append(directory.parent.parent)
 sys.path.append(directory.parent.parent.parent)
 
+import heapq
+import math
 from random import choice
 
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
+
+import numpy as np
+
+from bitstring import BitArray
 
 from uo.utils.logger import logger
 
@@ -30,6 +36,8 @@ from uo.algorithm.metaheuristic.population_based_metaheuristic import Population
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection import GaSelection
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_crossover_support import GaCrossoverSupport
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_mutation_support import GaMutationSupport
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_population_membership import GaPopulationMembership
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_population_membership import membership_key
 
 class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
     """
@@ -48,7 +56,8 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
             solution_template:Optional[Solution],
             output_control:Optional[OutputControl],
             random_seed:Optional[int],
-            additional_statistics_control:AdditionalStatisticsControl
+            additional_statistics_control:AdditionalStatisticsControl,
+            population_membership:Optional[GaPopulationMembership]=None
         )->None:
         """
         Create new instance of class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.GaOptimizer`. 
@@ -68,6 +77,8 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
         :param Optional[int] random_seed: random seed for metaheuristic execution
         :param `Optional[AdditionalStatisticsControl]` additional_statistics_control: structure that controls additional
         statistics obtained during population-based metaheuristic execution
+        :param `Optional[GaPopulationMembership]` population_membership: structure that detects duplicate offspring
+        before their evaluation - if `None`, duplicates are not detected
         """
         if not isinstance(ga_crossover_support, GaCrossoverSupport):
                 raise TypeError('Parameter \'ga_crossover_support\' must be \'GaCrossoverSupport\'.')
@@ -83,6 +94,8 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
                 raise TypeError('Parameter \'elite_count\' must be \'int\'.')
         if elite_count < 0:
                 raise ValueError('Parameter \'elite_count\' can not be negative.')
+        if not isinstance(population_membership, GaPopulationMembership) and population_membership is not None:
+                raise TypeError('Parameter \'population_membership\' must be \'GaPopulationMembership\' or None.')
         super().__init__( 
                 finish_control=finish_control,
                 problem=problem,
@@ -96,6 +109,7 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
         self.__ga_selection:GaSelection = ga_selection 
         self.__population_size:int = population_size
         self.__elite_count:int = elite_count
+        self.__population_membership:Optional[GaPopulationMembership] = population_membership
         self.__current_population = []
         for _ in range(self.population_size):
             self.__current_population.append(self.solution_template.copy()) 
@@ -187,6 +201,27 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
         """
         return self.__ga_mutation_support
     
+    @property
+    def population_membership(self)->Optional[GaPopulationMembership]:
+        """
+        Property getter for the structure that detects duplicate offspring
+
+        :return: structure that detects duplicate offspring, or `None` if duplicates are not detected
+        :rtype: `Optional[GaPopulationMembership]`
+        """
+        return self.__population_membership
+
+    def population_fitness_values(self)->list[float]:
+        """
+        Fitness values of the individuals within current population, where individuals without fitness have
+        value `-inf`
+
+        :return: fitness values of the current population, in the same order as individuals
+        :rtype: list[float]
+        """
+        return [-math.inf if individual.fitness_value is None else individual.fitness_value
+                for individual in self.current_population]
+
     def index_of_best_in_population(self):
         pos:int = 0
         for i in range(1, self.population_size):
@@ -194,28 +229,101 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
                 pos = i
         return pos
 
+    def population_unique_count(self)->int:
+        """
+        Diversity of the current population - number of individuals with different representations
+
+        :return: number of different individuals within current population
+        :rtype: int
+        """
+        return len({membership_key(individual) for individual in self.current_population})
+
+    def population_mean_bit_entropy(self)->Optional[float]:
+        """
+        Diversity of the current population - mean (over bit positions) of the binary entropy of the bit values
+        within population. Value is `0` when all individuals are equal, and `1` when each bit is set in exactly half
+        of the population
+
+        :return: mean bitwise entropy, or `None` if representation is neither `BitArray` nor `int`
+        :rtype: Optional[float]
+        """
+        representations:list = [individual.representation for individual in self.current_population]
+        if len(representations) == 0:
+            return None
+        if all(isinstance(r, BitArray) for r in representations):
+            length:int = max(len(r) for r in representations)
+            bits:np.ndarray = np.zeros((len(representations), length), dtype=np.uint8)
+            for i, r in enumerate(representations):
+                bits[i, :len(r)] = np.unpackbits(np.frombuffer(r.tobytes(), dtype=np.uint8))[:len(r)]
+        elif all(isinstance(r, int) and r >= 0 for r in representations):
+            length:int = max(max(r.bit_length() for r in representations), 1)
+            bits:np.ndarray = np.array([[(r >> j) & 1 for j in range(length)] for r in representations],
+                    dtype=np.uint8)
+        else:
+            return None
+        p:np.ndarray = bits.mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropy:np.ndarray = -np.nan_to_num(p * np.log2(p)) - np.nan_to_num((1 - p) * np.log2(1 - p))
+        return float(entropy.mean())
+
+    def admit_offspring(self, offspring:Solution, remutate:Callable[[], None])->None:
+        """
+        Checks, before evaluation, if offspring is duplicate of some individual within population that is formed, 
+        and changes it according to the duplicate policy of the population membership structure. If population
+        membership structure is not set, nothing is done
+
+        :param Solution offspring: offspring that is checked
+        :param Callable[[], None] remutate: function that mutates offspring again
+        """
+        if self.__population_membership is None:
+            return
+        self.__population_membership.admit(offspring, remutate, lambda: offspring.init_random(self.problem))
+
+    def place_elite_in_front(self, fitness_values:Optional[list[float]]=None)->None:
+        """
+        Moves elite individuals to the first `elite_count` places within current population, ordered by fitness
+        descending. Elite individuals are selected with the heap over fitness vector, in single pass
+
+        :param Optional[list[float]] fitness_values: fitness values of the current population, if already calculated
+        """
+        if self.elite_count is None or not isinstance(self.elite_count, int) or self.elite_count <= 0:
+            return
+        if fitness_values is None:
+            fitness_values = self.population_fitness_values()
+        n:int = len(self.current_population)
+        elite_indices:list[int] = heapq.nlargest(min(self.elite_count, n), range(n), 
+                key=fitness_values.__getitem__)
+        is_elite:list[bool] = [False] * n
+        for ind in elite_indices:
+            is_elite[ind] = True
+        self.current_population[:] = [self.current_population[ind] for ind in elite_indices] + \
+                [individual for ind, individual in enumerate(self.current_population) if not is_elite[ind]]
+
+    def update_best_if_better(self, individual:Solution)->bool:
+        """
+        Updates best solution so far, if the given (already evaluated) individual is better than it
+
+        :param Solution individual: individual that is checked
+        :return: if best solution is updated
+        :rtype: bool
+        """
+        if self.best_solution is None or individual.is_better(self.best_solution, self.problem):
+            self.best_solution = individual
+            return True
+        return False
+
     def init(self)->None:
         """
         Initialization of the GA algorithm
         """
+        self.init_population_randomly(self.current_population)
         for i in range(self.population_size):
-            self.current_population[i].init_random(self.problem)
             self.evaluation = 1
             self.current_population[i].evaluate(self.problem)
-        self.best_solution = max(self.__current_population, key=lambda individual: individual.fitness_value)
-        if self.elite_count is None:
-            return
-        if not isinstance(self.elite_count, int): 
-            return
-        if self.elite_count > 0:
-            for i in range(self.elite_count):
-                sub_range:list[Solution] = self.current_population[i:self.population_size]
-                max_sub_range:Solution = max(sub_range, key=lambda individual: individual.fitness_value)
-                for j, v in enumerate(sub_range):
-                    if v == max_sub_range:
-                        temp:Solution = self.current_population[i]
-                        self.current_population[i] = self.current_population[j]
-                        self.current_population[j] = temp
+        fitness_values:list[float] = self.population_fitness_values()
+        self.best_solution = self.current_population[max(range(len(fitness_values)), 
+                key=fitness_values.__getitem__)]
+        self.place_elite_in_front(fitness_values)
 
     @abstractmethod
     def main_loop_iteration(self)->None:
@@ -266,6 +374,13 @@ class GaOptimizer(PopulationBasedMetaheuristic, metaclass=ABCMeta):
         for _ in range(0, indentation):
             s += indentation_symbol
         s += 'elite_count=' + str(self.__elite_count) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        if self.__population_membership is not None:
+            s += 'population_membership=' + self.__population_membership.string_rep(delimiter, 
+                    indentation + 1, indentation_symbol, group_start, group_end) + delimiter 
+        else:
+            s += 'population_membership=None' + delimiter
         for _ in range(0, indentation):
             s += indentation_symbol
         s += group_end
@@ -30,6 +30,7 @@ from uo.algorithm.metaheuristic.additional_statistics_control import AdditionalS
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection import GaSelection
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_crossover_support import GaCrossoverSupport
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_mutation_support import GaMutationSupport
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_population_membership import GaPopulationMembership
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer import GaOptimizer
 
 
@@ -50,6 +51,7 @@ class GaOptimizerGenerationalConstructionParameters:
         output_control: Optional[OutputControl] = None
         random_seed: Optional[int] = None
         additional_statistics_control: Optional[AdditionalStatisticsControl] = None
+        population_membership: Optional[GaPopulationMembership] = None
 
 
 
@@ -70,7 +72,8 @@ class GaOptimizerGenerational(GaOptimizer):
             solution_template:Optional[Solution],
             output_control:OutputControl=None,
             random_seed:Optional[int]=None,
-            additional_statistics_control:Optional[AdditionalStatisticsControl]=None
+            additional_statistics_control:Optional[AdditionalStatisticsControl]=None,
+            population_membership:Optional[GaPopulationMembership]=None
         )->None:
         """
         Create new instance of class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.GaOptimizerGenerational`. 
@@ -90,6 +93,8 @@ class GaOptimizerGenerational(GaOptimizer):
         :param Optional[int] random_seed: random seed for metaheuristic execution
         :param `Optional[AdditionalStatisticsControl]` additional_statistics_control: structure that controls additional
         statistics obtained during population-based metaheuristic execution
+        :param `Optional[GaPopulationMembership]` population_membership: structure that detects duplicate offspring
+        before their evaluation - if `None`, duplicates are not detected
         """
         super().__init__( 
                 finish_control=finish_control,
@@ -102,7 +107,8 @@ class GaOptimizerGenerational(GaOptimizer):
                 ga_crossover_support=ga_crossover_support,
                 ga_mutation_support=ga_mutation_support,
                 population_size=population_size,
-                elite_count=elite_count
+                elite_count=elite_count,
+                population_membership=population_membership
         )
 
     def copy(self):
@@ -136,6 +142,9 @@ class GaOptimizerGenerational(GaOptimizer):
         asc:Optional[AdditionalStatisticsControl] = None
         if self.additional_statistics_control is not None:
             asc = self.additional_statistics_control.copy()
+        pm:Optional[GaPopulationMembership] = None
+        if self.population_membership is not None:
+            pm = self.population_membership.copy()
         obj:'GaOptimizerGenerational' = GaOptimizerGenerational(gcs,
                                             gms,
                                             gs,
@@ -146,7 +155,10 @@ class GaOptimizerGenerational(GaOptimizer):
                                             st,
                                             oc,
                                             self.random_seed,
-                                            asc)
+                                            asc,
+                                            pm)
+        if self.representation_sampler is not None:
+            obj.representation_sampler = self.representation_sampler.copy()
         return obj
     
     @classmethod
@@ -167,7 +179,8 @@ class GaOptimizerGenerational(GaOptimizer):
             construction_tuple.solution_template,
             construction_tuple.output_control,
             construction_tuple.random_seed,
-            construction_tuple.additional_statistics_control
+            construction_tuple.additional_statistics_control,
+            construction_tuple.population_membership
         )
 
     def init(self)->None:
@@ -213,11 +226,14 @@ class GaOptimizerGenerational(GaOptimizer):
                             new_population[sel_ind1], new_population[sel_ind2], self)
         self.write_output_values_if_needed("after_step_in_iteration", "crossover")
         self.write_output_values_if_needed("before_step_in_iteration", "mutation")
+        if self.population_membership is not None:
+            self.population_membership.rebuild(new_population[:l_lim])
         for i in range(l_lim, len(self.current_population)):
             self.ga_mutation_support.mutation(self.problem, new_population[i], self)
+            self.update_best_if_better(new_population[i])
         self.write_output_values_if_needed("after_step_in_iteration", "mutation")
         self.current_population = new_population
-        self.best_solution = self.current_population[self.index_of_best_in_population()]
+        self.place_elite_in_front()
         self.update_additional_statistics_if_required(self.current_population)
 
     def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='',group_start:str ='{', 
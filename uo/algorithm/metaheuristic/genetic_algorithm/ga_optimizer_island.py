@@ -0,0 +1,519 @@
+"""
+..  _py_ga_optimizer_island:
+
+The :mod:`~uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island` contains class :class:`~.uo.metaheuristic.genetic_algorithm.ga_optimizer_island.GaOptimizerIsland`, that implements island model of the algorithm :ref:`GA<Genetic_Algorithm>`, where islands are executed in separate processes.
+"""
+
+from pathlib import Path
+
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+import heapq
+import math
+import queue
+import random
+import multiprocessing
+from datetime import datetime
+
+from typing import Optional
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from uo.utils.logger import logger
+
+from uo.solution.solution import Solution
+
+from uo.algorithm.output_control import OutputControl
+from uo.algorithm.algorithm import Algorithm
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer import GaOptimizer
+
+ISLAND_TOPOLOGIES:list[str] = ['ring', 'bidirectional_ring', 'fully_connected']
+
+def island_migration_targets(topology:str, island_index:int, island_count:int)->list[int]:
+    """
+    Determines islands that receive migrants from the given island
+
+    :param str topology: migration topology - one of `ring`, `bidirectional_ring` and `fully_connected`
+    :param int island_index: index of the island that sends migrants
+    :param int island_count: number of islands
+    :return: indexes of the islands that receive migrants, in ascending order
+    :rtype: list[int]
+    """
+    if topology == 'ring':
+        targets:set[int] = {(island_index + 1) % island_count}
+    elif topology == 'bidirectional_ring':
+        targets:set[int] = {(island_index - 1) % island_count, (island_index + 1) % island_count}
+    elif topology == 'fully_connected':
+        targets:set[int] = set(range(island_count))
+    else:
+        raise ValueError('Parameter \'topology\' must be one of ' + str(ISLAND_TOPOLOGIES) + '.')
+    targets.discard(island_index)
+    return sorted(targets)
+
+def pack_individual(individual:Solution)->tuple:
+    """
+    Compact form of the individual, used for transport between islands - just representation and quality, without
+    caches and other fields of the solution
+
+    :param Solution individual: individual that is packed
+    :return: representation, fitness value, fitness values, objective value, objective values and feasibility
+    :rtype: tuple
+    """
+    return (individual.representation, individual.fitness_value, individual.fitness_values,
+            individual.objective_value, individual.objective_values, individual.is_feasible)
+
+def unpack_individual(solution_template:Solution, packed:tuple)->Solution:
+    """
+    Recreates individual from its compact form
+
+    :param Solution solution_template: template of the solution that is created
+    :param tuple packed: compact form of the individual, obtained by `pack_individual`
+    :return: individual with representation and quality from the compact form
+    :rtype: Solution
+    """
+    individual:Solution = solution_template.copy()
+    individual.representation = packed[0]
+    individual.fitness_value = packed[1]
+    individual.fitness_values = packed[2]
+    individual.objective_value = packed[3]
+    individual.objective_values = packed[4]
+    individual.is_feasible = packed[5]
+    return individual
+
+@dataclass
+class GaIslandStatistics:
+    """
+    Instance of the class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island.
+    GaIslandStatistics` represents statistics of the execution of single island.
+    """
+    island_index: int = 0
+    iterations: int = 0
+    evaluations: int = 0
+    best_fitness_value: Optional[float] = None
+    best_objective_value: Optional[float] = None
+    migrants_sent: int = 0
+    migrants_received: int = 0
+    elapsed_seconds: float = 0.0
+    evaluation_best_found: int = 0
+    iteration_best_found: int = 0
+
+def _island_exchange(ga_optimizer:GaOptimizer, migrant_count:int, inbox, outboxes:list,
+        statistics:GaIslandStatistics)->None:
+    """
+    Sends the best individuals of the island to its neighbors and replaces the worst individuals of the island with
+    migrants that arrived in the meantime. Exchange is asynchronous - island never waits for migrants.
+    """
+    fitness_values:list[float] = ga_optimizer.population_fitness_values()
+    n:int = len(fitness_values)
+    emigrants:list[tuple] = [pack_individual(ga_optimizer.current_population[ind])
+            for ind in heapq.nlargest(min(migrant_count, n), range(n), key=fitness_values.__getitem__)]
+    if len(emigrants) > 0:
+        for outbox in outboxes:
+            outbox.put(emigrants)
+            statistics.migrants_sent += len(emigrants)
+    immigrants:list[tuple] = []
+    while True:
+        try:
+            immigrants.extend(inbox.get_nowait())
+        except queue.Empty:
+            break
+    if len(immigrants) == 0:
+        return
+    immigrants = heapq.nlargest(min(len(immigrants), n), immigrants,
+            key=lambda packed: -math.inf if packed[1] is None else packed[1])
+    for ind, packed in zip(heapq.nsmallest(len(immigrants), range(n), key=fitness_values.__getitem__),
+            immigrants):
+        individual:Solution = unpack_individual(ga_optimizer.solution_template, packed)
+        ga_optimizer.current_population[ind] = individual
+        ga_optimizer.update_best_if_better(individual)
+        statistics.migrants_received += 1
+    ga_optimizer.place_elite_in_front()
+
+def _island_execute(island_index:int, ga_optimizer:GaOptimizer, island_seed:int, migration_interval:int,
+        migrant_count:int, inbox, outboxes:list, result_queue)->None:
+    """
+    Execution of the single island, within its own process
+    """
+    for outbox in outboxes:
+        # migrants that are not consumed by already finished island should not block the exit
+        outbox.cancel_join_thread()
+    random.seed(island_seed)
+    np.random.seed(island_seed % 2**32)
+    statistics:GaIslandStatistics = GaIslandStatistics(island_index=island_index)
+    ga_optimizer.execution_started = datetime.now()
+    ga_optimizer.init()
+    while not ga_optimizer.should_finish():
+        ga_optimizer.main_loop_iteration()
+        if ga_optimizer.iteration % migration_interval == 0:
+            _island_exchange(ga_optimizer, migrant_count, inbox, outboxes, statistics)
+    ga_optimizer.execution_ended = datetime.now()
+    statistics.iterations = ga_optimizer.iteration
+    statistics.evaluations = ga_optimizer.evaluation
+    statistics.best_fitness_value = ga_optimizer.best_solution.fitness_value
+    statistics.best_objective_value = ga_optimizer.best_solution.objective_value
+    statistics.evaluation_best_found = ga_optimizer.evaluation_best_found
+    statistics.iteration_best_found = ga_optimizer.iteration_best_found
+    statistics.elapsed_seconds = ga_optimizer.elapsed_seconds()
+    result_queue.put((island_index, pack_individual(ga_optimizer.best_solution), statistics))
+
+@dataclass
+class GaOptimizerIslandConstructionParameters:
+        """
+        Instance of the class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island.
+        GaOptimizerIslandConstructionParameters` represents constructor parameters for island model of GA algorithm.
+        """
+        ga_optimizer: GaOptimizer = None
+        island_count: int = 4
+        migration_interval: int = 10
+        migrant_count: int = 1
+        topology: str = 'ring'
+        output_control: Optional[OutputControl] = None
+        random_seed: Optional[int] = None
+
+class GaOptimizerIsland(Algorithm):
+    """
+    Instance of the class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.GaOptimizerIsland` encapsulate
+    island model of the :ref:`Genetic_Algorithm` optimization algorithm. Each island is a copy of the given GA
+    optimizer, executed within separate process, and islands periodically exchange their best individuals.
+    """
+
+    def __init__(self,
+            ga_optimizer:GaOptimizer,
+            island_count:int=4,
+            migration_interval:int=10,
+            migrant_count:int=1,
+            topology:str='ring',
+            output_control:Optional[OutputControl]=None,
+            random_seed:Optional[int]=None
+        )->None:
+        """
+        Create new instance of class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.GaOptimizerIsland`.
+
+        :param `GaOptimizer` ga_optimizer: GA optimizer that is copied into each island - it also determines finish
+        criteria for each island
+        :param int island_count: number of islands
+        :param int migration_interval: number of generations between two migrations
+        :param int migrant_count: number of the best individuals that island sends to each of its neighbors
+        :param str topology: migration topology - one of `ring`, `bidirectional_ring` and `fully_connected`
+        :param `Optional[OutputControl]` output_control: structure that controls output
+        :param Optional[int] random_seed: random seed from which seeds of the islands are derived
+        """
+        if not isinstance(ga_optimizer, GaOptimizer):
+                raise TypeError('Parameter \'ga_optimizer\' must be \'GaOptimizer\'.')
+        if not isinstance(island_count, int):
+                raise TypeError('Parameter \'island_count\' must be \'int\'.')
+        if island_count <= 0:
+                raise ValueError('Parameter \'island_count\' must be positive.')
+        if not isinstance(migration_interval, int):
+                raise TypeError('Parameter \'migration_interval\' must be \'int\'.')
+        if migration_interval <= 0:
+                raise ValueError('Parameter \'migration_interval\' must be positive.')
+        if not isinstance(migrant_count, int):
+                raise TypeError('Parameter \'migrant_count\' must be \'int\'.')
+        if migrant_count < 0:
+                raise ValueError('Parameter \'migrant_count\' can not be negative.')
+        if not isinstance(topology, str):
+                raise TypeError('Parameter \'topology\' must be \'str\'.')
+        if topology not in ISLAND_TOPOLOGIES:
+                raise ValueError('Parameter \'topology\' must be one of ' + str(ISLAND_TOPOLOGIES) + '.')
+        if not isinstance(random_seed, int) and random_seed is not None:
+                raise TypeError('Parameter \'random_seed\' must be \'int\' or \'None\'.')
+        super().__init__(problem=ga_optimizer.problem,
+                solution_template=ga_optimizer.solution_template,
+                name='ga_island',
+                output_control=output_control)
+        self.__ga_optimizer:GaOptimizer = ga_optimizer
+        self.__island_count:int = island_count
+        self.__migration_interval:int = migration_interval
+        self.__migrant_count:int = migrant_count
+        self.__topology:str = topology
+        if random_seed is not None:
+            self.__random_seed:int = random_seed
+        else:
+            self.__random_seed:int = ga_optimizer.random_seed
+        self.__islands:list[GaOptimizer] = []
+        self.__island_seeds:list[int] = []
+        self.__island_statistics:list[GaIslandStatistics] = []
+
+    def copy(self):
+        """
+        Copy the `GaOptimizerIsland` instance
+
+        :return: new `GaOptimizerIsland` instance with the same properties
+        :rtype: `GaOptimizerIsland`
+        """
+        oc:Optional[OutputControl] = None
+        if self.output_control is not None:
+            oc = self.output_control.copy()
+        obj:'GaOptimizerIsland' = GaOptimizerIsland(self.__ga_optimizer.copy(),
+                                            self.island_count,
+                                            self.migration_interval,
+                                            self.migrant_count,
+                                            self.topology,
+                                            oc,
+                                            self.random_seed)
+        return obj
+
+    @classmethod
+    def from_construction_tuple(cls, construction_tuple:GaOptimizerIslandConstructionParameters):
+        """
+        Additional constructor, that creates new instance of class :class:`~uo.algorithm.metaheuristic.genetic_algorithm.GaOptimizerIsland`.
+
+        :param `GaOptimizerIslandConstructionParameters` construction_tuple: tuple with all constructor parameters
+        """
+        return cls(
+            construction_tuple.ga_optimizer,
+            construction_tuple.island_count,
+            construction_tuple.migration_interval,
+            construction_tuple.migrant_count,
+            construction_tuple.topology,
+            construction_tuple.output_control,
+            construction_tuple.random_seed
+        )
+
+    @property
+    def ga_optimizer(self)->GaOptimizer:
+        """
+        Property getter for the GA optimizer that is copied into each island
+
+        :return: GA optimizer that is copied into each island
+        :rtype: `GaOptimizer`
+        """
+        return self.__ga_optimizer
+
+    @property
+    def island_count(self)->int:
+        """
+        Property getter for the number of islands
+
+        :return: number of islands
+        :rtype: int
+        """
+        return self.__island_count
+
+    @property
+    def migration_interval(self)->int:
+        """
+        Property getter for the number of generations between two migrations
+
+        :return: number of generations between two migrations
+        :rtype: int
+        """
+        return self.__migration_interval
+
+    @property
+    def migrant_count(self)->int:
+        """
+        Property getter for the number of individuals that island sends to each of its neighbors
+
+        :return: number of migrants
+        :rtype: int
+        """
+        return self.__migrant_count
+
+    @property
+    def topology(self)->str:
+        """
+        Property getter for the migration topology
+
+        :return: migration topology
+        :rtype: str
+        """
+        return self.__topology
+
+    @property
+    def random_seed(self)->int:
+        """
+        Property getter for the random seed from which seeds of the islands are derived
+
+        :return: random seed
+        :rtype: int
+        """
+        return self.__random_seed
+
+    @property
+    def islands(self)->list[GaOptimizer]:
+        """
+        Property getter for the islands
+
+        :return: GA optimizers that are executed within islands
+        :rtype: list[GaOptimizer]
+        """
+        return self.__islands
+
+    @property
+    def island_seeds(self)->list[int]:
+        """
+        Property getter for the random seeds of the islands
+
+        :return: random seeds of the islands
+        :rtype: list[int]
+        """
+        return self.__island_seeds
+
+    @property
+    def island_statistics(self)->list[GaIslandStatistics]:
+        """
+        Property getter for the statistics of the islands, available after optimization
+
+        :return: statistics of the islands, ordered by island index
+        :rtype: list[GaIslandStatistics]
+        """
+        return self.__island_statistics
+
+    def init(self)->None:
+        """
+        Initialization of the island model - creates islands and their random seeds
+        """
+        self.__islands = []
+        for _ in range(self.island_count):
+            island:GaOptimizer = self.__ga_optimizer.copy()
+            island.output_control = None
+            self.__islands.append(island)
+        self.__island_seeds = [int(child.generate_state(1, dtype=np.uint64)[0])
+                for child in np.random.SeedSequence(self.random_seed).spawn(self.island_count)]
+        self.__island_statistics = []
+        self.evaluation = 0
+        self.iteration = 0
+
+    def optimize(self)->Solution:
+        """
+        Executing optimization by the island model of GA - islands are executed in parallel processes, and results
+        of the islands are combined after all of them finish - the best solution of the previous execution, if any,
+        is not taken into account. As islands are executed concurrently, evaluation and iteration when the best
+        solution is found are the ones reported by the island that found it
+        """
+        self.execution_started = datetime.now()
+        self.init()
+        self.write_output_headers_if_needed()
+        self.write_output_values_if_needed("before_algorithm", "b_a")
+        context = multiprocessing.get_context()
+        inboxes:list = [context.Queue() for _ in range(self.island_count)]
+        result_queue = context.Queue()
+        processes:list = []
+        for i in range(self.island_count):
+            outboxes:list = [inboxes[j] for j in island_migration_targets(self.topology, i, self.island_count)]
+            processes.append(context.Process(target=_island_execute,
+                    args=(i, self.__islands[i], self.__island_seeds[i], self.migration_interval,
+                            self.migrant_count, inboxes[i], outboxes, result_queue)))
+        for process in processes:
+            process.start()
+        results:list[tuple] = []
+        try:
+            while len(results) < self.island_count:
+                try:
+                    results.append(result_queue.get(timeout=0.1))
+                except queue.Empty:
+                    if any(process.exitcode not in (None, 0) for process in processes):
+                        raise RuntimeError('Execution of some island failed.')
+        finally:
+            for process in processes:
+                if len(results) < self.island_count and process.is_alive():
+                    process.terminate()
+                process.join()
+        results.sort(key=lambda result: result[0])
+        self.__island_statistics = [result[2] for result in results]
+        self.evaluation = sum(statistics.evaluations for statistics in self.__island_statistics)
+        self.iteration = max(statistics.iterations for statistics in self.__island_statistics)
+        merged_best:Optional[Solution] = None
+        evaluation_best_found:int = 0
+        iteration_best_found:int = 0
+        for _, packed, statistics in results:
+            individual:Solution = unpack_individual(self.solution_template, packed)
+            if merged_best is None or individual.is_better(merged_best, self.problem):
+                merged_best = individual
+                evaluation_best_found = statistics.evaluation_best_found
+                iteration_best_found = statistics.iteration_best_found
+        self.best_solution = merged_best
+        self.evaluation_best_found = evaluation_best_found
+        self.iteration_best_found = iteration_best_found
+        logger.debug('Islands: ' + str(self.island_count)
+                + ', Evaluations: ' + str(self.evaluation)
+                + ', Best solution fitness: ' + str(self.best_solution.fitness_value))
+        self.execution_ended = datetime.now()
+        self.write_output_values_if_needed("after_algorithm", "a_a")
+        return self.best_solution
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='',group_start:str ='{',
+        group_end:str ='}')->str:
+        """
+        String representation of the `GaOptimizerIsland` instance
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string
+        :type group_end: str, optional, default value '}'
+        :return: string representation of instance that controls output
+        :rtype: str
+        """
+        s = delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_start
+        s = super().string_rep(delimiter, indentation, indentation_symbol, '', '')
+        s += delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'island_count=' + str(self.island_count) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'migration_interval=' + str(self.migration_interval) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'migrant_count=' + str(self.migrant_count) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'topology=' + str(self.topology) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'random_seed=' + str(self.random_seed) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'ga_optimizer=' + self.__ga_optimizer.string_rep(delimiter, indentation + 1, indentation_symbol,
+                group_start, group_end) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_end
+        return s
+
+    def __str__(self)->str:
+        """
+        String representation of the `GaOptimizerIsland` instance
+
+        :return: string representation of the `GaOptimizerIsland` instance
+        :rtype: str
+        """
+        s = self.string_rep('|')
+        return s
+
+    def __repr__(self)->str:
+        """
+        String representation of the `GaOptimizerIsland` instance
+
+        :return: string representation of the `GaOptimizerIsland` instance
+        :rtype: str
+        """
+        s = self.string_rep('\n')
+        return s
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the GaOptimizerIsland instance
+
+        :param spec: str -- format specification
+        :return: formatted `GaOptimizerIsland` instance
+        :rtype: str
+        """
+        return self.string_rep('\n',0,'   ','{', '}')
@@ -0,0 +1,237 @@
+"""
+..  _py_ga_population_membership:
+
+The :mod:`~uo.algorithm.metaheuristic.genetic_algorithm.ga_population_membership` contains class :class:`~.uo.metaheuristic.genetic_algorithm.ga_population_membership.GaPopulationMembership`, that detects duplicate individuals within GA population.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from collections import Counter
+from typing import Callable, Hashable
+
+from bitstring import BitArray
+
+from uo.solution.solution import Solution
+
+DUPLICATE_POLICIES:list[str] = ['remutate', 'reject']
+
+def membership_key(individual:Solution)->Hashable:
+    """
+    Hashable key of the individual, that is equal for individuals with equal representations
+
+    :param Solution individual: individual
+    :return: key of the individual
+    :rtype: Hashable
+    """
+    representation = individual.representation
+    if isinstance(representation, BitArray):
+        return (len(representation), representation.tobytes())
+    if getattr(representation, '__hash__', None) is not None:
+        return representation
+    return str(representation)
+
+class GaPopulationMembership:
+    """
+    Hash-indexed multiset of the individuals within population, used for detection of duplicate offspring before
+    their evaluation. Duplicate offspring is either mutated again (policy `remutate`) or replaced with random
+    individual (policy `reject`), until it is unique or maximal number of attempts is reached.
+    """
+
+    def __init__(self, duplicate_policy:str='remutate', max_attempts:int=10)->None:
+        """
+        Create new `GaPopulationMembership` instance
+
+        :param str duplicate_policy: what to do with duplicate offspring - one of `remutate` and `reject`
+        :param int max_attempts: maximal number of attempts to make duplicate offspring unique
+        """
+        if not isinstance(duplicate_policy, str):
+            raise TypeError('Parameter \'duplicate_policy\' must be \'str\'.')
+        if duplicate_policy not in DUPLICATE_POLICIES:
+            raise ValueError('Parameter \'duplicate_policy\' must be one of ' + str(DUPLICATE_POLICIES) + '.')
+        if not isinstance(max_attempts, int):
+            raise TypeError('Parameter \'max_attempts\' must be \'int\'.')
+        if max_attempts < 0:
+            raise ValueError('Parameter \'max_attempts\' can not be negative.')
+        self.__duplicate_policy:str = duplicate_policy
+        self.__max_attempts:int = max_attempts
+        self.__counts:Counter = Counter()
+        self.__duplicates_detected:int = 0
+
+    def copy(self):
+        """
+        Copy the `GaPopulationMembership` instance, without its content
+
+        :return: new `GaPopulationMembership` instance with the same properties
+        :rtype: `GaPopulationMembership`
+        """
+        obj:'GaPopulationMembership' = GaPopulationMembership(self.duplicate_policy, self.max_attempts)
+        return obj
+
+    @property
+    def duplicate_policy(self)->str:
+        """
+        Property getter for the policy applied to duplicate offspring
+
+        :return: policy applied to duplicate offspring
+        :rtype: str
+        """
+        return self.__duplicate_policy
+
+    @property
+    def max_attempts(self)->int:
+        """
+        Property getter for the maximal number of attempts to make duplicate offspring unique
+
+        :return: maximal number of attempts
+        :rtype: int
+        """
+        return self.__max_attempts
+
+    @property
+    def duplicates_detected(self)->int:
+        """
+        Property getter for the number of detected duplicate offspring
+
+        :return: number of detected duplicate offspring
+        :rtype: int
+        """
+        return self.__duplicates_detected
+
+    @property
+    def unique_count(self)->int:
+        """
+        Property getter for the number of different individuals within structure
+
+        :return: number of different individuals
+        :rtype: int
+        """
+        return len(self.__counts)
+
+    def rebuild(self, individuals:list[Solution])->None:
+        """
+        Fills structure with the given individuals, removing previous content
+
+        :param list[Solution] individuals: individuals that are members of the population
+        """
+        self.__counts = Counter(membership_key(individual) for individual in individuals)
+
+    def add(self, individual:Solution)->None:
+        """
+        Adds individual to the structure
+
+        :param Solution individual: individual that is added
+        """
+        self.__counts[membership_key(individual)] += 1
+
+    def remove(self, individual:Solution)->None:
+        """
+        Removes one occurrence of the individual from the structure
+
+        :param Solution individual: individual that is removed
+        """
+        key:Hashable = membership_key(individual)
+        if self.__counts[key] <= 1:
+            del self.__counts[key]
+        else:
+            self.__counts[key] -= 1
+
+    def contains(self, individual:Solution)->bool:
+        """
+        Checks if individual with the same representation is within structure
+
+        :param Solution individual: individual that is checked
+        :return: if individual with the same representation is within structure
+        :rtype: bool
+        """
+        return membership_key(individual) in self.__counts
+
+    def admit(self, offspring:Solution, remutate:Callable[[], None], reinit:Callable[[], None])->int:
+        """
+        Admits offspring into the structure. While offspring is duplicate, it is changed according to the duplicate
+        policy, at most `max_attempts` times
+
+        :param Solution offspring: offspring that is admitted, before its evaluation
+        :param Callable[[], None] remutate: function that mutates offspring again
+        :param Callable[[], None] reinit: function that replaces offspring representation with random one
+        :return: number of changes of the offspring
+        :rtype: int
+        """
+        attempts:int = 0
+        while attempts < self.max_attempts and self.contains(offspring):
+            self.__duplicates_detected += 1
+            if self.duplicate_policy == 'remutate':
+                remutate()
+            else:
+                reinit()
+            attempts += 1
+        self.add(offspring)
+        return attempts
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{',
+        group_end:str ='}')->str:
+        """
+        String representation of the `GaPopulationMembership` instance
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string
+        :type group_end: str, optional, default value '}'
+        :return: string representation of instance
+        :rtype: str
+        """
+        s = delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_start + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'duplicate_policy=' + str(self.duplicate_policy) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'max_attempts=' + str(self.max_attempts) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'duplicates_detected=' + str(self.duplicates_detected) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_end
+        return s
+
+    def __str__(self)->str:
+        """
+        String representation of the `GaPopulationMembership` instance
+
+        :return: string representation of the `GaPopulationMembership` instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        String representation of the `GaPopulationMembership` instance
+
+        :return: string representation of the `GaPopulationMembership` instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the `GaPopulationMembership` instance
+
+        :param spec: str -- format specification
+        :return: formatted `GaPopulationMembership` instance
+        :rtype: str
+        """
+        return self.string_rep('\n',0,'   ','{', '}')
@@ -6,28 +6,54 @@ sys.path.append(directory.parent)
 sys.path.append(directory.parent.parent)
 sys.path.append(directory.parent.parent.parent)
 
+import math
 from abc import ABCMeta, abstractmethod
 from typing import Optional, TypeVar, Generic
 from typing import Generic
 
-from random import randint
+from bisect import bisect_right
+from itertools import accumulate
+from random import random
 
 from uo.solution.solution import Solution
 
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer import GaOptimizer
 from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection import GaSelection
 
+def fitness_proportional_weights(fitness_values:list[float])->list[float]:
+    """
+    Calculates non-negative selection weights proportional to fitness values.
+    If some fitness is negative, all fitness values are shifted so the worst one has weight zero.
+    Individuals with infinite negative fitness obtain weight zero.
+    If all weights are zero, all individuals obtain the same weight.
+
+    :param list[float] fitness_values: fitness values of the individuals
+    :return: selection weights, in the same order as fitness values
+    :rtype: list[float]
+    """
+    finite:list[float] = [f for f in fitness_values if math.isfinite(f)]
+    if len(finite) == 0:
+        return [1.0] * len(fitness_values)
+    shift:float = min(finite)
+    if shift > 0:
+        shift = 0
+    weights:list[float] = [f - shift if math.isfinite(f) else 0.0 for f in fitness_values]
+    if sum(weights) <= 0:
+        return [1.0] * len(fitness_values)
+    return weights
+
 class GaSelectionRoulette(GaSelection):
-    
+
     def copy(self):
         obj = GaSelectionRoulette()
         return obj
-    
+
     def selection(self, optimizer:GaOptimizer)->None:
         """
-        GA selection
+        GA roulette (fitness-proportional) selection. Cumulative weights are calculated once per selection, so each
+        individual is selected with binary search
 
-        :return: 
+        :return:
         :rtype: None
         """
         pop:Optional[list[Solution]] = optimizer.current_population
@@ -41,9 +67,11 @@ class GaSelectionRoulette(GaSelection):
             l_lim:int = 0
         else:
             l_lim:int = n_e
+        cumulative:list[float] = list(accumulate(fitness_proportional_weights(optimizer.population_fitness_values())))
+        total:float = cumulative[-1]
         temp:list[Solution] = []
         for _ in range(l_lim,n):
-            ind:int = randint(0, n-1)
+            ind:int = min(bisect_right(cumulative, random() * total), n-1)
             temp.append(pop[ind])
         for i in range(l_lim,n):
             pop[i] = temp[i-l_lim]
@@ -0,0 +1,59 @@
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from typing import Optional
+
+from itertools import accumulate
+from random import random
+
+from uo.solution.solution import Solution
+
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer import GaOptimizer
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection import GaSelection
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection_roulette import fitness_proportional_weights
+
+class GaSelectionStochasticUniversal(GaSelection):
+
+    def copy(self):
+        obj = GaSelectionStochasticUniversal()
+        return obj
+
+    def selection(self, optimizer:GaOptimizer)->None:
+        """
+        GA stochastic universal sampling. Individuals are selected with equally spaced pointers over cumulative
+        fitness-proportional weights, with single random offset, so whole selection is done in one pass
+
+        :return:
+        :rtype: None
+        """
+        pop:Optional[list[Solution]] = optimizer.current_population
+        if pop is None:
+            raise AttributeError("Population should exist!")
+        n:int = len(pop)
+        if n<=0:
+            raise AttributeError("Population should contain at least one individual")
+        n_e:Optional[int] = optimizer.elite_count
+        if n_e is None:
+            l_lim:int = 0
+        else:
+            l_lim:int = n_e
+        m:int = n - l_lim
+        if m <= 0:
+            return
+        cumulative:list[float] = list(accumulate(fitness_proportional_weights(optimizer.population_fitness_values())))
+        step:float = cumulative[-1] / m
+        pointer:float = random() * step
+        temp:list[Solution] = []
+        ind:int = 0
+        for _ in range(m):
+            while ind < n-1 and cumulative[ind] <= pointer:
+                ind += 1
+            temp.append(pop[ind])
+            pointer += step
+        for i in range(l_lim,n):
+            pop[i] = temp[i-l_lim]
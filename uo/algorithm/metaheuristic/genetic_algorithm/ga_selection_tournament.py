@@ -0,0 +1,77 @@
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from random import choices
+
+from typing import Optional
+
+import numpy as np
+
+from uo.solution.solution import Solution
+
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer import GaOptimizer
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection import GaSelection
+
+class GaSelectionTournament(GaSelection):
+
+    def __init__(self, tournament_size:int=2)->None:
+        """
+        Create new `GaSelectionTournament` instance
+
+        :param int tournament_size: number of individuals that compete within each tournament
+        """
+        if not isinstance(tournament_size, int):
+            raise TypeError('Parameter \'tournament_size\' must be \'int\'.')
+        if tournament_size <= 0:
+            raise ValueError('Parameter \'tournament_size\' must be positive.')
+        self.__tournament_size:int = tournament_size
+
+    def copy(self):
+        obj = GaSelectionTournament(self.tournament_size)
+        return obj
+
+    @property
+    def tournament_size(self)->int:
+        """
+        Property getter for the tournament size
+
+        :return: number of individuals that compete within each tournament
+        :rtype: int
+        """
+        return self.__tournament_size
+
+    def selection(self, optimizer:GaOptimizer)->None:
+        """
+        GA k-tournament selection. Participants of all tournaments are drawn at once and winners are determined
+        over the fitness vector of the whole population
+
+        :return:
+        :rtype: None
+        """
+        pop:Optional[list[Solution]] = optimizer.current_population
+        if pop is None:
+            raise AttributeError("Population should exist!")
+        n:int = len(pop)
+        if n<=0:
+            raise AttributeError("Population should contain at least one individual")
+        n_e:Optional[int] = optimizer.elite_count
+        if n_e is None:
+            l_lim:int = 0
+        else:
+            l_lim:int = n_e
+        m:int = n - l_lim
+        if m <= 0:
+            return
+        fitness:np.ndarray = np.array(optimizer.population_fitness_values(), dtype=float)
+        # participants are drawn by module `random`, as in the other selections, so seeded runs are reproducible
+        participants:np.ndarray = np.array(choices(range(n), k=m * self.tournament_size),
+                dtype=np.int64).reshape(m, self.tournament_size)
+        winners:np.ndarray = participants[np.arange(m), np.argmax(fitness[participants], axis=1)]
+        temp:list[Solution] = [pop[ind] for ind in winners]
+        for i in range(l_lim,n):
+            pop[i] = temp[i-l_lim]
@@ -1,6 +1,8 @@
 from datetime import datetime
 import unittest
 import unittest.mock as mocker
+
+from bitstring import BitArray
 from uo.algorithm.metaheuristic.additional_statistics_control import AdditionalStatisticsControl
 
 from uo.algorithm.output_control import OutputControl
@@ -321,3 +323,113 @@ class TestGaOptimizerGenerational(unittest.TestCase):
                                 solution_template=solution_template,
                                 random_seed=random_seed)
 
+
+class TestGaOptimizerElite(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemVoidMinSO("a problem", True)
+        selection_stub = mocker.MagicMock(spec=GaSelection)
+        type(selection_stub).selection = mocker.CallableMixin(spec=lambda x: x)
+        ga_crossover_support_stub = mocker.MagicMock(spec=GaCrossoverSupport)
+        type(ga_crossover_support_stub).crossover = mocker.CallableMixin(spec=lambda x: x)
+        ga_mutation_support_stub = mocker.MagicMock(spec=GaMutationSupport)
+        type(ga_mutation_support_stub).mutation = mocker.CallableMixin(spec=lambda x: x)
+        self.ga_optimizer = GaOptimizerGenerational(ga_crossover_support=ga_crossover_support_stub, 
+                                ga_mutation_support=ga_mutation_support_stub, 
+                                ga_selection=selection_stub, 
+                                population_size=6, 
+                                elite_count=2,
+                                finish_control=FinishControl(), 
+                                problem=self.problem, 
+                                solution_template=SolutionVoidInt( 43, 43, 43, True),
+                                random_seed=None)
+        self.ga_optimizer.execution_started = datetime.now()
+
+    # elite individuals are moved to the front, ordered by fitness, while the others keep relative order
+    def test_place_elite_in_front_should_move_best_individuals_to_front(self):
+        # Arrange
+        population = [SolutionVoidInt(43, f, f, True) for f in [3.0, 1.0, 9.0, 4.0, 7.0, 2.0]]
+        self.ga_optimizer.current_population = list(population)
+        # Act
+        self.ga_optimizer.place_elite_in_front()
+        # Assert
+        self.assertEqual([ind.fitness_value for ind in self.ga_optimizer.current_population], 
+                [9.0, 7.0, 3.0, 1.0, 4.0, 2.0])
+        self.assertIs(self.ga_optimizer.current_population[0], population[2])
+
+    # without elitism, population is not changed
+    def test_place_elite_in_front_should_not_change_population_without_elite(self):
+        # Arrange
+        population = [SolutionVoidInt(43, f, f, True) for f in [3.0, 1.0, 9.0]]
+        self.ga_optimizer.current_population = list(population)
+        self.ga_optimizer.elite_count = 0
+        # Act
+        self.ga_optimizer.place_elite_in_front()
+        # Assert
+        self.assertEqual(self.ga_optimizer.current_population, population)
+
+    # best solution is updated only by better individual
+    def test_update_best_if_better_should_update_only_with_better_individual(self):
+        # Arrange
+        self.ga_optimizer.best_solution = SolutionVoidInt(43, 5.0, 5.0, True)
+        # Act
+        worse_updated = self.ga_optimizer.update_best_if_better(SolutionVoidInt(43, 4.0, 4.0, True))
+        better_updated = self.ga_optimizer.update_best_if_better(SolutionVoidInt(43, 6.0, 6.0, True))
+        # Assert
+        self.assertFalse(worse_updated)
+        self.assertTrue(better_updated)
+        self.assertEqual(self.ga_optimizer.best_solution.fitness_value, 6.0)
+
+class TestGaOptimizerDiversity(unittest.TestCase):
+
+    def setUp(self):
+        TestGaOptimizerElite.setUp(self)
+
+    def create_population(self, representations:list)->list[SolutionVoidInt]:
+        population = []
+        for representation in representations:
+            individual = SolutionVoidInt(43, 43, 43, True)
+            individual.representation = representation
+            population.append(individual)
+        return population
+
+    # unique count ignores duplicates
+    def test_population_unique_count(self):
+        # Arrange
+        self.ga_optimizer.current_population = self.create_population([1, 2, 1, 3, 2])
+        # Act & Assert
+        self.assertEqual(self.ga_optimizer.population_unique_count(), 3)
+
+    # equal individuals have zero bitwise entropy
+    def test_population_mean_bit_entropy_of_equal_individuals_is_zero(self):
+        # Arrange
+        self.ga_optimizer.current_population = self.create_population([BitArray(bin='0110')] * 4)
+        # Act & Assert
+        self.assertEqual(self.ga_optimizer.population_mean_bit_entropy(), 0.0)
+
+    # bits set in half of the population have entropy one
+    def test_population_mean_bit_entropy(self):
+        # Arrange
+        self.ga_optimizer.current_population = self.create_population([BitArray(bin='01'), BitArray(bin='11')])
+        # Act & Assert
+        self.assertAlmostEqual(self.ga_optimizer.population_mean_bit_entropy(), 0.5)
+
+    # diversity is available as output control field
+    def test_diversity_should_be_available_as_output_field(self):
+        # Arrange
+        self.ga_optimizer.current_population = self.create_population([1, 2, 1])
+        fields_def = ['self.population_unique_count()', 'self.population_mean_bit_entropy()']
+        # Act
+        fields_val = self.ga_optimizer.determine_fields_val(fields_def, ['XXX', 'XXX'])
+        # Assert
+        self.assertEqual(fields_val, ['2', str(self.ga_optimizer.population_mean_bit_entropy())])
+
+    # without population membership structure, offspring is admitted unchanged
+    def test_admit_offspring_without_membership_should_not_change_offspring(self):
+        # Arrange
+        offspring = self.create_population([1])[0]
+        remutate = mocker.MagicMock()
+        # Act
+        self.ga_optimizer.admit_offspring(offspring, remutate)
+        # Assert
+        remutate.assert_not_called()
@@ -0,0 +1,146 @@
+import unittest
+import unittest.mock as mocker
+
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_gen import GaOptimizerGenerational
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection_roulette import GaSelectionRoulette
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_crossover_support_idle import GaCrossoverSupportIdle
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_mutation_support_idle import GaMutationSupportIdle
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island import GaOptimizerIsland
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island import island_migration_targets
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island import pack_individual
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer_island import unpack_individual
+
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.solution_void_representation_int import SolutionVoidInt
+
+def create_ga_optimizer(iterations_max:int=4)->GaOptimizerGenerational:
+    return GaOptimizerGenerational(ga_crossover_support=GaCrossoverSupportIdle(), 
+                                ga_mutation_support=GaMutationSupportIdle(), 
+                                ga_selection=GaSelectionRoulette(), 
+                                population_size=6, 
+                                elite_count=1,
+                                finish_control=FinishControl(criteria='iterations', iterations_max=iterations_max), 
+                                problem=ProblemVoidMinSO("a problem", True), 
+                                solution_template=SolutionVoidInt( 43, 43, 43, True),
+                                random_seed=42)
+
+class TestIslandMigrationTargets(unittest.TestCase):
+
+    # ring topology sends migrants to the next island
+    def test_ring_topology(self):
+        self.assertEqual(island_migration_targets('ring', 3, 4), [0])
+
+    # bidirectional ring topology sends migrants to both neighbors
+    def test_bidirectional_ring_topology(self):
+        self.assertEqual(island_migration_targets('bidirectional_ring', 0, 4), [1, 3])
+
+    # fully connected topology sends migrants to all other islands
+    def test_fully_connected_topology(self):
+        self.assertEqual(island_migration_targets('fully_connected', 1, 4), [0, 2, 3])
+
+    # single island has no neighbors
+    def test_single_island_should_have_no_targets(self):
+        self.assertEqual(island_migration_targets('bidirectional_ring', 0, 1), [])
+
+    # unknown topology raises ValueError
+    def test_unknown_topology_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            island_migration_targets('star', 0, 4)
+
+class TestPackIndividual(unittest.TestCase):
+
+    # unpacked individual has the same representation and quality as the packed one
+    def test_unpack_should_restore_packed_individual(self):
+        # Arrange
+        individual = SolutionVoidInt(43, 7, 5, False)
+        individual.representation = 11
+        # Act
+        restored = unpack_individual(SolutionVoidInt(43, 43, 43, True), pack_individual(individual))
+        # Assert
+        self.assertEqual(restored.representation, 11)
+        self.assertEqual(restored.fitness_value, 7)
+        self.assertEqual(restored.objective_value, 5)
+        self.assertFalse(restored.is_feasible)
+
+class TestGaOptimizerIsland(unittest.TestCase):
+
+    # GaOptimizerIsland raises TypeError if ga_optimizer parameter is not of type GaOptimizer
+    def test_ga_optimizer_type_error(self):
+        with self.assertRaises(TypeError):
+            GaOptimizerIsland(ga_optimizer="not a GaOptimizer")
+
+    # GaOptimizerIsland raises ValueError if island count is not positive
+    def test_island_count_value_error(self):
+        with self.assertRaises(ValueError):
+            GaOptimizerIsland(ga_optimizer=create_ga_optimizer(), island_count=0)
+
+    # GaOptimizerIsland raises ValueError if topology is unknown
+    def test_topology_value_error(self):
+        with self.assertRaises(ValueError):
+            GaOptimizerIsland(ga_optimizer=create_ga_optimizer(), topology='star')
+
+    # islands obtain different random seeds, determined by the random seed of the island model
+    def test_init_should_create_islands_with_different_seeds(self):
+        # Arrange
+        ga_island = GaOptimizerIsland(ga_optimizer=create_ga_optimizer(), island_count=3, random_seed=5)
+        ga_island_copy = ga_island.copy()
+        # Act
+        ga_island.init()
+        ga_island_copy.init()
+        # Assert
+        self.assertEqual(len(ga_island.islands), 3)
+        self.assertEqual(len(set(ga_island.island_seeds)), 3)
+        self.assertEqual(ga_island.island_seeds, ga_island_copy.island_seeds)
+
+    # copy keeps parameters of the island model
+    def test_copy_should_keep_parameters(self):
+        # Arrange
+        ga_island = GaOptimizerIsland(ga_optimizer=create_ga_optimizer(), island_count=3, migration_interval=5,
+                migrant_count=2, topology='fully_connected', random_seed=5)
+        # Act
+        ga_island_copy = ga_island.copy()
+        # Assert
+        self.assertEqual(ga_island_copy.island_count, 3)
+        self.assertEqual(ga_island_copy.migration_interval, 5)
+        self.assertEqual(ga_island_copy.migrant_count, 2)
+        self.assertEqual(ga_island_copy.topology, 'fully_connected')
+        self.assertEqual(ga_island_copy.random_seed, 5)
+
+    # islands are executed, exchange migrants and report statistics
+    def test_optimize_should_combine_results_of_islands(self):
+        # Arrange
+        ga_island = GaOptimizerIsland(ga_optimizer=create_ga_optimizer(iterations_max=4), island_count=2,
+                migration_interval=2, migrant_count=1, topology='ring', random_seed=5)
+        # Act
+        best = ga_island.optimize()
+        # Assert
+        self.assertIsNotNone(best)
+        self.assertEqual(len(ga_island.island_statistics), 2)
+        for i, statistics in enumerate(ga_island.island_statistics):
+            self.assertEqual(statistics.island_index, i)
+            self.assertEqual(statistics.iterations, 4)
+            self.assertEqual(statistics.migrants_sent, 2)
+        self.assertEqual(ga_island.evaluation, sum(s.evaluations for s in ga_island.island_statistics))
+        self.assertEqual(ga_island.iteration, 4)
+
+    # best solution of the previous execution is not kept by the next one
+    def test_optimize_again_should_ignore_previous_best_solution(self):
+        # Arrange
+        ga_island = GaOptimizerIsland(ga_optimizer=create_ga_optimizer(iterations_max=4), island_count=2,
+                migration_interval=2, migrant_count=1, topology='ring', random_seed=5)
+        first_best = ga_island.optimize()
+        stale_best = first_best.copy()
+        stale_best.fitness_value = 1000
+        ga_island.best_solution = stale_best
+        # Act
+        best = ga_island.optimize()
+        # Assert
+        self.assertEqual(best.fitness_value, first_best.fitness_value)
+        self.assertIn(best.fitness_value, [s.best_fitness_value for s in ga_island.island_statistics])
+        self.assertIn(ga_island.evaluation_best_found,
+                [s.evaluation_best_found for s in ga_island.island_statistics])
+        self.assertLessEqual(ga_island.iteration_best_found, ga_island.iteration)
+
+if __name__ == '__main__':
+    unittest.main()
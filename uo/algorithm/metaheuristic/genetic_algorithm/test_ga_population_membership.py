@@ -0,0 +1,133 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_population_membership import GaPopulationMembership
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_population_membership import membership_key
+
+from uo.solution.solution_void_representation_int import SolutionVoidInt
+
+def create_individual(representation)->SolutionVoidInt:
+    individual = SolutionVoidInt(43, 43, 43, True)
+    individual.representation = representation
+    return individual
+
+class TestMembershipKey(unittest.TestCase):
+
+    # bit arrays with equal bits have equal keys
+    def test_equal_bit_arrays_should_have_equal_keys(self):
+        self.assertEqual(membership_key(create_individual(BitArray(bin='0110'))), 
+                membership_key(create_individual(BitArray(bin='0110'))))
+
+    # bit arrays that differ only in length have different keys
+    def test_bit_arrays_of_different_length_should_have_different_keys(self):
+        self.assertNotEqual(membership_key(create_individual(BitArray(bin='011'))), 
+                membership_key(create_individual(BitArray(bin='0110'))))
+
+class TestGaPopulationMembership(unittest.TestCase):
+
+    # GaPopulationMembership raises ValueError if duplicate policy is unknown
+    def test_unknown_policy_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            GaPopulationMembership(duplicate_policy='ignore')
+
+    # GaPopulationMembership raises TypeError if max attempts is not int
+    def test_max_attempts_type_error(self):
+        with self.assertRaises(TypeError):
+            GaPopulationMembership(max_attempts=1.5)
+
+    # rebuilt structure contains exactly given individuals, counting duplicates once
+    def test_rebuild_should_count_unique_individuals(self):
+        # Arrange
+        membership = GaPopulationMembership()
+        # Act
+        membership.rebuild([create_individual(1), create_individual(2), create_individual(1)])
+        # Assert
+        self.assertEqual(membership.unique_count, 2)
+        self.assertTrue(membership.contains(create_individual(2)))
+        self.assertFalse(membership.contains(create_individual(3)))
+
+    # individual is contained until all its occurrences are removed
+    def test_remove_should_remove_single_occurrence(self):
+        # Arrange
+        membership = GaPopulationMembership()
+        membership.rebuild([create_individual(1), create_individual(1)])
+        # Act & Assert
+        membership.remove(create_individual(1))
+        self.assertTrue(membership.contains(create_individual(1)))
+        membership.remove(create_individual(1))
+        self.assertFalse(membership.contains(create_individual(1)))
+
+    # unique offspring is admitted without changes
+    def test_admit_unique_offspring_should_not_change_it(self):
+        # Arrange
+        membership = GaPopulationMembership()
+        membership.rebuild([create_individual(1)])
+        remutate = mocker.MagicMock()
+        reinit = mocker.MagicMock()
+        offspring = create_individual(2)
+        # Act
+        attempts = membership.admit(offspring, remutate, reinit)
+        # Assert
+        self.assertEqual(attempts, 0)
+        remutate.assert_not_called()
+        reinit.assert_not_called()
+        self.assertTrue(membership.contains(create_individual(2)))
+
+    # duplicate offspring is mutated again until it becomes unique
+    def test_admit_duplicate_offspring_should_remutate_it(self):
+        # Arrange
+        membership = GaPopulationMembership(duplicate_policy='remutate')
+        membership.rebuild([create_individual(1), create_individual(2)])
+        offspring = create_individual(1)
+        def remutate():
+            offspring.representation += 1
+        # Act
+        attempts = membership.admit(offspring, remutate, mocker.MagicMock())
+        # Assert
+        self.assertEqual(attempts, 2)
+        self.assertEqual(offspring.representation, 3)
+        self.assertEqual(membership.duplicates_detected, 2)
+
+    # duplicate offspring is replaced with random individual under reject policy
+    def test_admit_duplicate_offspring_should_reinit_it_under_reject_policy(self):
+        # Arrange
+        membership = GaPopulationMembership(duplicate_policy='reject')
+        membership.rebuild([create_individual(1)])
+        offspring = create_individual(1)
+        remutate = mocker.MagicMock()
+        def reinit():
+            offspring.representation = 7
+        # Act
+        membership.admit(offspring, remutate, reinit)
+        # Assert
+        remutate.assert_not_called()
+        self.assertEqual(offspring.representation, 7)
+
+    # number of attempts is limited
+    def test_admit_should_stop_after_max_attempts(self):
+        # Arrange
+        membership = GaPopulationMembership(max_attempts=3)
+        membership.rebuild([create_individual(1)])
+        remutate = mocker.MagicMock()
+        # Act
+        attempts = membership.admit(create_individual(1), remutate, mocker.MagicMock())
+        # Assert
+        self.assertEqual(attempts, 3)
+        self.assertEqual(remutate.call_count, 3)
+
+    # copy keeps parameters, but not content
+    def test_copy_should_keep_parameters(self):
+        # Arrange
+        membership = GaPopulationMembership(duplicate_policy='reject', max_attempts=4)
+        membership.rebuild([create_individual(1)])
+        # Act
+        membership_copy = membership.copy()
+        # Assert
+        self.assertEqual(membership_copy.duplicate_policy, 'reject')
+        self.assertEqual(membership_copy.max_attempts, 4)
+        self.assertEqual(membership_copy.unique_count, 0)
+
+if __name__ == '__main__':
+    unittest.main()
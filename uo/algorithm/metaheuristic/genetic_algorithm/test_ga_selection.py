@@ -0,0 +1,158 @@
+import math
+import unittest
+import unittest.mock as mocker
+from random import seed
+
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_optimizer import GaOptimizer
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection_roulette import GaSelectionRoulette
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection_roulette import fitness_proportional_weights
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection_stochastic_universal import \
+        GaSelectionStochasticUniversal
+from uo.algorithm.metaheuristic.genetic_algorithm.ga_selection_tournament import GaSelectionTournament
+
+from uo.solution.solution_void_representation_int import SolutionVoidInt
+
+def create_optimizer_stub(fitness_values:list[float], elite_count:int):
+    population = [SolutionVoidInt(43, f, f, True) for f in fitness_values]
+    optimizer_stub = mocker.MagicMock(spec=GaOptimizer)
+    type(optimizer_stub).current_population = mocker.PropertyMock(return_value=population)
+    type(optimizer_stub).elite_count = mocker.PropertyMock(return_value=elite_count)
+    optimizer_stub.population_fitness_values.return_value = list(fitness_values)
+    return optimizer_stub, population
+
+class TestFitnessProportionalWeights(unittest.TestCase):
+
+    # non-negative fitness values are used as weights
+    def test_non_negative_fitness_should_be_used_as_weights(self):
+        self.assertEqual(fitness_proportional_weights([1.0, 2.0, 3.0]), [1.0, 2.0, 3.0])
+
+    # negative fitness values are shifted
+    def test_negative_fitness_should_be_shifted(self):
+        self.assertEqual(fitness_proportional_weights([-3.0, -1.0, 0.0]), [0.0, 2.0, 3.0])
+
+    # individuals without fitness obtain zero weight
+    def test_infinite_fitness_should_obtain_zero_weight(self):
+        self.assertEqual(fitness_proportional_weights([-math.inf, 2.0]), [0.0, 2.0])
+
+    # equal fitness values give uniform weights
+    def test_all_zero_weights_should_become_uniform(self):
+        self.assertEqual(fitness_proportional_weights([0.0, 0.0]), [1.0, 1.0])
+
+class TestGaSelectionRoulette(unittest.TestCase):
+
+    # elite individuals are kept on their places
+    def test_selection_should_keep_elite(self):
+        # Arrange
+        optimizer_stub, population = create_optimizer_stub([5.0, 1.0, 1.0, 1.0], 1)
+        elite = population[0]
+        # Act
+        GaSelectionRoulette().selection(optimizer_stub)
+        # Assert
+        self.assertIs(population[0], elite)
+
+    # individuals with zero weight are never selected
+    def test_selection_should_not_select_individual_with_zero_weight(self):
+        # Arrange
+        seed(42)
+        optimizer_stub, population = create_optimizer_stub([0.0, 1.0, 0.0, 1.0] * 5, 0)
+        good = [population[i] for i in range(len(population)) if i % 2 == 1]
+        # Act
+        GaSelectionRoulette().selection(optimizer_stub)
+        # Assert
+        for individual in population:
+            self.assertTrue(any(individual is g for g in good))
+
+    # selection frequency is proportional to fitness
+    def test_selection_frequency_should_be_proportional_to_fitness(self):
+        # Arrange
+        seed(7)
+        counts = [0, 0]
+        # Act
+        for _ in range(200):
+            optimizer_stub, population = create_optimizer_stub([1.0, 3.0] * 10, 0)
+            originals = list(population)
+            GaSelectionRoulette().selection(optimizer_stub)
+            for individual in population:
+                counts[originals.index(individual) % 2] += 1
+        # Assert
+        self.assertAlmostEqual(counts[1] / sum(counts), 0.75, delta=0.02)
+
+class TestGaSelectionStochasticUniversal(unittest.TestCase):
+
+    # number of copies of each individual is within one of its expected value
+    def test_selection_should_have_minimal_spread(self):
+        # Arrange
+        seed(42)
+        optimizer_stub, population = create_optimizer_stub([1.0, 2.0, 3.0, 4.0], 0)
+        originals = list(population)
+        # Act
+        GaSelectionStochasticUniversal().selection(optimizer_stub)
+        # Assert
+        for i, individual in enumerate(originals):
+            copies = sum(1 for p in population if p is individual)
+            expected = 4 * (i + 1) / 10
+            self.assertLessEqual(abs(copies - expected), 1)
+
+    # elite individuals are kept on their places
+    def test_selection_should_keep_elite(self):
+        # Arrange
+        optimizer_stub, population = create_optimizer_stub([5.0, 1.0, 1.0], 3)
+        originals = list(population)
+        # Act
+        GaSelectionStochasticUniversal().selection(optimizer_stub)
+        # Assert
+        self.assertEqual(population, originals)
+
+class TestGaSelectionTournament(unittest.TestCase):
+
+    # tournament with size of the whole population always selects the best individual
+    def test_large_tournament_should_select_best_individual(self):
+        # Arrange
+        seed(42)
+        optimizer_stub, population = create_optimizer_stub([1.0, 7.0, 3.0], 0)
+        best = population[1]
+        # Act
+        GaSelectionTournament(50).selection(optimizer_stub)
+        # Assert
+        for individual in population:
+            self.assertIs(individual, best)
+
+    # with tournaments of size two, better of two individuals wins when drawn at least once
+    def test_binary_tournament_selection_frequency(self):
+        # Arrange
+        seed(1)
+        optimizer_stub, population = create_optimizer_stub([2.0, 1.0] * 500, 0)
+        originals = list(population)
+        # Act
+        GaSelectionTournament(2).selection(optimizer_stub)
+        # Assert
+        better_count = sum(1 for individual in population if originals.index(individual) % 2 == 0)
+        self.assertAlmostEqual(better_count / len(population), 0.75, delta=0.05)
+
+    # selection is reproducible when module random is seeded
+    def test_selection_should_be_reproducible_for_same_seed(self):
+        # Arrange
+        fitness_values = [float(i % 7) for i in range(30)]
+        optimizer_stub1, population1 = create_optimizer_stub(fitness_values, 0)
+        optimizer_stub2, population2 = create_optimizer_stub(fitness_values, 0)
+        originals1 = list(population1)
+        originals2 = list(population2)
+        # Act
+        seed(11)
+        GaSelectionTournament(3).selection(optimizer_stub1)
+        seed(11)
+        GaSelectionTournament(3).selection(optimizer_stub2)
+        # Assert
+        self.assertEqual([originals1.index(p) for p in population1], [originals2.index(p) for p in population2])
+
+    # tournament size should be positive
+    def test_non_positive_tournament_size_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            GaSelectionTournament(0)
+
+    # copy keeps tournament size
+    def test_copy_should_keep_tournament_size(self):
+        self.assertEqual(GaSelectionTournament(5).copy().tournament_size, 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+The :mod:`~uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider` module describes providers of task
+gradients used by :class:`~uo.algorithm.metaheuristic.maml_metaheuristic.maml_metaheuristic.MAMLMetaheuristic`.
+"""
+from __future__ import annotations
+from abc import ABCMeta, abstractmethod
+from typing import Callable, Sequence, Optional
+import numpy as np
+import copy
+
+
+class GradientProvider(metaclass=ABCMeta):
+    """Provider of the gradient of the task function at the given point."""
+
+    @abstractmethod
+    def gradient(self, task_index: int, f: Callable[[np.ndarray], float], x: np.ndarray,
+            generator: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Gradient of the task at the given point.
+
+        :param int task_index: index of the task within the list of tasks
+        :param f: task function
+        :param np.ndarray x: point where gradient is calculated
+        :param generator: random generator for stochastic estimates - if `None`, provider uses its own
+        :return: gradient vector, with the same shape as `x`
+        :rtype: np.ndarray
+        """
+        raise NotImplementedError()
+
+    def task_generators(self, count: int) -> list[Optional[np.random.Generator]]:
+        """
+        Random generators for one outer step, one per task. They are created in the calling process, so tasks
+        adapted in worker processes get independent random streams, different in every outer step.
+
+        :param int count: number of tasks
+        :return: generators, or `None` values for deterministic providers
+        :rtype: list[Optional[np.random.Generator]]
+        """
+        return [None] * count
+
+    def copy(self) -> GradientProvider:
+        """Return a deep copy of this instance."""
+        return copy.deepcopy(self)
+
+
+class CentralDifferenceGradientProvider(GradientProvider):
+    """
+    Central finite-difference gradient, with 2*dim task calls - or a single call with all perturbed points, if
+    the task accepts batch input.
+    """
+
+    def __init__(self, eps: float = 1e-5, batched: bool = False) -> None:
+        """
+        :param float eps: perturbation of each coordinate
+        :param bool batched: if task accepts matrix of points and returns vector of values
+        """
+        if eps <= 0:
+            raise ValueError('Parameter \'eps\' must be positive.')
+        if not isinstance(batched, bool):
+            raise TypeError('Parameter \'batched\' must be \'bool\'.')
+        self.eps = eps
+        self.batched = batched
+
+    def gradient(self, task_index: int, f: Callable[[np.ndarray], float], x: np.ndarray,
+            generator: Optional[np.random.Generator] = None) -> np.ndarray:
+        eps = self.eps
+        n = len(x)
+        if self.batched:
+            steps = eps * np.eye(n)
+            points = np.vstack([x + steps, x - steps])
+            values = np.asarray(f(points), dtype=float).reshape(-1)
+            return (values[:n] - values[n:]) / (2 * eps)
+        grad = np.zeros_like(x)
+        for i in range(n):
+            x1 = x.copy()
+            x2 = x.copy()
+            x1[i] += eps
+            x2[i] -= eps
+            grad[i] = (f(x1) - f(x2)) / (2 * eps)
+        return grad
+
+
+class SpsaGradientProvider(GradientProvider):
+    """
+    Simultaneous perturbation stochastic approximation (SPSA) of the gradient - all coordinates are perturbed at
+    once by random signs, so each estimate needs two task calls, regardless of dimension. Estimates are unbiased
+    up to O(c^2), and averaging over more samples reduces their variance.
+    """
+
+    def __init__(self, c: float = 1e-3, samples: int = 1, batched: bool = False,
+            seed: Optional[int] = None) -> None:
+        """
+        :param float c: perturbation size
+        :param int samples: number of estimates that are averaged
+        :param bool batched: if task accepts matrix of points and returns vector of values
+        :param seed: seed of the random generator of perturbations
+        """
+        if c <= 0:
+            raise ValueError('Parameter \'c\' must be positive.')
+        if not isinstance(samples, int):
+            raise TypeError('Parameter \'samples\' must be \'int\'.')
+        if samples <= 0:
+            raise ValueError('Parameter \'samples\' must be positive.')
+        if not isinstance(batched, bool):
+            raise TypeError('Parameter \'batched\' must be \'bool\'.')
+        self.c = c
+        self.samples = samples
+        self.batched = batched
+        # generators of the tasks are spawned from the seed sequence, and the own one is its first child
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.generator = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+
+    def task_generators(self, count: int) -> list[Optional[np.random.Generator]]:
+        return [np.random.default_rng(s) for s in self.seed_sequence.spawn(count)]
+
+    def gradient(self, task_index: int, f: Callable[[np.ndarray], float], x: np.ndarray,
+            generator: Optional[np.random.Generator] = None) -> np.ndarray:
+        c = self.c
+        # Rademacher perturbations, one per row - as 1/delta_i == delta_i, no division is needed
+        if generator is None:
+            generator = self.generator
+        deltas = generator.choice([-1.0, 1.0], size=(self.samples, len(x)))
+        if self.batched:
+            values = np.asarray(f(np.vstack([x + c * deltas, x - c * deltas])), dtype=float).reshape(-1)
+            differences = values[:self.samples] - values[self.samples:]
+        else:
+            differences = np.array([f(x + c * delta) - f(x - c * delta) for delta in deltas], dtype=float)
+        return (differences[:, np.newaxis] * deltas).sum(axis=0) / (2 * c * self.samples)
+
+
+class AnalyticGradientProvider(GradientProvider):
+    """
+    Gradients given by user-supplied callables, one per task. Tasks without analytic gradient (`None`) use the
+    fallback provider.
+    """
+
+    def __init__(self, gradients: Sequence[Optional[Callable[[np.ndarray], np.ndarray]]],
+            fallback: Optional[GradientProvider] = None) -> None:
+        """
+        :param gradients: gradient callables, in the same order as tasks
+        :param fallback: provider for tasks without analytic gradient - if `None`, central difference is used
+        """
+        if fallback is not None and not isinstance(fallback, GradientProvider):
+            raise TypeError('Parameter \'fallback\' must be \'GradientProvider\' or \'None\'.')
+        self.gradients = list(gradients)
+        self.fallback = fallback if fallback is not None else CentralDifferenceGradientProvider()
+
+    def task_generators(self, count: int) -> list[Optional[np.random.Generator]]:
+        return self.fallback.task_generators(count)
+
+    def gradient(self, task_index: int, f: Callable[[np.ndarray], float], x: np.ndarray,
+            generator: Optional[np.random.Generator] = None) -> np.ndarray:
+        if task_index < len(self.gradients) and self.gradients[task_index] is not None:
+            return np.asarray(self.gradients[task_index](x), dtype=float).reshape(x.shape)
+        return self.fallback.gradient(task_index, f, x, generator)
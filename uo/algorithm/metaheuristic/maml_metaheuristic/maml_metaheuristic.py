@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Callable, Sequence, Optional
+from concurrent.futures import Executor
 import numpy as np
 import copy
 
@@ -8,6 +9,10 @@ from uo.algorithm.output_control import OutputControl
 from uo.algorithm.metaheuristic.finish_control import FinishControl
 from uo.algorithm.metaheuristic.additional_statistics_control import AdditionalStatisticsControl
 from uo.problem.problem import Problem
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import GradientProvider
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import CentralDifferenceGradientProvider
+from uo.algorithm.metaheuristic.maml_metaheuristic.theta_history import ThetaHistory
+from uo.algorithm.metaheuristic.maml_metaheuristic.theta_history import NoThetaHistory
 
 
 # -----------------------------
@@ -38,6 +43,16 @@ class MAMLMetaheuristic(PopulationBasedMetaheuristic):
     """
     Model-Agnostic Meta-Learning (MAML) metaheuristic for few-shot optimization.
     Learns initialization parameters that can be quickly adapted to new tasks.
+
+    If tasks accept batch input (matrix with one point per row, returning one value per row), gradients are
+    computed with all perturbed points evaluated in one call. Adaptation to different tasks is independent, so it
+    can be executed in parallel by the given executor.
+
+    Gradients are calculated by the gradient provider - central finite differences by default, SPSA estimates for
+    high dimensions, or analytic gradients of the tasks.
+
+    Values of theta during the run are recorded by the history policy - nothing, the last values, every k-th value,
+    or every k-th value streamed to memory-mapped file.
     """
 
     def __init__(
@@ -48,7 +63,27 @@ class MAMLMetaheuristic(PopulationBasedMetaheuristic):
         inner_steps: int = 1,
         outer_steps: int = 1000,
         seed: Optional[int] = None,
+        batched_tasks: bool = False,
+        executor: Optional[Executor] = None,
+        gradient_provider: Optional[GradientProvider] = None,
+        theta_history: Optional[ThetaHistory] = None,
     ) -> None:
+        """
+        :param batched_tasks: if tasks accept matrix of points and return vector of values
+        :param executor: executor that adapts parameters to tasks in parallel - if `None`, tasks are processed
+        one by one; for process pools, tasks must be picklable
+        :param gradient_provider: provider of task gradients - if `None`, central finite differences are used,
+        batched if `batched_tasks` is set
+        :param theta_history: policy for recording theta after outer steps of `run` - if `None`, nothing is recorded
+        """
+        if not isinstance(batched_tasks, bool):
+            raise TypeError('Parameter \'batched_tasks\' must be \'bool\'.')
+        if executor is not None and not isinstance(executor, Executor):
+            raise TypeError('Parameter \'executor\' must be \'Executor\' or \'None\'.')
+        if gradient_provider is not None and not isinstance(gradient_provider, GradientProvider):
+            raise TypeError('Parameter \'gradient_provider\' must be \'GradientProvider\' or \'None\'.')
+        if theta_history is not None and not isinstance(theta_history, ThetaHistory):
+            raise TypeError('Parameter \'theta_history\' must be \'ThetaHistory\' or \'None\'.')
 
         # -----------------------------
         # Dummy Problem instance
@@ -77,6 +112,12 @@ class MAMLMetaheuristic(PopulationBasedMetaheuristic):
         self.inner_steps = inner_steps
         self.outer_steps = outer_steps
         self.theta: Optional[np.ndarray] = None  # global parameters
+        self.batched_tasks = batched_tasks
+        self.executor = executor
+        if gradient_provider is None:
+            gradient_provider = CentralDifferenceGradientProvider(batched=batched_tasks)
+        self.gradient_provider = gradient_provider
+        self.theta_history = theta_history if theta_history is not None else NoThetaHistory()
 
         if seed is not None:
             np.random.seed(seed)
@@ -94,15 +135,13 @@ class MAMLMetaheuristic(PopulationBasedMetaheuristic):
         if self.theta is None:
             self.init()
 
-        meta_grad = np.zeros_like(self.theta)
-
-        for f in self.tasks:
-            theta_i = self.theta.copy()
-            # inner loop
-            for _ in range(self.inner_steps):
-                grad = self._grad(f, theta_i)
-                theta_i -= self.alpha * grad
-            meta_grad += self._grad(f, theta_i)
+        # random streams are drawn here, as state of the provider is not returned from worker processes
+        generators = self.gradient_provider.task_generators(len(self.tasks))
+        if self.executor is None:
+            task_grads = [self._task_meta_grad(i, g) for i, g in enumerate(generators)]
+        else:
+            task_grads = list(self.executor.map(self._task_meta_grad, range(len(self.tasks)), generators))
+        meta_grad = np.sum(task_grads, axis=0)
 
         # outer update
         self.theta -= self.beta * meta_grad / len(self.tasks)
@@ -129,16 +168,29 @@ class MAMLMetaheuristic(PopulationBasedMetaheuristic):
     # -----------------------------
     # Helper methods
     # -----------------------------
+    def __getstate__(self) -> dict:
+        """State for pickling, without executor (needed when tasks are adapted in worker processes)."""
+        state = self.__dict__.copy()
+        state['executor'] = None
+        return state
+
+    def _task_meta_grad(self, task_index: int, generator: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Adapt theta to the task by inner steps, and return gradient of the task at adapted parameters."""
+        theta_i = self.theta.copy()
+        # inner loop
+        for _ in range(self.inner_steps):
+            grad = self._task_grad(task_index, theta_i, generator)
+            theta_i -= self.alpha * grad
+        return self._task_grad(task_index, theta_i, generator)
+
+    def _task_grad(self, task_index: int, x: np.ndarray,
+            generator: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Gradient of the task at the given point, calculated by the gradient provider."""
+        return self.gradient_provider.gradient(task_index, self.tasks[task_index], x, generator)
+
     def _grad(self, f: Callable[[np.ndarray], float], x: np.ndarray, eps: float = 1e-5) -> np.ndarray:
         """Approximate gradient using finite differences."""
-        grad = np.zeros_like(x)
-        for i in range(len(x)):
-            x1 = x.copy()
-            x2 = x.copy()
-            x1[i] += eps
-            x2[i] -= eps
-            grad[i] = (f(x1) - f(x2)) / (2 * eps)
-        return grad
+        return CentralDifferenceGradientProvider(eps, self.batched_tasks).gradient(-1, f, x)
 
     # -----------------------------
     # Run method
@@ -146,13 +198,14 @@ class MAMLMetaheuristic(PopulationBasedMetaheuristic):
     def run(self, dim: int = 1) -> np.ndarray:
         """
         Run MAML metaheuristic optimization.
-        Returns learned initialization vector.
+        Returns learned initialization vector; values of theta during the run are in `theta_history`.
         """
         self.theta = np.random.randn(dim)
-        theta_history = []
+        self.theta_history.start(self.outer_steps, dim)
 
-        for _ in range(self.outer_steps):
+        for step in range(self.outer_steps):
             self.main_loop_iteration()
-            theta_history.append(self.theta.copy())
+            self.theta_history.append(step, self.theta)
+        self.theta_history.finish()
 
         return self.theta
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+The :mod:`~uo.algorithm.metaheuristic.maml_metaheuristic.theta_history` module describes policies for recording
+values of theta during :class:`~uo.algorithm.metaheuristic.maml_metaheuristic.maml_metaheuristic.MAMLMetaheuristic`
+runs, so memory used by the history can be bounded.
+"""
+from __future__ import annotations
+from abc import ABCMeta, abstractmethod
+import numpy as np
+
+
+class ThetaHistory(metaclass=ABCMeta):
+    """Policy that records theta after outer steps."""
+
+    def start(self, outer_steps: int, dim: int) -> None:
+        """
+        Prepare the history for the run.
+
+        :param int outer_steps: number of outer steps of the run
+        :param int dim: dimension of theta
+        """
+        self.dim = dim
+        self.count = 0
+
+    @abstractmethod
+    def append(self, step: int, theta: np.ndarray) -> None:
+        """
+        Record theta after the outer step.
+
+        :param int step: index of the outer step, starting from zero
+        :param np.ndarray theta: theta after the step
+        """
+        raise NotImplementedError()
+
+    def finish(self) -> None:
+        """Finish the run - flush recorded values, if needed."""
+        pass
+
+    @property
+    @abstractmethod
+    def steps(self) -> np.ndarray:
+        """Indexes of the outer steps of recorded values, in order of recording."""
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def values(self) -> np.ndarray:
+        """Recorded values of theta, one per row, in order of recording."""
+        raise NotImplementedError()
+
+
+class NoThetaHistory(ThetaHistory):
+    """Nothing is recorded."""
+
+    def append(self, step: int, theta: np.ndarray) -> None:
+        pass
+
+    @property
+    def steps(self) -> np.ndarray:
+        return np.zeros(0, dtype=np.int64)
+
+    @property
+    def values(self) -> np.ndarray:
+        return np.zeros((0, getattr(self, 'dim', 0)))
+
+
+class EveryKThetaHistory(ThetaHistory):
+    """Theta is recorded after every k-th outer step (and after the last one), so with k=1 the full history is kept."""
+
+    def __init__(self, k: int = 1) -> None:
+        """
+        :param int k: recording period, in outer steps
+        """
+        if not isinstance(k, int):
+            raise TypeError('Parameter \'k\' must be \'int\'.')
+        if k <= 0:
+            raise ValueError('Parameter \'k\' must be positive.')
+        self.k = k
+
+    def _is_recorded(self, step: int) -> bool:
+        """If theta after the given step is recorded."""
+        return (step + 1) % self.k == 0 or step == self.outer_steps - 1
+
+    def _capacity(self) -> int:
+        """Number of recorded values during the run."""
+        return self.outer_steps // self.k + (1 if self.outer_steps % self.k != 0 else 0)
+
+    def start(self, outer_steps: int, dim: int) -> None:
+        super().start(outer_steps, dim)
+        self.outer_steps = outer_steps
+        # preallocated, so recording does not grow lists of arrays
+        self._values = np.zeros((self._capacity(), dim))
+
+    def append(self, step: int, theta: np.ndarray) -> None:
+        if self._is_recorded(step):
+            self._values[self.count] = theta
+            self.count += 1
+
+    @property
+    def steps(self) -> np.ndarray:
+        return np.minimum(np.arange(1, self.count + 1) * self.k, self.outer_steps) - 1
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[:self.count]
+
+
+class RingThetaHistory(ThetaHistory):
+    """The last `size` values of theta are kept in a ring buffer."""
+
+    def __init__(self, size: int) -> None:
+        """
+        :param int size: number of the last values that are kept
+        """
+        if not isinstance(size, int):
+            raise TypeError('Parameter \'size\' must be \'int\'.')
+        if size <= 0:
+            raise ValueError('Parameter \'size\' must be positive.')
+        self.size = size
+
+    def start(self, outer_steps: int, dim: int) -> None:
+        super().start(outer_steps, dim)
+        self._steps = np.zeros(self.size, dtype=np.int64)
+        self._values = np.zeros((self.size, dim))
+
+    def append(self, step: int, theta: np.ndarray) -> None:
+        position = self.count % self.size
+        self._steps[position] = step
+        self._values[position] = theta
+        self.count += 1
+
+    def _order(self) -> np.ndarray:
+        """Positions within the buffer, from the oldest to the newest value."""
+        if self.count <= self.size:
+            return np.arange(self.count)
+        return (np.arange(self.size) + self.count) % self.size
+
+    @property
+    def steps(self) -> np.ndarray:
+        return self._steps[self._order()]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[self._order()]
+
+
+class MemmapThetaHistory(EveryKThetaHistory):
+    """
+    Theta is recorded after every k-th outer step into memory-mapped `.npy` file, so values are written to disk
+    instead of being kept in memory. File can be loaded by `np.load`, and has one row per recorded value.
+    """
+
+    def __init__(self, file_path: str, k: int = 1) -> None:
+        """
+        :param str file_path: path of the `.npy` file
+        :param int k: recording period, in outer steps
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('Parameter \'file_path\' must be \'str\'.')
+        super().__init__(k)
+        self.file_path = file_path
+
+    def start(self, outer_steps: int, dim: int) -> None:
+        ThetaHistory.start(self, outer_steps, dim)
+        self.outer_steps = outer_steps
+        self._values = np.lib.format.open_memmap(self.file_path, mode='w+', dtype=np.float64,
+                shape=(self._capacity(), dim))
+
+    def finish(self) -> None:
+        self._values.flush()
+
+    def __getstate__(self) -> dict:
+        """State for pickling, without memory map - values stay in the file."""
+        state = self.__dict__.copy()
+        state.pop('_values', None)
+        return state
+
+    @property
+    def values(self) -> np.ndarray:
+        if not hasattr(self, '_values'):
+            self._values = np.load(self.file_path, mmap_mode='r')
+        return self._values[:self.count]
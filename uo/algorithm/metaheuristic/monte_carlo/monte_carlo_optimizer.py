@@ -13,6 +13,7 @@ sys.path.append(directory.parent)
 sys.path.append(directory.parent.parent)
 sys.path.append(directory.parent.parent.parent)
 
+import math
 from random import choice
 from random import random
 
@@ -24,6 +25,7 @@ from typing import Optional
 
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
+from uo.solution.representation_sampler import RepresentationSampler
 
 from uo.algorithm.output_control import OutputControl
 from uo.algorithm.metaheuristic.finish_control import FinishControl
@@ -43,6 +45,8 @@ class MonteCarloOptimizerConstructionParameters:
         output_control: Optional[OutputControl] = None
         random_seed: Optional[int] = None
         additional_statistics_control: Optional[AdditionalStatisticsControl] = None
+        representation_sampler: Optional[RepresentationSampler] = None
+        batch_size: int = 1
 
 class MonteCarloOptimizer(SingleSolutionMetaheuristic):
     """
@@ -56,7 +60,9 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
             solution_template:Optional[Solution],
             output_control:Optional[OutputControl]=None, 
             random_seed:Optional[int]=None, 
-            additional_statistics_control:Optional[AdditionalStatisticsControl]=None
+            additional_statistics_control:Optional[AdditionalStatisticsControl]=None,
+            representation_sampler:Optional[RepresentationSampler]=None,
+            batch_size:int=1
         )->None:
         """
         Create new instance of class :class:`~uo.algorithm.metaheuristic.variable_neighborhood_search.MonteCarloOptimizer`. 
@@ -69,7 +75,17 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
         :param `OutputControl` output_control: structure that controls output
         :param `Problem` problem: problem to be solved
         :param `Solution` solution_template: initial solution of the problem 
+        :param `Optional[RepresentationSampler]` representation_sampler: sampler that draws block of random 
+        representations at once - if `None`, one solution per iteration is initialized by `init_random`
+        :param int batch_size: number of representations drawn and evaluated together within one iteration, when 
+        sampler is used
         """
+        if representation_sampler is not None and not isinstance(representation_sampler, RepresentationSampler):
+            raise TypeError('Parameter \'representation_sampler\' must be \'RepresentationSampler\' or \'None\'.')
+        if not isinstance(batch_size, int):
+            raise TypeError('Parameter \'batch_size\' must be \'int\'.')
+        if batch_size <= 0:
+            raise ValueError('Parameter \'batch_size\' must be positive.')
         super().__init__( name='MonteCarlo', 
                 finish_control=finish_control, 
                 random_seed=random_seed, 
@@ -80,6 +96,8 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
         self.current_solution = None
         if self.solution_template is not None:
             self.current_solution = self.solution_template.copy()
+        self.__representation_sampler:Optional[RepresentationSampler] = representation_sampler
+        self.__batch_size:int = batch_size
 
     def copy(self):
         """
@@ -102,12 +120,17 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
         asc:Optional[AdditionalStatisticsControl] = None
         if self.additional_statistics_control is not None:
             asc = self.additional_statistics_control.copy()
+        rs:Optional[RepresentationSampler] = None
+        if self.__representation_sampler is not None:
+            rs = self.__representation_sampler.copy()
         ga_opt:'MonteCarloOptimizer' = MonteCarloOptimizer(fc,
                                                 pr,
                                                 st,
                                                 oc,
                                                 self.random_seed,
-                                                asc)
+                                                asc,
+                                                rs,
+                                                self.__batch_size)
         return ga_opt    
 
     @classmethod
@@ -123,9 +146,31 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
             construction_tuple.solution_template,
             construction_tuple.output_control, 
             construction_tuple.random_seed, 
-            construction_tuple.additional_statistics_control
+            construction_tuple.additional_statistics_control,
+            construction_tuple.representation_sampler,
+            construction_tuple.batch_size
         )
 
+    @property
+    def representation_sampler(self)->Optional[RepresentationSampler]:
+        """
+        Property getter for the sampler of random representations
+
+        :return: sampler of random representations, or `None` if solutions are initialized one by one
+        :rtype: `Optional[RepresentationSampler]`
+        """
+        return self.__representation_sampler
+
+    @property
+    def batch_size(self)->int:
+        """
+        Property getter for the number of representations evaluated together within one iteration
+
+        :return: number of representations within one batch
+        :rtype: int
+        """
+        return self.__batch_size
+
     def init(self)->None:
         """
         Initialization of the MonteCarlo algorithm
@@ -136,12 +181,39 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
         self.current_solution.evaluate(self.problem)
         self.best_solution = self.current_solution
     
+    def __sample_batch(self)->None:
+        """
+        Draws block of random representations, evaluates them together and sets current solution to the best one
+        """
+        count:int = self.__batch_size
+        if self.finish_control.check_evaluations:
+            count = max(1, min(count, self.finish_control.evaluations_max - self.evaluation))
+        representations:list = self.__representation_sampler.sample(count)
+        self.write_output_values_if_needed("before_evaluation", "b_e")
+        self.evaluation += count
+        qualities:list[QualityOfSolution] = self.current_solution.calculate_quality_batch(representations,
+                self.problem)
+        self.write_output_values_if_needed("after_evaluation", "a_e")
+        best_index:int = max(range(count), key=lambda i: -math.inf if qualities[i].fitness_value is None 
+                else qualities[i].fitness_value)
+        self.current_solution.init_from(representations[best_index], self.problem)
+        self.current_solution.objective_value = qualities[best_index].objective_value
+        self.current_solution.fitness_value = qualities[best_index].fitness_value
+        self.current_solution.is_feasible = qualities[best_index].is_feasible
+
     def main_loop_iteration(self)->None:
         """
         One iteration within main loop of the MonteCarlo algorithm
         """
         self.iteration += 1
-        self.current_solution.init_random(self.problem)
+        if self.__representation_sampler is None:
+            self.current_solution.init_random(self.problem)
+            self.write_output_values_if_needed("before_evaluation", "b_e")
+            self.evaluation += 1
+            self.current_solution.evaluate(self.problem)
+            self.write_output_values_if_needed("after_evaluation", "a_e")
+        else:
+            self.__sample_batch()
         improvement:bool = self.current_solution.is_better(self.best_solution, self.problem)
         if improvement:
             # update auxiliary structure that keeps all solution codes
@@ -179,6 +251,7 @@ class MonteCarloOptimizer(SingleSolutionMetaheuristic):
             s += 'current_solution=None' + delimiter
         for _ in range(0, indentation):
             s += indentation_symbol  
+        s += 'batch_size=' + str(self.__batch_size) + delimiter
         for _ in range(0, indentation):
             s += indentation_symbol  
         s += group_end 
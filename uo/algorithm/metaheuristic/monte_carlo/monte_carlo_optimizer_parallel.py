@@ -0,0 +1,304 @@
+"""
+..  _py_MonteCarlo_optimizer_parallel:
+
+The :mod:`~uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer_parallel` contains class
+:class:`~uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer_parallel.MonteCarloOptimizerParallel`, that
+represents Monte Carlo algorithm executed by many workers, each with its own independent random stream.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from dataclasses import dataclass
+
+from typing import Optional
+
+import numpy as np
+
+from uo.utils.logger import logger
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.solution.representation_sampler import RepresentationSampler
+
+from uo.algorithm.output_control import OutputControl
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.additional_statistics_control import AdditionalStatisticsControl
+
+from uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer import MonteCarloOptimizer
+
+def optimize_worker(optimizer:MonteCarloOptimizer,
+        seed_sequence:np.random.SeedSequence)->tuple[Solution, int, int]:
+    """
+    Executes Monte Carlo optimizer of one worker, with random streams determined by the given seed sequence
+
+    :param `MonteCarloOptimizer` optimizer: optimizer of the worker
+    :param `np.random.SeedSequence` seed_sequence: seed sequence of the worker
+    :return: the best solution of the worker, number of evaluations and number of iterations
+    :rtype: tuple[Solution, int, int]
+    """
+    # random initialization of the solutions uses module `random`
+    random.seed(int(seed_sequence.generate_state(1)[0]))
+    if optimizer.representation_sampler is not None:
+        optimizer.representation_sampler.reseed(seed_sequence)
+    best:Solution = optimizer.optimize()
+    return (best, optimizer.evaluation, optimizer.iteration)
+
+@dataclass
+class MonteCarloOptimizerParallelConstructionParameters:
+        """
+        Instance of the class :class:`~uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer_parallel.
+        MonteCarloOptimizerParallelConstructionParameters` represents constructor parameters for parallel Monte
+        Carlo algorithm.
+        """
+        finish_control: Optional[FinishControl] = None
+        problem: Problem = None
+        solution_template: Optional[Solution] = None
+        output_control: Optional[OutputControl] = None
+        random_seed: Optional[int] = None
+        additional_statistics_control: Optional[AdditionalStatisticsControl] = None
+        representation_sampler: Optional[RepresentationSampler] = None
+        batch_size: int = 1
+        worker_count: int = 1
+
+class MonteCarloOptimizerParallel(MonteCarloOptimizer):
+    """
+    Instance of the class :class:`~uo.algorithm.metaheuristic.monte_carlo.MonteCarloOptimizerParallel` executes
+    Monte Carlo algorithm by many workers. Evaluation and iteration budgets are split among workers, each worker has
+    its own random stream spawned from the seed of the optimizer, and the best solutions of the workers are
+    reduced to the single one. Result is reproducible for the same random seed and number of workers.
+    """
+
+    def __init__(self,
+            finish_control:FinishControl,
+            problem:Problem,
+            solution_template:Optional[Solution],
+            output_control:Optional[OutputControl]=None,
+            random_seed:Optional[int]=None,
+            additional_statistics_control:Optional[AdditionalStatisticsControl]=None,
+            representation_sampler:Optional[RepresentationSampler]=None,
+            batch_size:int=1,
+            worker_count:int=1
+        )->None:
+        """
+        Create new instance of class :class:`~uo.algorithm.metaheuristic.monte_carlo.MonteCarloOptimizerParallel`.
+
+        :param `FinishControl` finish_control: structure that control finish criteria for metaheuristic execution
+        :param `Problem` problem: problem to be solved
+        :param `Solution` solution_template: initial solution of the problem
+        :param `OutputControl` output_control: structure that controls output
+        :param int random_seed: random seed for metaheuristic execution - random streams of the workers are
+        spawned from it
+        :param `AdditionalStatisticsControl` additional_statistics_control: structure that controls additional
+        statistics obtained during metaheuristic execution
+        :param `Optional[RepresentationSampler]` representation_sampler: sampler that draws block of random
+        representations at once - each worker uses its own copy
+        :param int batch_size: number of representations drawn and evaluated together within one iteration
+        :param int worker_count: number of workers - if `1`, worker is executed within current process
+        """
+        if not isinstance(worker_count, int):
+            raise TypeError('Parameter \'worker_count\' must be \'int\'.')
+        if worker_count <= 0:
+            raise ValueError('Parameter \'worker_count\' must be positive.')
+        super().__init__(finish_control=finish_control,
+                problem=problem,
+                solution_template=solution_template,
+                output_control=output_control,
+                random_seed=random_seed,
+                additional_statistics_control=additional_statistics_control,
+                representation_sampler=representation_sampler,
+                batch_size=batch_size)
+        self.__worker_count:int = worker_count
+
+    def copy(self):
+        """
+        Internal copy of the current instance
+
+        :return: new instance with the same properties
+        """
+        mc:MonteCarloOptimizer = super().copy()
+        return MonteCarloOptimizerParallel(mc.finish_control,
+                                        mc.problem,
+                                        mc.solution_template,
+                                        mc.output_control,
+                                        mc.random_seed,
+                                        mc.additional_statistics_control,
+                                        mc.representation_sampler,
+                                        mc.batch_size,
+                                        self.__worker_count)
+
+    @classmethod
+    def from_construction_tuple(cls, construction_tuple:MonteCarloOptimizerParallelConstructionParameters):
+        """
+        Additional constructor, that creates new instance of class
+        :class:`~uo.algorithm.metaheuristic.monte_carlo.MonteCarloOptimizerParallel`.
+
+        :param `MonteCarloOptimizerParallelConstructionParameters` construction_tuple: tuple with all constructor
+        parameters
+        """
+        return cls(
+            construction_tuple.finish_control,
+            construction_tuple.problem,
+            construction_tuple.solution_template,
+            construction_tuple.output_control,
+            construction_tuple.random_seed,
+            construction_tuple.additional_statistics_control,
+            construction_tuple.representation_sampler,
+            construction_tuple.batch_size,
+            construction_tuple.worker_count
+        )
+
+    @property
+    def worker_count(self)->int:
+        """
+        Property getter for the number of workers
+
+        :return: number of workers
+        :rtype: int
+        """
+        return self.__worker_count
+
+    def split_finish_control(self)->list[FinishControl]:
+        """
+        Splits evaluation and iteration budgets of the finish control among workers, as evenly as possible - time
+        budget is the same for all workers. Number of workers is reduced, if budget is smaller than it.
+
+        :return: finish controls, one for each worker
+        :rtype: list[FinishControl]
+        """
+        count:int = self.__worker_count
+        if self.finish_control.check_evaluations:
+            count = min(count, self.finish_control.evaluations_max)
+        if self.finish_control.check_iterations:
+            count = min(count, self.finish_control.iterations_max)
+        count = max(count, 1)
+        finish_controls:list[FinishControl] = []
+        for i in range(count):
+            evaluations_max:int = self.finish_control.evaluations_max // count + \
+                    (1 if i < self.finish_control.evaluations_max % count else 0)
+            iterations_max:int = self.finish_control.iterations_max // count + \
+                    (1 if i < self.finish_control.iterations_max % count else 0)
+            finish_controls.append(FinishControl(self.finish_control.criteria, evaluations_max, iterations_max,
+                    self.finish_control.seconds_max))
+        return finish_controls
+
+    def optimize(self)->Solution:
+        """
+        Executing optimization by all workers, and reduction of their best solutions - the best solution of the
+        previous execution, if any, is not taken into account
+
+        :return: the best solution
+        :rtype: `Solution`
+        """
+        self.execution_started = datetime.now()
+        self.evaluation = 0
+        self.iteration = 0
+        finish_controls:list[FinishControl] = self.split_finish_control()
+        seed_sequences:list[np.random.SeedSequence] = np.random.SeedSequence(
+                self.random_seed).spawn(len(finish_controls))
+        workers:list[MonteCarloOptimizer] = []
+        for finish_control, seed_sequence in zip(finish_controls, seed_sequences):
+            rs:Optional[RepresentationSampler] = None
+            if self.representation_sampler is not None:
+                rs = self.representation_sampler.copy()
+            workers.append(MonteCarloOptimizer(finish_control,
+                    self.problem,
+                    self.solution_template,
+                    None,
+                    int(seed_sequence.generate_state(1)[0]) + 1,
+                    None,
+                    rs,
+                    self.batch_size))
+        logger.debug('Number of workers: {}'.format(len(workers)))
+        self.write_output_headers_if_needed()
+        self.write_output_values_if_needed("before_algorithm", "b_a")
+        if len(workers) == 1:
+            # worker reseeds module `random`, so the state of the caller is restored afterwards
+            random_state:tuple = random.getstate()
+            try:
+                results:list[tuple[Solution, int, int]] = [optimize_worker(workers[0], seed_sequences[0])]
+            finally:
+                random.setstate(random_state)
+        else:
+            with ProcessPoolExecutor(max_workers=len(workers)) as executor:
+                results:list[tuple[Solution, int, int]] = list(executor.map(optimize_worker, workers,
+                        seed_sequences))
+        merged_best:Optional[Solution] = None
+        evaluation_best_found:int = 0
+        iteration_best_found:int = 0
+        for best, evaluation, iteration in results:
+            self.evaluation += evaluation
+            self.iteration += iteration
+            if merged_best is None or best.is_better(merged_best, self.problem):
+                merged_best = best
+                evaluation_best_found = self.evaluation
+                iteration_best_found = self.iteration
+                self.best_solution = best
+                self.update_additional_statistics_if_required(best)
+        self.evaluation_best_found = evaluation_best_found
+        self.iteration_best_found = iteration_best_found
+        self.current_solution = self.best_solution.copy()
+        self.execution_ended = datetime.now()
+        self.write_output_values_if_needed("after_algorithm", "a_a")
+        return self.best_solution
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='',group_start:str ='{',
+        group_end:str ='}')->str:
+        """
+        String representation of the `MonteCarloOptimizerParallel` instance
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string
+        :type group_end: str, optional, default value '}'
+        :return: string representation of instance that controls output
+        :rtype: str
+        """
+        s = super().string_rep(delimiter, indentation, indentation_symbol, group_start, group_end)
+        s += delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'worker_count=' + str(self.__worker_count) + delimiter
+        return s
+
+    def __str__(self)->str:
+        """
+        String representation of the `MonteCarloOptimizerParallel` instance
+
+        :return: string representation of the `MonteCarloOptimizerParallel` instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        String representation of the `MonteCarloOptimizerParallel` instance
+
+        :return: string representation of the `MonteCarloOptimizerParallel` instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the MonteCarloOptimizerParallel instance
+
+        :param spec: str -- format specification
+        :return: formatted `MonteCarloOptimizerParallel` instance
+        :rtype: str
+        """
+        return self.string_rep('\n',0,'   ','{', '}')
@@ -11,6 +11,12 @@ from uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer import MonteCa
 from uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer import MonteCarloOptimizer
 from uo.problem.problem_void_min_so import ProblemVoidMinSO
 from uo.solution.solution_void_representation_int import SolutionVoidInt
+from uo.solution.representation_sampler_bit_array import RepresentationSamplerBitArray
+
+from bitstring import BitArray
+
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
 
 
 class TestMonteCarloOptimizer(unittest.TestCase):
@@ -120,4 +126,70 @@ class TestMonteCarloOptimizer(unittest.TestCase):
         optimizer2.init()
 
         # Assert (assuming init_random affects some state that can be compared)
-        self.assertEqual(optimizer1.current_solution.representation, optimizer2.current_solution.representation)  
\ No newline at end of file
+        self.assertEqual(optimizer1.current_solution.representation, optimizer2.current_solution.representation)  
+
+    # Evaluates random solution within each iteration
+    def test_main_loop_iteration_evaluates_solution(self):
+        # Arrange
+        optimizer = MonteCarloOptimizer(FinishControl(), ProblemVoidMinSO(), SolutionVoidInt())
+        optimizer.init()
+        evaluation = optimizer.evaluation
+        # Act
+        optimizer.main_loop_iteration()
+        # Assert
+        self.assertEqual(optimizer.evaluation, evaluation + 1)
+        self.assertEqual(optimizer.current_solution.fitness_value, 42)
+
+class TestMonteCarloOptimizerBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemVoidMinSO("a problem", False)
+        self.solution_template = SolutionWeightedOnesBitArray(BitArray(length=10))
+
+    # Batch of representations is evaluated together, and the best one becomes current solution
+    def test_main_loop_iteration_evaluates_batch(self):
+        # Arrange
+        optimizer = MonteCarloOptimizer(FinishControl(criteria='evaluations', evaluations_max=1000), self.problem,
+                self.solution_template, representation_sampler=RepresentationSamplerBitArray(10, random_seed=42),
+                batch_size=64)
+        optimizer.init()
+        # Act
+        with mock.patch.object(SolutionWeightedOnesBitArray, 'calculate_quality_batch',
+                autospec=True, side_effect=Solution.calculate_quality_batch) as batch_mock:
+            optimizer.main_loop_iteration()
+        # Assert
+        self.assertEqual(batch_mock.call_count, 1)
+        self.assertEqual(len(batch_mock.call_args[0][1]), 64)
+        self.assertEqual(optimizer.evaluation, 65)
+        self.assertEqual(optimizer.current_solution.fitness_value, 
+                sum(i + 1 for i in optimizer.current_solution.representation.findall('0b1')))
+        self.assertGreaterEqual(optimizer.best_solution.fitness_value, optimizer.current_solution.fitness_value)
+
+    # Batches are shortened so the evaluation budget is not exceeded
+    def test_optimize_respects_evaluation_budget(self):
+        # Arrange
+        optimizer = MonteCarloOptimizer(FinishControl(criteria='evaluations', evaluations_max=300), self.problem,
+                self.solution_template, representation_sampler=RepresentationSamplerBitArray(10, random_seed=42),
+                batch_size=64)
+        # Act
+        best = optimizer.optimize()
+        # Assert
+        self.assertEqual(optimizer.evaluation, 300)
+        self.assertGreaterEqual(best.fitness_value, 40)
+
+    # Non-positive batch size raises ValueError
+    def test_non_positive_batch_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            MonteCarloOptimizer(FinishControl(), self.problem, self.solution_template, batch_size=0)
+
+    # Copy keeps sampler and batch size
+    def test_copy_keeps_sampler_and_batch_size(self):
+        # Arrange
+        optimizer = MonteCarloOptimizer(FinishControl(), self.problem, self.solution_template,
+                representation_sampler=RepresentationSamplerBitArray(10, random_seed=42), batch_size=16)
+        # Act
+        optimizer_copy = optimizer.copy()
+        # Assert
+        self.assertEqual(optimizer_copy.batch_size, 16)
+        self.assertIsNot(optimizer_copy.representation_sampler, optimizer.representation_sampler)
+        self.assertEqual(optimizer_copy.representation_sampler.dimension, 10)
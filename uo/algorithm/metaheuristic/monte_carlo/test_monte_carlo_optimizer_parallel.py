@@ -0,0 +1,112 @@
+import unittest
+import random
+
+from bitstring import BitArray
+
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.representation_sampler_bit_array import RepresentationSamplerBitArray
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.monte_carlo.monte_carlo_optimizer_parallel import MonteCarloOptimizerParallel, \
+        MonteCarloOptimizerParallelConstructionParameters
+
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class TestMonteCarloOptimizerParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemVoidMinSO("a problem", False)
+        self.solution_template = SolutionWeightedOnesBitArray(BitArray(length=12))
+
+    def create_optimizer(self, worker_count:int, random_seed:int=42)->MonteCarloOptimizerParallel:
+        return MonteCarloOptimizerParallel(FinishControl(criteria='evaluations', evaluations_max=400),
+                self.problem, self.solution_template, random_seed=random_seed,
+                representation_sampler=RepresentationSamplerBitArray(12), batch_size=32, worker_count=worker_count)
+
+    # Evaluation budget is split among workers as evenly as possible
+    def test_split_finish_control_splits_evaluation_budget(self):
+        # Arrange
+        optimizer = MonteCarloOptimizerParallel(FinishControl(criteria='evaluations & seconds',
+                evaluations_max=10, seconds_max=5), self.problem, self.solution_template, worker_count=4)
+        # Act
+        finish_controls = optimizer.split_finish_control()
+        # Assert
+        self.assertEqual([fc.evaluations_max for fc in finish_controls], [3, 3, 2, 2])
+        self.assertTrue(all(fc.seconds_max == 5 and fc.check_evaluations for fc in finish_controls))
+
+    # Number of workers is reduced when budget is smaller than it
+    def test_split_finish_control_reduces_workers_for_small_budget(self):
+        # Arrange
+        optimizer = MonteCarloOptimizerParallel(FinishControl(criteria='iterations', iterations_max=2),
+                self.problem, self.solution_template, worker_count=4)
+        # Act
+        finish_controls = optimizer.split_finish_control()
+        # Assert
+        self.assertEqual([fc.iterations_max for fc in finish_controls], [1, 1])
+
+    # Workers together spend the whole budget, and the best of their solutions is kept
+    def test_optimize_with_workers_reduces_to_best_solution(self):
+        # Arrange
+        optimizer = self.create_optimizer(worker_count=3)
+        # Act
+        best = optimizer.optimize()
+        # Assert
+        self.assertEqual(optimizer.evaluation, 400)
+        self.assertEqual(best.fitness_value, sum(i + 1 for i in best.representation.findall('0b1')))
+        self.assertGreaterEqual(best.fitness_value, 60)
+
+    # Execution is reproducible for the same seed and number of workers
+    def test_optimize_is_reproducible_for_same_seed(self):
+        # Arrange
+        optimizer1 = self.create_optimizer(worker_count=2, random_seed=7)
+        optimizer2 = self.create_optimizer(worker_count=2, random_seed=7)
+        # Act
+        best1 = optimizer1.optimize()
+        best2 = optimizer2.optimize()
+        # Assert
+        self.assertEqual(best1.representation, best2.representation)
+
+    # Best solution of the previous execution is not kept by the next one
+    def test_optimize_again_should_ignore_previous_best_solution(self):
+        # Arrange
+        optimizer = self.create_optimizer(worker_count=2)
+        optimizer.optimize()
+        stale_best = self.solution_template.copy()
+        stale_best.fitness_value = 1000
+        optimizer.best_solution = stale_best
+        # Act
+        best = optimizer.optimize()
+        # Assert
+        self.assertEqual(best.fitness_value, sum(i + 1 for i in best.representation.findall('0b1')))
+        self.assertLessEqual(optimizer.evaluation_best_found, optimizer.evaluation)
+
+    # Single worker executed within current process does not change the state of module random
+    def test_optimize_with_single_worker_should_keep_random_state(self):
+        # Arrange
+        optimizer = self.create_optimizer(worker_count=1)
+        random.seed(123)
+        random_state = random.getstate()
+        # Act
+        optimizer.optimize()
+        # Assert
+        self.assertEqual(random.getstate(), random_state)
+
+    # Non-positive number of workers raises ValueError
+    def test_non_positive_worker_count_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.create_optimizer(worker_count=0)
+
+    # Construction tuple and copy keep number of workers
+    def test_from_construction_tuple_and_copy_keep_worker_count(self):
+        # Arrange
+        construction_tuple = MonteCarloOptimizerParallelConstructionParameters(FinishControl(), self.problem,
+                self.solution_template, worker_count=3)
+        # Act
+        optimizer = MonteCarloOptimizerParallel.from_construction_tuple(construction_tuple)
+        optimizer_copy = optimizer.copy()
+        # Assert
+        self.assertIsInstance(optimizer_copy, MonteCarloOptimizerParallel)
+        self.assertEqual(optimizer_copy.worker_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,7 @@ from uo.utils.logger import logger
 
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
+from uo.solution.representation_sampler import RepresentationSampler
 
 from uo.algorithm.output_control import OutputControl
 from uo.algorithm.metaheuristic.finish_control import FinishControl
@@ -63,6 +64,7 @@ class PopulationBasedMetaheuristic(Metaheuristic, metaclass=ABCMeta):
                 problem=problem,
                 solution_template=solution_template)
         self.__current_population:Optional[list[Solution]] =  None
+        self.__representation_sampler:Optional[RepresentationSampler] = None
 
     @abstractmethod
     def copy(self):
@@ -95,6 +97,43 @@ class PopulationBasedMetaheuristic(Metaheuristic, metaclass=ABCMeta):
             raise TypeError('Parameter \'current_population\' must have type \'list[Solution]\' or be None.')
         self.__current_population = value
 
+    @property
+    def representation_sampler(self)->Optional[RepresentationSampler]:
+        """
+        Property getter for the sampler that initializes the population
+
+        :return: sampler of representations for initial population, or `None` if members are initialized by 
+        `init_random`
+        :rtype: `Optional[RepresentationSampler]`
+        """
+        return self.__representation_sampler
+
+    @representation_sampler.setter
+    def representation_sampler(self, value:Optional[RepresentationSampler])->None:
+        """
+        Property setter for the sampler that initializes the population - e.g. low-discrepancy sampler, so the 
+        initial population covers the space evenly
+
+        :param Optional[RepresentationSampler] value: sampler of representations for initial population
+        """
+        if not isinstance(value, RepresentationSampler) and value is not None:
+            raise TypeError('Parameter \'representation_sampler\' must have type \'RepresentationSampler\' or be None.')
+        self.__representation_sampler = value
+
+    def init_population_randomly(self, population:list[Solution])->None:
+        """
+        Random initialization of the population members - by representation sampler, if it is set, or by 
+        `init_random` of each member otherwise
+
+        :param list[Solution] population: members of the population
+        """
+        if self.__representation_sampler is None:
+            for solution in population:
+                solution.init_random(self.problem)
+            return
+        for solution, representation in zip(population, self.__representation_sampler.sample(len(population))):
+            solution.init_from(representation, self.problem)
+
     def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
             group_end:str ='}')->str:
         """
@@ -9,6 +9,7 @@ sys.path.append(directory.parent)
 sys.path.append(directory.parent.parent)
 sys.path.append(directory.parent.parent.parent)
 
+from typing import Optional
 from uo.solution.solution import Solution
 from abc import ABC, abstractmethod
 
@@ -24,3 +25,25 @@ class SaNeighborhood(ABC):
         Must be implemented by subclasses.
         """
         pass
+
+    def propose_neighbor(self, solution: Solution, problem) -> Solution:
+        """
+        Generate a neighbor solution for the given solution and problem, without evaluating it, so neighbors of
+        many solutions can be evaluated together.
+        Default implementation returns neighbor generated by generate_neighbor, that is already evaluated.
+        """
+        return self.generate_neighbor(solution, problem)
+
+    def apply_move(self, solution: Solution, problem) -> Optional[list[int]]:
+        """
+        Change the given solution in place by a random move, without evaluating it.
+        Returns positions changed by the move, that are needed to undo it, or None if neighborhood does not
+        support in-place moves (default implementation).
+        """
+        return None
+
+    def undo_move(self, solution: Solution, move: list[int]) -> None:
+        """
+        Revert the move previously applied to the given solution by apply_move.
+        """
+        raise NotImplementedError
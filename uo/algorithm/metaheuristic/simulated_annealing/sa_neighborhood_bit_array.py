@@ -6,6 +6,8 @@ that represents Simulated Annealing neighborhood support for bit array-encoded s
 
 import random
 from copy import deepcopy
+from typing import Optional
+from uo.utils.dont_look_bits import DontLookBits
 from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood import SaNeighborhood
 from uo.solution.solution import Solution
 from uo.problem.problem import Problem
@@ -15,14 +17,21 @@ class SaNeighborhoodBitArray(SaNeighborhood):
     Neighborhood structure for bit array solutions for Simulated Annealing.
     Generates a neighbor by flipping k random bits in the bit array representation,
     similar to VNS shaking.
+    Optionally, don't-look bits restrict flips to positions that have not been rejected since the solution
+    last changed at them.
     """
-    def __init__(self, dimension: int, k: int = 1) -> None:
+    def __init__(self, dimension: int, k: int = 1, dont_look_bits: Optional[DontLookBits] = None) -> None:
         """
         :param dimension: Number of bits in the solution representation.
         :param k: Number of bits to flip in the neighbor (default 1 for SA).
+        :param dont_look_bits: Don't-look bits over positions of the representation (default None - not used).
         """
+        if dont_look_bits is not None and not isinstance(dont_look_bits, DontLookBits):
+            raise TypeError('Parameter \'dont_look_bits\' must be \'DontLookBits\' or \'None\'.')
         self.dimension = dimension
         self.k = k
+        self.dont_look_bits = dont_look_bits
+        self.__last_positions: list[int] = []
 
     def __copy__(self):
         return deepcopy(self)
@@ -30,44 +39,114 @@ class SaNeighborhoodBitArray(SaNeighborhood):
     def copy(self):
         return self.__copy__()
 
+    def propose_neighbor(self, solution: Solution, problem: Problem) -> Solution:
+        """
+        Generate a neighbor by flipping k random bits in the bit array representation, without evaluating it.
+        If no valid neighbor is found, a copy of the original is returned.
+        """
+        tries = 0
+        limit = 10000
+        candidates = self.__candidate_positions(solution)
+
+        neighbor = solution.copy()
+        # Assume neighbor.representation is a BitArray or list-like of bits
+        if candidates is None:
+            candidates = range(len(neighbor.representation))
+        while tries < limit:
+            positions = [random.choice(candidates) for _ in range(self.k)]
+            self.__last_positions = positions
+            self.__flip(neighbor.representation, positions)
+            if self.__is_valid(neighbor.representation):
+                return neighbor
+            # invalid neighbor is reverted in place, instead of copying the original again
+            self.__flip(neighbor.representation, positions)
+            tries += 1
+        # If no valid neighbor found, return a copy of the original
+        return neighbor
+
     def generate_neighbor(self, solution: Solution, problem: Problem, optimizer=None) -> Solution:
         """
         Generate a neighbor by flipping k random bits in the bit array representation.
         Optionally supports optimizer hooks for output/evaluation.
         """
+        neighbor = self.propose_neighbor(solution, problem)
+        if optimizer is not None:
+            if hasattr(optimizer, "write_output_values_if_needed"):
+                optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+        neighbor.evaluate(problem)
+        if optimizer is not None:
+            if hasattr(optimizer, "evaluation"):
+                optimizer.evaluation += 1
+            if hasattr(optimizer, "write_output_values_if_needed"):
+                optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+        return neighbor
+
+    def apply_move(self, solution: Solution, problem: Problem) -> Optional[list[int]]:
+        """
+        Flip k random bits of the bit array representation in place, without evaluating the solution.
+        Returns flipped positions, or empty list if no valid move is found.
+        """
         tries = 0
         limit = 10000
-
+        candidates = self.__candidate_positions(solution)
+        if candidates is None:
+            candidates = range(len(solution.representation))
         while tries < limit:
-            neighbor = solution.copy()
-            # Assume neighbor.representation is a BitArray or list-like of bits
-            bit_length = len(neighbor.representation)
-            positions = [random.choice(range(bit_length)) for _ in range(self.k)]
-            for pos in positions:
-                # Flip the bit at pos
-                if hasattr(neighbor.representation, "invert"):
-                    neighbor.representation.invert(pos)
-                else:
-                    # Fallback for list of ints (0/1)
-                    neighbor.representation[pos] = 1 - neighbor.representation[pos]
-            # Optional: check if bit count is valid (as in VNS)
-            if hasattr(neighbor.representation, "count"):
-                bit_count = neighbor.representation.count(1) if isinstance(neighbor.representation, list) else neighbor.representation.count(value=1)
-                if bit_count > self.dimension:
-                    tries += 1
-                    continue
-            if optimizer is not None:
-                if hasattr(optimizer, "write_output_values_if_needed"):
-                    optimizer.write_output_values_if_needed("before_evaluation", "b_e")
-            neighbor.evaluate(problem)
-            if optimizer is not None:
-                if hasattr(optimizer, "evaluation"):
-                    optimizer.evaluation += 1
-                if hasattr(optimizer, "write_output_values_if_needed"):
-                    optimizer.write_output_values_if_needed("after_evaluation", "a_e")
-            return neighbor
-        # If no valid neighbor found, return a copy of the original
-        return solution.copy()
+            positions = [random.choice(candidates) for _ in range(self.k)]
+            self.__last_positions = positions
+            self.__flip(solution.representation, positions)
+            if self.__is_valid(solution.representation):
+                return positions
+            self.__flip(solution.representation, positions)
+            tries += 1
+        return []
+
+    def undo_move(self, solution: Solution, move: list[int]) -> None:
+        """
+        Flip back bits flipped by apply_move.
+        """
+        self.__flip(solution.representation, move)
+
+    @staticmethod
+    def __flip(representation, positions: list[int]) -> None:
+        """
+        Flip the bits at given positions, in place.
+        """
+        for pos in positions:
+            # Flip the bit at pos
+            if hasattr(representation, "invert"):
+                representation.invert(pos)
+            else:
+                # Fallback for list of ints (0/1)
+                representation[pos] = 1 - representation[pos]
+
+    def __is_valid(self, representation) -> bool:
+        """
+        Check if bit count is valid (as in VNS).
+        """
+        if hasattr(representation, "count"):
+            bit_count = representation.count(1) if isinstance(representation, list) else representation.count(value=1)
+            if bit_count > self.dimension:
+                return False
+        return True
+
+    def __candidate_positions(self, solution: Solution) -> Optional[list[int]]:
+        """
+        Positions that can be flipped, according to don't-look bits.
+        If solution is the same as at the previous call, the previous neighbor has been rejected, so its flipped
+        positions are not looked at until solution changes at them.
+        """
+        if self.dont_look_bits is None:
+            return None
+        changed = self.dont_look_bits.synchronize(solution.representation)
+        if not changed and self.__last_positions:
+            self.dont_look_bits.set_bits(self.__last_positions)
+        candidates = self.dont_look_bits.looking_positions()
+        if not candidates:
+            # every position has been rejected, so search starts looking at all of them again
+            self.dont_look_bits.reset_all()
+            candidates = self.dont_look_bits.looking_positions()
+        return candidates
 
     def string_rep(self, delimiter: str, indentation: int = 0, indentation_symbol: str = '', group_start: str = '{',
                   group_end: str = '}') -> str:
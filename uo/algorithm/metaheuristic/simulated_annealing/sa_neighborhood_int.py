@@ -6,6 +6,7 @@ that represents Simulated Annealing neighborhood support for integer-encoded sol
 
 import random
 from copy import deepcopy
+from typing import Optional
 from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood import SaNeighborhood
 from uo.solution.solution import Solution
 from uo.problem.problem import Problem
@@ -30,10 +31,10 @@ class SaNeighborhoodInt(SaNeighborhood):
     def copy(self):
         return self.__copy__()
 
-    def generate_neighbor(self, solution: Solution, problem: Problem, optimizer=None) -> Solution:
+    def propose_neighbor(self, solution: Solution, problem: Problem) -> Solution:
         """
-        Generate a neighbor by flipping k random bits in the integer representation.
-        Optionally supports optimizer hooks for output/evaluation.
+        Generate a neighbor by flipping k random bits in the integer representation, without evaluating it.
+        If no valid neighbor is found, a copy of the original is returned.
         """
         tries = 0
         limit = 10000
@@ -49,19 +50,55 @@ class SaNeighborhoodInt(SaNeighborhood):
             if neighbor.representation.bit_count() > self.dimension:
                 tries += 1
                 continue
-            if optimizer is not None:
-                if hasattr(optimizer, "write_output_values_if_needed"):
-                    optimizer.write_output_values_if_needed("before_evaluation", "b_e")
-            neighbor.evaluate(problem)
-            if optimizer is not None:
-                if hasattr(optimizer, "evaluation"):
-                    optimizer.evaluation += 1
-                if hasattr(optimizer, "write_output_values_if_needed"):
-                    optimizer.write_output_values_if_needed("after_evaluation", "a_e")
             return neighbor
         # If no valid neighbor found, return a copy of the original
         return solution.copy()
 
+    def generate_neighbor(self, solution: Solution, problem: Problem, optimizer=None) -> Solution:
+        """
+        Generate a neighbor by flipping k random bits in the integer representation.
+        Optionally supports optimizer hooks for output/evaluation.
+        """
+        neighbor = self.propose_neighbor(solution, problem)
+        if optimizer is not None:
+            if hasattr(optimizer, "write_output_values_if_needed"):
+                optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+        neighbor.evaluate(problem)
+        if optimizer is not None:
+            if hasattr(optimizer, "evaluation"):
+                optimizer.evaluation += 1
+            if hasattr(optimizer, "write_output_values_if_needed"):
+                optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+        return neighbor
+
+    def apply_move(self, solution: Solution, problem: Problem) -> Optional[list[int]]:
+        """
+        Flip k random bits of the integer representation in place, without evaluating the solution.
+        Returns flipped positions, or empty list if no valid move is found.
+        """
+        tries = 0
+        limit = 10000
+        while tries < limit:
+            positions = [random.choice(range(self.dimension)) for _ in range(self.k)]
+            mask = 0
+            for p in positions:
+                mask |= 1 << p
+            solution.representation ^= mask
+            if solution.representation.bit_count() <= self.dimension:
+                return positions
+            solution.representation ^= mask
+            tries += 1
+        return []
+
+    def undo_move(self, solution: Solution, move: list[int]) -> None:
+        """
+        Flip back bits flipped by apply_move.
+        """
+        mask = 0
+        for p in move:
+            mask |= 1 << p
+        solution.representation ^= mask
+
     def string_rep(self, delimiter: str, indentation: int = 0, indentation_symbol: str = '', group_start: str = '{',
                   group_end: str = '}') -> str:
         """
@@ -109,6 +109,58 @@ class SaOptimizer(SingleSolutionMetaheuristic):
             construction_tuple.additional_statistics_control
         )
 
+    def copy(self):
+        """
+        Copy the `SaOptimizer`
+
+        :return: new `SaOptimizer` instance with the same properties
+        :rtype: `SaOptimizer`
+        """
+        fc:Optional[FinishControl] = None
+        if self.finish_control is not None:
+            fc = self.finish_control.copy()
+        pr:Optional[Problem] = None
+        if self.problem is not None:
+            pr = self.problem.copy()
+        st:Optional[Solution] = None
+        if self.solution_template is not None:
+            st = self.solution_template.copy()
+        oc:Optional[OutputControl] = None
+        if self.output_control is not None:
+            oc = self.output_control.copy()
+        asc:Optional[AdditionalStatisticsControl] = None
+        if self.additional_statistics_control is not None:
+            asc = self.additional_statistics_control.copy()
+        obj:SaOptimizer = SaOptimizer(self.__sa_neighborhood.copy(),
+                                self.__sa_temperature.copy(),
+                                fc,
+                                pr,
+                                st,
+                                oc,
+                                self.random_seed,
+                                asc)
+        return obj
+
+    @property
+    def sa_neighborhood(self) -> SaNeighborhood:
+        """
+        Property getter for the neighborhood structure
+
+        :return: neighborhood structure
+        :rtype: `SaNeighborhood`
+        """
+        return self.__sa_neighborhood
+
+    @property
+    def sa_temperature(self) -> SaTemperature:
+        """
+        Property getter for the temperature method
+
+        :return: temperature method
+        :rtype: `SaTemperature`
+        """
+        return self.__sa_temperature
+
     def init(self) -> None:
         """
         Initialization of the SA algorithm
@@ -121,30 +173,53 @@ class SaOptimizer(SingleSolutionMetaheuristic):
         self.best_solution = self.current_solution
         self.iteration = 0
 
+    def __accept_as_current(self) -> None:
+        """
+        Updates the best solution, after current solution is changed
+        """
+        if self.current_solution.is_better(self.best_solution, self.problem):
+            self.update_additional_statistics_if_required(self.current_solution)
+            self.best_solution = self.current_solution
+
     def main_loop_iteration(self) -> None:
         """
-        One iteration within main loop of the SA algorithm
+        One iteration within main loop of the SA algorithm. Move is applied to the current solution in place,
+        evaluated, and either kept or reverted, so no solution is allocated, unless the best solution is improved
+        or the neighborhood does not support in-place moves.
         """
         current_temperature = self.__sa_temperature.calculate(self.iteration)
         self.iteration += 1
 
-        # Generate a new feasible neighbor solution
-        neighbor_solution = self.__sa_neighborhood.generate_neighbor(self.current_solution, self.problem, optimizer=self)
-
-        # Compare solutions
-        delta = neighbor_solution.value - self.current_solution.value
-
-        # If new solution is better, accept it
-        if neighbor_solution.is_better_than(self.current_solution):
-            self.current_solution = neighbor_solution
-            if neighbor_solution.is_better_than(self.best_solution):
-                self.best_solution = neighbor_solution
-        else:
-            # If new solution is worse, accept with probability
-            if random.random() < current_temperature:
+        move = self.__sa_neighborhood.apply_move(self.current_solution, self.problem)
+        if move is None:
+            # Neighborhood without in-place moves generates a new evaluated neighbor solution
+            neighbor_solution = self.__sa_neighborhood.generate_neighbor(self.current_solution, self.problem,
+                    optimizer=self)
+            if neighbor_solution.is_better(self.current_solution, self.problem) \
+                    or random.random() < current_temperature:
                 self.current_solution = neighbor_solution
+                self.__accept_as_current()
+            return
 
+        # Keep quality of the current solution, so rejected move can be reverted without evaluation
+        fitness_value = self.current_solution.fitness_value
+        objective_value = self.current_solution.objective_value
+        is_feasible = self.current_solution.is_feasible
+        self.write_output_values_if_needed("before_evaluation", "b_e")
         self.evaluation += 1
+        self.current_solution.evaluate_incrementally(self.problem, move)
+        self.write_output_values_if_needed("after_evaluation", "a_e")
+
+        # If new solution is better, accept it, and if it is worse, accept it with probability
+        is_improved = fitness_value is None or (self.current_solution.fitness_value is not None
+                and self.current_solution.fitness_value > fitness_value)
+        if is_improved or random.random() < current_temperature:
+            self.__accept_as_current()
+            return
+        self.__sa_neighborhood.undo_move(self.current_solution, move)
+        self.current_solution.fitness_value = fitness_value
+        self.current_solution.objective_value = objective_value
+        self.current_solution.is_feasible = is_feasible
 
     def string_rep(self, delimiter: str, indentation: int = 0, indentation_symbol: str = '', group_start: str = '{',
                   group_end: str = '}') -> str:
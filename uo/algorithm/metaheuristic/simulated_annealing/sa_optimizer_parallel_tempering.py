@@ -0,0 +1,415 @@
+"""
+..  _py_sa_optimizer_parallel_tempering:
+
+The :mod:`~uo.algorithm.metaheuristic.simulated_annealing.sa_optimizer_parallel_tempering` contains class
+:class:`~uo.algorithm.metaheuristic.simulated_annealing.sa_optimizer_parallel_tempering.SaOptimizerParallelTempering`,
+that represents multi-chain simulated annealing with replica exchange between chains (parallel tempering).
+"""
+
+from pathlib import Path
+
+directory = Path(__file__).resolve()
+
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+import math
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from typing import Optional
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+
+from uo.algorithm.output_control import OutputControl
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.additional_statistics_control import AdditionalStatisticsControl
+
+from uo.algorithm.metaheuristic.single_solution_metaheuristic import SingleSolutionMetaheuristic
+
+from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood import SaNeighborhood
+
+def evaluate_solutions(solutions:list[Solution], problem:Problem)->list[Solution]:
+    """
+    Evaluates all given solutions
+
+    :param list[Solution] solutions: solutions to be evaluated
+    :param `Problem` problem: problem that is solved
+    :return: evaluated solutions
+    :rtype: list[Solution]
+    """
+    for solution in solutions:
+        solution.evaluate(problem)
+    return solutions
+
+@dataclass
+class SaOptimizerParallelTemperingConstructionParameters:
+    """
+        Instance of the class :class:`~uo.algorithm.metaheuristic.simulated_annealing.sa_optimizer_parallel_tempering.
+        SaOptimizerParallelTemperingConstructionParameters` represents constructor parameters for parallel tempering
+        SA algorithm.
+    """
+    sa_neighborhood: SaNeighborhood = None
+    temperatures: Optional[list[float]] = None
+    finish_control: Optional[FinishControl] = None
+    problem: Problem = None
+    solution_template: Optional[Solution] = None
+    output_control: Optional[OutputControl] = None
+    random_seed: Optional[int] = None
+    additional_statistics_control: Optional[AdditionalStatisticsControl] = None
+    swap_interval: int = 1
+    worker_count: int = 1
+
+class SaOptimizerParallelTempering(SingleSolutionMetaheuristic):
+    """
+    Instance of the class :class:`~uo.algorithm.metaheuristic.simulated_annealing.SaOptimizerParallelTempering`
+    runs many SA chains, each at its own fixed temperature, in lock-step. In each iteration, neighbors of all chains
+    are generated and evaluated together, and each chain accepts its neighbor by Metropolis criterion. Periodically,
+    chains at adjacent temperatures exchange their solutions (replica exchange).
+    """
+    def __init__(self,
+            sa_neighborhood: SaNeighborhood,
+            temperatures: list[float],
+            finish_control: FinishControl,
+            problem: Problem,
+            solution_template: Optional[Solution],
+            output_control: Optional[OutputControl] = None,
+            random_seed: Optional[int] = None,
+            additional_statistics_control: Optional[AdditionalStatisticsControl] = None,
+            swap_interval: int = 1,
+            worker_count: int = 1
+        ) -> None:
+        """
+        Create new instance of class :class:`~uo.algorithm.metaheuristic.simulated_annealing.SaOptimizerParallelTempering`.
+
+        :param `SaNeighborhood` sa_neighborhood: neighborhood structure for generating neighbors
+        :param list[float] temperatures: positive temperatures of the chains, in ascending order
+        :param `FinishControl` finish_control: structure that control finish criteria for metaheuristic execution
+        :param `Problem` problem: problem to be solved
+        :param `Solution` solution_template: initial solution of the problem
+        :param `OutputControl` output_control: structure that controls output
+        :param int random_seed: random seed for metaheuristic execution
+        :param `AdditionalStatisticsControl` additional_statistics_control: structure that controls additional
+        statistics obtained during metaheuristic execution
+        :param int swap_interval: number of iterations between two replica exchange steps
+        :param int worker_count: number of worker processes that evaluate neighbors - if `1`, neighbors are
+        evaluated within current process
+        """
+        super().__init__(name="sa_pt",
+                finish_control=finish_control,
+                random_seed=random_seed,
+                additional_statistics_control=additional_statistics_control,
+                output_control=output_control,
+                problem=problem,
+                solution_template=solution_template)
+        if not isinstance(sa_neighborhood, SaNeighborhood):
+            raise TypeError('Parameter \'sa_neighborhood\' must be \'SaNeighborhood\'.')
+        if not isinstance(temperatures, list):
+            raise TypeError('Parameter \'temperatures\' must be \'list\'.')
+        if len(temperatures) == 0:
+            raise ValueError('Parameter \'temperatures\' must not be empty.')
+        if any(t <= 0 for t in temperatures):
+            raise ValueError('Temperatures must be positive.')
+        if sorted(temperatures) != temperatures:
+            raise ValueError('Temperatures must be in ascending order.')
+        if not isinstance(swap_interval, int):
+            raise TypeError('Parameter \'swap_interval\' must be \'int\'.')
+        if swap_interval <= 0:
+            raise ValueError('Parameter \'swap_interval\' must be positive.')
+        if not isinstance(worker_count, int):
+            raise TypeError('Parameter \'worker_count\' must be \'int\'.')
+        if worker_count <= 0:
+            raise ValueError('Parameter \'worker_count\' must be positive.')
+        self.__sa_neighborhood: SaNeighborhood = sa_neighborhood
+        self.__temperatures: list[float] = list(temperatures)
+        self.__swap_interval: int = swap_interval
+        self.__worker_count: int = worker_count
+        self.__chains: list[Solution] = []
+        self.__swaps_attempted: int = 0
+        self.__swaps_accepted: int = 0
+        self.__executor: Optional[Executor] = None
+
+    @classmethod
+    def from_construction_tuple(cls,
+            construction_tuple: SaOptimizerParallelTemperingConstructionParameters):
+        """
+        Additional constructor, that creates new instance of class
+        :class:`~uo.algorithm.metaheuristic.simulated_annealing.SaOptimizerParallelTempering`.
+
+        :param `SaOptimizerParallelTemperingConstructionParameters` construction_tuple: tuple with all constructor
+        parameters
+        """
+        return cls(
+            construction_tuple.sa_neighborhood,
+            construction_tuple.temperatures,
+            construction_tuple.finish_control,
+            construction_tuple.problem,
+            construction_tuple.solution_template,
+            construction_tuple.output_control,
+            construction_tuple.random_seed,
+            construction_tuple.additional_statistics_control,
+            construction_tuple.swap_interval,
+            construction_tuple.worker_count
+        )
+
+    def copy(self):
+        """
+        Copy the `SaOptimizerParallelTempering`
+
+        :return: new `SaOptimizerParallelTempering` instance with the same properties
+        :rtype: `SaOptimizerParallelTempering`
+        """
+        fc:Optional[FinishControl] = None
+        if self.finish_control is not None:
+            fc = self.finish_control.copy()
+        pr:Optional[Problem] = None
+        if self.problem is not None:
+            pr = self.problem.copy()
+        st:Optional[Solution] = None
+        if self.solution_template is not None:
+            st = self.solution_template.copy()
+        oc:Optional[OutputControl] = None
+        if self.output_control is not None:
+            oc = self.output_control.copy()
+        asc:Optional[AdditionalStatisticsControl] = None
+        if self.additional_statistics_control is not None:
+            asc = self.additional_statistics_control.copy()
+        obj:SaOptimizerParallelTempering = SaOptimizerParallelTempering(self.__sa_neighborhood.copy(),
+                                list(self.__temperatures),
+                                fc,
+                                pr,
+                                st,
+                                oc,
+                                self.random_seed,
+                                asc,
+                                self.__swap_interval,
+                                self.__worker_count)
+        return obj
+
+    @property
+    def sa_neighborhood(self)->SaNeighborhood:
+        """
+        Property getter for the neighborhood structure
+
+        :return: neighborhood structure
+        :rtype: `SaNeighborhood`
+        """
+        return self.__sa_neighborhood
+
+    @property
+    def temperatures(self)->list[float]:
+        """
+        Property getter for the temperatures of the chains
+
+        :return: temperatures of the chains, in ascending order
+        :rtype: list[float]
+        """
+        return self.__temperatures
+
+    @property
+    def swap_interval(self)->int:
+        """
+        Property getter for the number of iterations between two replica exchange steps
+
+        :return: number of iterations between two replica exchange steps
+        :rtype: int
+        """
+        return self.__swap_interval
+
+    @property
+    def worker_count(self)->int:
+        """
+        Property getter for the number of worker processes
+
+        :return: number of worker processes
+        :rtype: int
+        """
+        return self.__worker_count
+
+    @property
+    def chains(self)->list[Solution]:
+        """
+        Property getter for the current solutions of the chains
+
+        :return: current solutions of the chains, ordered by temperature
+        :rtype: list[Solution]
+        """
+        return self.__chains
+
+    @property
+    def swaps_attempted(self)->int:
+        """
+        Property getter for the number of attempted replica exchanges
+
+        :return: number of attempted replica exchanges
+        :rtype: int
+        """
+        return self.__swaps_attempted
+
+    @property
+    def swaps_accepted(self)->int:
+        """
+        Property getter for the number of accepted replica exchanges
+
+        :return: number of accepted replica exchanges
+        :rtype: int
+        """
+        return self.__swaps_accepted
+
+    def evaluate_neighbors(self, neighbors:list[Solution])->list[Solution]:
+        """
+        Evaluates neighbors of all chains together - either within current process, or split among worker
+        processes. Can be overridden for vectorized evaluation of the problem.
+
+        :param list[Solution] neighbors: neighbors to be evaluated, one for each chain
+        :return: evaluated neighbors, in the same order
+        :rtype: list[Solution]
+        """
+        self.write_output_values_if_needed("before_evaluation", "b_e")
+        self.evaluation += len(neighbors)
+        if self.__worker_count == 1 or len(neighbors) == 1:
+            evaluated:list[Solution] = evaluate_solutions(neighbors, self.problem)
+        else:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.__worker_count)
+            chunk_count:int = min(self.__worker_count, len(neighbors))
+            bounds:list[int] = [len(neighbors) * i // chunk_count for i in range(chunk_count + 1)]
+            futures:list = [self.__executor.submit(evaluate_solutions, neighbors[bounds[i]:bounds[i+1]],
+                    self.problem) for i in range(chunk_count)]
+            evaluated:list[Solution] = [s for future in futures for s in future.result()]
+        self.write_output_values_if_needed("after_evaluation", "a_e")
+        return evaluated
+
+    def shutdown(self)->None:
+        """
+        Stops worker processes, if they are started
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __update_best_if_better(self, solution:Solution)->None:
+        """
+        Replaces the best solution with the given one, if it is better
+        """
+        if solution.is_better(self.best_solution, self.problem):
+            self.update_additional_statistics_if_required(solution)
+            self.best_solution = solution
+
+    def init(self) -> None:
+        """
+        Initialization of the parallel tempering SA algorithm
+        """
+        self.iteration = 0
+        self.evaluation = 0
+        self.__swaps_attempted = 0
+        self.__swaps_accepted = 0
+        chains:list[Solution] = []
+        for _ in self.__temperatures:
+            chain:Solution = self.solution_template.copy()
+            chain.copy_from(self.solution_template)
+            chain.init_random(self.problem)
+            chains.append(chain)
+        self.__chains = self.evaluate_neighbors(chains)
+        self.current_solution = self.__chains[0]
+        self.best_solution = self.__chains[0]
+        for chain in self.__chains[1:]:
+            self.__update_best_if_better(chain)
+
+    @staticmethod
+    def metropolis_accepts(fitness_delta:float, temperature:float)->bool:
+        """
+        Metropolis acceptance criterion - better neighbor is always accepted, and worse neighbor is accepted
+        with probability `exp(fitness_delta/temperature)`
+
+        :param float fitness_delta: fitness of the neighbor minus fitness of the current solution
+        :param float temperature: temperature of the chain
+        :return: if neighbor is accepted
+        :rtype: bool
+        """
+        if fitness_delta >= 0:
+            return True
+        return random.random() < math.exp(fitness_delta / temperature)
+
+    def exchange_replicas(self)->None:
+        """
+        Tries to exchange solutions of chains at adjacent temperatures. Pairs are alternated between iterations,
+        and exchange is accepted with probability `exp((f_j - f_i) * (1/T_i - 1/T_j))`
+        """
+        start:int = (self.iteration // self.__swap_interval) % 2
+        for i in range(start, len(self.__chains) - 1, 2):
+            j:int = i + 1
+            self.__swaps_attempted += 1
+            exponent:float = (self.__chains[j].fitness_value - self.__chains[i].fitness_value) * \
+                    (1 / self.__temperatures[i] - 1 / self.__temperatures[j])
+            if exponent >= 0 or random.random() < math.exp(exponent):
+                self.__chains[i], self.__chains[j] = self.__chains[j], self.__chains[i]
+                self.__swaps_accepted += 1
+
+    def main_loop_iteration(self) -> None:
+        """
+        One iteration within main loop of the parallel tempering SA algorithm
+        """
+        self.iteration += 1
+        neighbors:list[Solution] = [self.__sa_neighborhood.propose_neighbor(chain, self.problem)
+                for chain in self.__chains]
+        neighbors = self.evaluate_neighbors(neighbors)
+        for i, neighbor in enumerate(neighbors):
+            if self.metropolis_accepts(neighbor.fitness_value - self.__chains[i].fitness_value,
+                    self.__temperatures[i]):
+                self.__chains[i] = neighbor
+                self.__update_best_if_better(neighbor)
+        if len(self.__chains) > 1 and self.iteration % self.__swap_interval == 0:
+            self.exchange_replicas()
+        self.current_solution = self.__chains[0]
+
+    def __getstate__(self)->dict:
+        """
+        State of the instance for pickling, without worker processes
+        """
+        state:dict = self.__dict__.copy()
+        state['_SaOptimizerParallelTempering__executor'] = None
+        return state
+
+    def string_rep(self, delimiter: str, indentation: int = 0, indentation_symbol: str = '', group_start: str = '{',
+                  group_end: str = '}') -> str:
+        """
+        String representation of the parallel tempering SA Optimizer instance.
+        """
+        s = delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_start
+        s = super().string_rep(delimiter, indentation, indentation_symbol, '', '')
+        s += delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'temperatures=' + str(self.__temperatures) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'swap_interval=' + str(self.__swap_interval) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += 'worker_count=' + str(self.__worker_count) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += '__sa_neighborhood=' + str(self.__sa_neighborhood) + delimiter
+        for _ in range(0, indentation):
+            s += indentation_symbol
+        s += group_end
+        return s
+
+    def __str__(self) -> str:
+        s = self.string_rep('|')
+        return s
+
+    def __repr__(self) -> str:
+        s = self.string_rep('\n')
+        return s
+
+    def __format__(self, spec: str) -> str:
+        return self.string_rep('\n', 0, '', '{', '}')
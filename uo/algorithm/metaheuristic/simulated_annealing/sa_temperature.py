@@ -9,6 +9,7 @@ sys.path.append(directory.parent)
 sys.path.append(directory.parent.parent)
 sys.path.append(directory.parent.parent.parent)
 
+from copy import deepcopy
 from abc import ABCMeta, abstractmethod
 
 class SaTemperature( metaclass=ABCMeta):
@@ -17,6 +18,15 @@ class SaTemperature( metaclass=ABCMeta):
         if not (0 <= initial_temp <= 1):
             raise ValueError("Initial temperature must be between 0 and 1.")
         self.initial_temperature = initial_temp
+
+    def copy(self):
+        """
+        Copy the current temperature method
+
+        :return: new instance with the same properties
+        :rtype: :class:`SaTemperature`
+        """
+        return deepcopy(self)
     
     @abstractmethod
     def calculate(k: int)->float:
@@ -0,0 +1,70 @@
+import unittest
+
+from bitstring import BitArray
+
+from uo.utils.dont_look_bits import DontLookBits
+
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+
+from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood_bit_array import SaNeighborhoodBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class TestSaNeighborhoodBitArray(unittest.TestCase):
+
+    # neighbor differs from solution in one position
+    def test_generate_neighbor_should_flip_one_position(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0000'))
+        neighborhood = SaNeighborhoodBitArray(4)
+        # Act
+        neighbor = neighborhood.generate_neighbor(solution, problem)
+        # Assert
+        self.assertEqual(neighbor.representation.count(1), 1)
+        self.assertEqual(solution.representation.bin, '0000')
+
+    # with don't-look bits, rejected positions are not flipped again while solution is not changed
+    def test_rejected_positions_should_not_be_flipped_again(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0000'))
+        neighborhood = SaNeighborhoodBitArray(4, dont_look_bits=DontLookBits(4))
+        # Act
+        neighbors = [neighborhood.generate_neighbor(solution, problem) for _ in range(4)]
+        # Assert
+        flipped = {n.representation.find('0b1')[0] for n in neighbors}
+        self.assertEqual(flipped, {0, 1, 2, 3})
+
+    # change of solution makes its changed positions available again
+    def test_accepted_neighbor_should_reset_changed_positions(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0000'))
+        dont_look_bits = DontLookBits(4)
+        neighborhood = SaNeighborhoodBitArray(4, dont_look_bits=dont_look_bits)
+        neighborhood.generate_neighbor(solution, problem)
+        neighborhood.generate_neighbor(solution, problem)
+        accepted = neighborhood.generate_neighbor(solution, problem)
+        # Act
+        neighborhood.generate_neighbor(accepted, problem)
+        # Assert
+        self.assertTrue(dont_look_bits.is_looking(accepted.representation.find('0b1')[0]))
+
+    # move is applied in place and undone by flipping the same positions
+    def test_apply_and_undo_move_should_restore_representation(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0110'))
+        neighborhood = SaNeighborhoodBitArray(4)
+        # Act
+        move = neighborhood.apply_move(solution, problem)
+        changed = solution.representation.bin
+        neighborhood.undo_move(solution, move)
+        # Assert
+        self.assertEqual(len(move), 1)
+        self.assertNotEqual(changed, '0110')
+        self.assertEqual(solution.representation.bin, '0110')
+
+if __name__ == '__main__':
+    unittest.main()
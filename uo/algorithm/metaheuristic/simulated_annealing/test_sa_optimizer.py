@@ -11,6 +11,12 @@ from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood import SaNei
 from uo.algorithm.metaheuristic.simulated_annealing.sa_temperature import SaTemperature
 from uo.problem.problem_void_min_so import ProblemVoidMinSO
 from uo.solution.solution_void_representation_int import SolutionVoidInt
+from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood_bit_array import SaNeighborhoodBitArray
+
+from bitstring import BitArray
+
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
 
 class TestSaOptimizer(unittest.TestCase):
 
@@ -329,5 +335,72 @@ class TestSaOptimizer(unittest.TestCase):
                 random_seed=random_seed
             )
 
+class TestSaOptimizerMoves(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemVoidMinSO("a problem", False)
+        self.sa_temperature_stub = mocker.MagicMock(spec=SaTemperature)
+        self.sa_temperature_stub.calculate.return_value = 0.0
+        self.sa_optimizer = SaOptimizer(
+            sa_neighborhood=SaNeighborhoodBitArray(8),
+            sa_temperature=self.sa_temperature_stub,
+            finish_control=FinishControl(criteria='iterations', iterations_max=300),
+            problem=self.problem,
+            solution_template=SolutionWeightedOnesBitArray(BitArray(length=8))
+        )
+
+    # rejected move is reverted in place, together with quality of the current solution
+    def test_rejected_move_should_be_reverted(self):
+        # Arrange
+        self.sa_optimizer.execution_started = datetime.now()
+        self.sa_optimizer.init()
+        current = self.sa_optimizer.current_solution
+        current.representation = BitArray(bin='11111111')
+        current.evaluate(self.problem)
+        # Act
+        self.sa_optimizer.main_loop_iteration()
+        # Assert
+        self.assertIs(self.sa_optimizer.current_solution, current)
+        self.assertEqual(current.representation.bin, '11111111')
+        self.assertEqual(current.fitness_value, 36)
+        self.assertEqual(self.sa_optimizer.evaluation, 2)
+
+    # accepted move is kept, without allocation of the neighbor solution
+    def test_accepted_move_should_be_kept_in_place(self):
+        # Arrange
+        self.sa_optimizer.execution_started = datetime.now()
+        self.sa_optimizer.init()
+        current = self.sa_optimizer.current_solution
+        # Act
+        with mocker.patch.object(SolutionWeightedOnesBitArray, 'copy', 
+                wraps=current.copy) as copy_mock:
+            self.sa_optimizer.main_loop_iteration()
+        # Assert
+        self.assertIs(self.sa_optimizer.current_solution, current)
+        self.assertEqual(current.representation.count(1), 1)
+        self.assertEqual(current.fitness_value, 
+                current.calculate_quality_directly(current.representation, self.problem).fitness_value)
+        # only the new best solution is copied
+        self.assertEqual(copy_mock.call_count, 1)
+
+    # optimization with in-place moves finds optimum of the easy problem
+    def test_optimize_should_find_optimum(self):
+        # Act
+        best = self.sa_optimizer.optimize()
+        # Assert
+        self.assertEqual(best.representation.bin, '11111111')
+        self.assertEqual(self.sa_optimizer.evaluation, 301)
+
+    # copy keeps neighborhood and temperature
+    def test_copy_should_keep_neighborhood_and_temperature(self):
+        # Arrange
+        self.sa_temperature_stub.copy.return_value = self.sa_temperature_stub
+        # Act
+        sa_optimizer_copy = self.sa_optimizer.copy()
+        # Assert
+        self.assertIsNot(sa_optimizer_copy, self.sa_optimizer)
+        self.assertEqual(sa_optimizer_copy.sa_neighborhood.dimension, 8)
+        self.assertIs(sa_optimizer_copy.sa_temperature, self.sa_temperature_stub)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,103 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.simulated_annealing.sa_neighborhood_bit_array import SaNeighborhoodBitArray
+from uo.algorithm.metaheuristic.simulated_annealing.sa_optimizer_parallel_tempering import \
+        SaOptimizerParallelTempering
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class TestSaOptimizerParallelTempering(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ProblemVoidMinSO("a problem", False)
+        self.solution_template = SolutionWeightedOnesBitArray(BitArray(length=8))
+        self.finish_control = FinishControl(criteria='iterations', iterations_max=200)
+
+    # chains are run in lock-step, each iteration evaluates one neighbor per chain
+    def test_optimize_should_evaluate_one_neighbor_per_chain_in_iteration(self):
+        # Arrange
+        optimizer = SaOptimizerParallelTempering(SaNeighborhoodBitArray(8), [0.5, 2.0, 8.0], 
+                FinishControl(criteria='iterations', iterations_max=10), self.problem, self.solution_template)
+        # Act
+        optimizer.optimize()
+        # Assert
+        self.assertEqual(optimizer.iteration, 10)
+        self.assertEqual(optimizer.evaluation, 3 + 3 * 10)
+        self.assertEqual(len(optimizer.chains), 3)
+
+    # search finds the optimum of the easy problem
+    def test_optimize_should_find_optimum(self):
+        # Arrange
+        optimizer = SaOptimizerParallelTempering(SaNeighborhoodBitArray(8), [0.1, 1.0, 10.0], 
+                self.finish_control, self.problem, self.solution_template)
+        # Act
+        best = optimizer.optimize()
+        # Assert
+        self.assertEqual(best.fitness_value, 36)
+        self.assertEqual(optimizer.best_solution.representation.bin, '11111111')
+
+    # replica exchange is attempted between adjacent chains, and better solution moves to colder chain
+    def test_exchange_replicas_should_move_better_solution_to_colder_chain(self):
+        # Arrange
+        optimizer = SaOptimizerParallelTempering(SaNeighborhoodBitArray(8), [1.0, 2.0], self.finish_control, 
+                self.problem, self.solution_template)
+        cold = SolutionWeightedOnesBitArray(BitArray(bin='00000001'))
+        hot = SolutionWeightedOnesBitArray(BitArray(bin='11110000'))
+        cold.evaluate(self.problem)
+        hot.evaluate(self.problem)
+        optimizer.chains.extend([cold, hot])
+        # Act
+        optimizer.exchange_replicas()
+        # Assert
+        self.assertIs(optimizer.chains[0], hot)
+        self.assertEqual(optimizer.swaps_attempted, 1)
+        self.assertEqual(optimizer.swaps_accepted, 1)
+
+    # worse neighbor is rejected when acceptance probability is lower than random number
+    def test_metropolis_should_reject_worse_neighbor_at_low_temperature(self):
+        with mocker.patch('random.random', return_value=0.5):
+            self.assertFalse(SaOptimizerParallelTempering.metropolis_accepts(-10, 1.0))
+            self.assertTrue(SaOptimizerParallelTempering.metropolis_accepts(-0.1, 1.0))
+            self.assertTrue(SaOptimizerParallelTempering.metropolis_accepts(3, 1.0))
+
+    # neighbors evaluated by worker processes are counted as evaluations
+    def test_worker_processes_should_evaluate_neighbors(self):
+        # Arrange
+        optimizer = SaOptimizerParallelTempering(SaNeighborhoodBitArray(8), [0.5, 1.0, 2.0, 4.0], 
+                FinishControl(criteria='iterations', iterations_max=5), self.problem, self.solution_template, 
+                worker_count=2)
+        # Act
+        optimizer.optimize()
+        optimizer.shutdown()
+        # Assert
+        self.assertEqual(optimizer.evaluation, 4 + 4 * 5)
+        for chain in optimizer.chains:
+            self.assertEqual(chain.fitness_value, 
+                    chain.calculate_quality_directly(chain.representation, self.problem).fitness_value)
+
+    # temperatures should be in ascending order
+    def test_unordered_temperatures_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            SaOptimizerParallelTempering(SaNeighborhoodBitArray(8), [2.0, 1.0], self.finish_control, 
+                    self.problem, self.solution_template)
+
+    # copy keeps parameters of parallel tempering
+    def test_copy_should_keep_parameters(self):
+        # Arrange
+        optimizer = SaOptimizerParallelTempering(SaNeighborhoodBitArray(8), [1.0, 2.0], self.finish_control, 
+                self.problem, self.solution_template, swap_interval=3)
+        # Act
+        optimizer_copy = optimizer.copy()
+        # Assert
+        self.assertIsNot(optimizer_copy, optimizer)
+        self.assertEqual(optimizer_copy.temperatures, [1.0, 2.0])
+        self.assertEqual(optimizer_copy.swap_interval, 3)
+
+if __name__ == '__main__':
+    unittest.main()
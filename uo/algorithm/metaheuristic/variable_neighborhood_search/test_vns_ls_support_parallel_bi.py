@@ -0,0 +1,169 @@
+import unittest
+import unittest.mock as mocker
+from datetime import datetime
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.quality_of_solution import QualityOfSolution
+from uo.solution.solution import Solution
+
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_optimizer import VnsOptimizer
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_parallel_bi_bit_array import \
+        VnsLocalSearchSupportParallelBestImprovementBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_parallel_bi_int import \
+        VnsLocalSearchSupportParallelBestImprovementInt
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+
+class SolutionWeightedOnesInt(Solution[int, str]):
+    """
+    Solution where fitness is weighted count of ones within 4 bits - bit 1 has negative weight
+    """
+
+    def __init__(self, representation:int)->None:
+        super().__init__(random_seed=42, fitness_value=None, fitness_values=None, objective_value=None, 
+                objective_values=None, is_feasible=False)
+        self.representation = representation
+
+    def copy(self)->'SolutionWeightedOnesInt':
+        obj = SolutionWeightedOnesInt(self.representation)
+        obj.copy_from(self)
+        return obj
+
+    def copy_from(self, original:Solution)->None:
+        super().copy_from(original)
+
+    def argument(self, representation:int)->str:
+        return bin(representation)
+
+    def init_random(self, problem:Problem)->None:
+        self.representation = 0
+
+    def init_from(self, representation:int, problem:Problem)->None:
+        self.representation = representation
+
+    def native_representation(self, representation_str:str)->int:
+        return int(representation_str, 2)
+
+    def calculate_quality_directly(self, representation:int, problem:Problem)->QualityOfSolution:
+        weights = [3, -5, 2, 1]
+        value:int = sum(w for i, w in enumerate(weights) if representation >> i & 1)
+        return QualityOfSolution(value, None, value, None, True)
+
+    def representation_distance_directly(self, representation_1:int, representation_2:int)->float:
+        return (representation_1 ^ representation_2).bit_count()
+
+    def __str__(self)->str:
+        return bin(self.representation)
+
+    def __repr__(self)->str:
+        return bin(self.representation)
+
+    def __format__(self, spec:str)->str:
+        return bin(self.representation)
+
+def create_optimizer_stub(finish_control:FinishControl, evaluation:int=0):
+    optimizer_stub = mocker.MagicMock(spec=VnsOptimizer)
+    type(optimizer_stub).k_min = mocker.PropertyMock(return_value=1)
+    type(optimizer_stub).k_max = mocker.PropertyMock(return_value=3)
+    type(optimizer_stub).finish_control = mocker.PropertyMock(return_value=finish_control)
+    optimizer_stub.should_finish.return_value = False
+    optimizer_stub.elapsed_seconds.return_value = 0.0
+    optimizer_stub.evaluation = evaluation
+    return optimizer_stub
+
+class TestVnsLocalSearchSupportParallelBestImprovementBitArray(unittest.TestCase):
+
+    # whole 2-flip neighborhood is scanned and the best neighbor is chosen
+    def test_local_search_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='00000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportParallelBestImprovementBitArray(5, worker_count=1, chunk_count=3)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation.bin, '00011')
+        self.assertEqual(solution.fitness_value, 9)
+        self.assertEqual(optimizer_stub.evaluation, 10)
+
+    # evaluation budget limits number of scanned neighbors
+    def test_local_search_should_honor_evaluation_budget(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='00000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='evaluations', evaluations_max=10), 
+                evaluation=7)
+        ls_support = VnsLocalSearchSupportParallelBestImprovementBitArray(5, worker_count=1)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(optimizer_stub.evaluation, 10)
+        # only combinations [0,1], [0,2] and [0,3] are scanned
+        self.assertEqual(solution.representation.bin, '10010')
+
+    # neighborhood scanned by worker processes gives the same result as scan within current process
+    def test_parallel_scan_should_give_same_result_as_serial_scan(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        serial_solution = SolutionWeightedOnesBitArray(BitArray(bin='0100101'))
+        serial_solution.evaluate(problem)
+        parallel_solution = serial_solution.copy()
+        serial_optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        parallel_optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        serial_support = VnsLocalSearchSupportParallelBestImprovementBitArray(7, worker_count=1)
+        parallel_support = VnsLocalSearchSupportParallelBestImprovementBitArray(7, worker_count=2)
+        # Act
+        serial_support.local_search(3, problem, serial_solution, serial_optimizer_stub)
+        parallel_support.local_search(3, problem, parallel_solution, parallel_optimizer_stub)
+        parallel_support.shutdown()
+        # Assert
+        self.assertEqual(parallel_solution.representation, serial_solution.representation)
+        self.assertEqual(parallel_optimizer_stub.evaluation, serial_optimizer_stub.evaluation)
+
+    # worker count should be positive
+    def test_non_positive_worker_count_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            VnsLocalSearchSupportParallelBestImprovementBitArray(5, worker_count=0)
+
+class TestVnsLocalSearchSupportParallelBestImprovementInt(unittest.TestCase):
+
+    # the best neighbor is chosen
+    def test_local_search_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesInt(0b0010)
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportParallelBestImprovementInt(4, worker_count=1)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation, 0b0001)
+        self.assertEqual(solution.fitness_value, 3)
+
+    # when there is no better neighbor, solution is not changed
+    def test_local_search_without_improvement_should_keep_solution(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesInt(0b1101)
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportParallelBestImprovementInt(4, worker_count=1)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(solution.representation, 0b1101)
+
+if __name__ == '__main__':
+    unittest.main()
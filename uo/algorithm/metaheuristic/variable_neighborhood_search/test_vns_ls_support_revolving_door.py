@@ -0,0 +1,127 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.problem.problem import Problem
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.quality_of_solution import QualityOfSolution
+
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_parallel_bi_bit_array import \
+        VnsLocalSearchSupportParallelBestImprovementBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_revolving_door_bit_array import \
+        VnsLocalSearchSupportRevolvingDoorBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_revolving_door_int import \
+        VnsLocalSearchSupportRevolvingDoorInt
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_parallel_bi import \
+        SolutionWeightedOnesInt
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_parallel_bi import \
+        create_optimizer_stub
+
+class SolutionWeightedOnesIncrementalBitArray(SolutionWeightedOnesBitArray):
+    """
+    Solution where fitness is weighted count of ones, with incremental quality calculation
+    """
+
+    def copy(self)->'SolutionWeightedOnesIncrementalBitArray':
+        obj = SolutionWeightedOnesIncrementalBitArray(self.representation.copy())
+        obj.copy_from(self)
+        return obj
+
+    def calculate_quality_incrementally(self, representation:BitArray, problem:Problem,
+            changed_positions:list[int])->QualityOfSolution:
+        value:int = self.objective_value
+        for i in changed_positions:
+            value += (i + 1) if representation[i] else -(i + 1)
+        return QualityOfSolution(value, None, value, None, True)
+
+class TestVnsLocalSearchSupportRevolvingDoorBitArray(unittest.TestCase):
+
+    # best neighbor is the same as with lexicographic traversal
+    def test_local_search_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0110100'))
+        solution.evaluate(problem)
+        expected = solution.copy()
+        VnsLocalSearchSupportParallelBestImprovementBitArray(7, worker_count=1).local_search(3, problem, 
+                expected, create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10)))
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportRevolvingDoorBitArray(7)
+        # Act
+        result = ls_support.local_search(3, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.fitness_value, expected.fitness_value)
+        self.assertEqual(optimizer_stub.evaluation, 35)
+
+    # neighbors are evaluated incrementally, with the same quality as evaluated directly
+    def test_local_search_should_evaluate_incrementally(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesIncrementalBitArray(BitArray(bin='0110100'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportRevolvingDoorBitArray(7)
+        # Act
+        with mocker.patch.object(SolutionWeightedOnesIncrementalBitArray, 'calculate_quality_directly', 
+                wraps=solution.calculate_quality_directly) as direct_mock:
+            result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        direct_mock.assert_not_called()
+        self.assertEqual(solution.fitness_value, 
+                solution.calculate_quality_directly(solution.representation, problem).fitness_value)
+        self.assertEqual(solution.fitness_value, 23)
+
+    # first improvement variant stops at the first better neighbor
+    def test_first_improvement_should_stop_at_first_better_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportRevolvingDoorBitArray(4, first_improvement=True)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(optimizer_stub.evaluation, 1)
+        self.assertEqual(solution.representation.bin, '1100')
+
+class TestVnsLocalSearchSupportRevolvingDoorInt(unittest.TestCase):
+
+    # when there is no better neighbor, solution is not changed
+    def test_local_search_without_improvement_should_keep_solution(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesInt(0b1101)
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportRevolvingDoorInt(4)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(solution.representation, 0b1101)
+        self.assertEqual(solution.fitness_value, 6)
+
+    # the best neighbor is chosen
+    def test_local_search_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesInt(0b0010)
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportRevolvingDoorInt(4)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation, 0b0001)
+
+if __name__ == '__main__':
+    unittest.main()
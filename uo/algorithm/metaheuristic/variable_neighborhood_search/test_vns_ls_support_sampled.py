@@ -0,0 +1,151 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_sampled_bit_array import \
+        VnsLocalSearchSupportSampledBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_sampled_int import \
+        VnsLocalSearchSupportSampledInt
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_standard_bit_array import \
+        SolutionWeightedOnesBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_parallel_bi import \
+        SolutionWeightedOnesInt
+from uo.algorithm.metaheuristic.variable_neighborhood_search.test_vns_ls_support_parallel_bi import \
+        create_optimizer_stub
+
+class TestVnsLocalSearchSupportSampledBitArray(unittest.TestCase):
+
+    # with sampling rate 1, whole neighborhood is visited and the best neighbor is chosen
+    def test_full_sample_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='00000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportSampledBitArray(5)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation.bin, '00011')
+        self.assertEqual(solution.fitness_value, 9)
+        self.assertEqual(optimizer_stub.evaluation, 10)
+
+    # sampling rate determines number of visited neighbors
+    def test_sampling_rate_should_limit_number_of_evaluations(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='00000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportSampledBitArray(5, sampling_rate=0.45)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(optimizer_stub.evaluation, 5)
+        self.assertEqual(solution.representation.count(1), 2)
+
+    # per call budget bounds local search within large neighborhood
+    def test_per_call_budget_should_bound_large_neighborhood(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(2000))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportSampledBitArray(2000, evaluations_max=50)
+        # Act
+        result = ls_support.local_search(3, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(optimizer_stub.evaluation, 50)
+        self.assertEqual(solution.representation.count(1), 3)
+
+    # remaining evaluation budget of the optimizer is honored
+    def test_local_search_should_honor_evaluation_budget(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='00000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='evaluations', evaluations_max=10), 
+                evaluation=7)
+        ls_support = VnsLocalSearchSupportSampledBitArray(5, evaluations_max=5)
+        # Act
+        ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertEqual(optimizer_stub.evaluation, 10)
+
+    # first improvement variant stops at the first better neighbor
+    def test_first_improvement_should_stop_at_first_better_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='00000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportSampledBitArray(5, first_improvement=True)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(optimizer_stub.evaluation, 1)
+        self.assertEqual(solution.representation.count(1), 2)
+
+    # sampling rate should be within (0, 1]
+    def test_sampling_rate_out_of_range_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            VnsLocalSearchSupportSampledBitArray(5, sampling_rate=0.0)
+        with self.assertRaises(ValueError):
+            VnsLocalSearchSupportSampledBitArray(5, sampling_rate=1.5)
+
+    # copy keeps sampling parameters
+    def test_copy_should_keep_sampling_parameters(self):
+        # Arrange
+        ls_support = VnsLocalSearchSupportSampledBitArray(5, sampling_rate=0.25, evaluations_max=7, 
+                first_improvement=True)
+        # Act
+        ls_copy = ls_support.copy()
+        # Assert
+        self.assertIsNot(ls_copy, ls_support)
+        self.assertEqual(ls_copy.dimension, 5)
+        self.assertEqual(ls_copy.sampling_rate, 0.25)
+        self.assertEqual(ls_copy.evaluations_max, 7)
+        self.assertTrue(ls_copy.first_improvement)
+
+class TestVnsLocalSearchSupportSampledInt(unittest.TestCase):
+
+    # the best neighbor is chosen
+    def test_local_search_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesInt(0b0010)
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportSampledInt(4)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation, 0b0001)
+        self.assertEqual(solution.fitness_value, 3)
+
+    # when there is no better neighbor, solution is not changed
+    def test_local_search_without_improvement_should_keep_solution(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesInt(0b1101)
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub(FinishControl(criteria='iterations', iterations_max=10))
+        ls_support = VnsLocalSearchSupportSampledInt(4, sampling_rate=0.5)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(solution.representation, 0b1101)
+        self.assertEqual(optimizer_stub.evaluation, 2)
+
+if __name__ == '__main__':
+    unittest.main()
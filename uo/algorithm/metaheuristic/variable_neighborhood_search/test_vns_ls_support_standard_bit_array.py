@@ -0,0 +1,209 @@
+import unittest
+import unittest.mock as mocker
+
+from bitstring import BitArray
+
+from uo.utils.dont_look_bits import DontLookBits
+from uo.utils.hamming_distance import hamming_distance
+
+from uo.problem.problem import Problem
+from uo.problem.problem_void_min_so import ProblemVoidMinSO
+from uo.solution.quality_of_solution import QualityOfSolution
+from uo.solution.solution import Solution
+
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_optimizer import VnsOptimizer
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_standard_bi_bit_array import \
+        VnsLocalSearchSupportStandardBestImprovementBitArray
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_standard_fi_bit_array import \
+        VnsLocalSearchSupportStandardFirstImprovementBitArray
+
+class SolutionWeightedOnesBitArray(Solution[BitArray, str]):
+    """
+    Solution where fitness is weighted count of ones - weight of the position is its index plus one
+    """
+
+    def __init__(self, representation:BitArray)->None:
+        super().__init__(random_seed=42, fitness_value=None, fitness_values=None, objective_value=None, 
+                objective_values=None, is_feasible=False)
+        self.representation = representation
+
+    def copy(self)->'SolutionWeightedOnesBitArray':
+        obj = SolutionWeightedOnesBitArray(self.representation.copy())
+        obj.copy_from(self)
+        return obj
+
+    def copy_from(self, original:Solution)->None:
+        super().copy_from(original)
+
+    def argument(self, representation:BitArray)->str:
+        return representation.bin
+
+    def init_random(self, problem:Problem)->None:
+        self.representation = BitArray(length=len(self.representation))
+
+    def init_from(self, representation:BitArray, problem:Problem)->None:
+        self.representation = BitArray(bin=representation.bin)
+
+    def native_representation(self, representation_str:str)->BitArray:
+        return BitArray(bin=representation_str)
+
+    def calculate_quality_directly(self, representation:BitArray, problem:Problem)->QualityOfSolution:
+        value:int = sum(i + 1 for i in representation.findall('0b1'))
+        return QualityOfSolution(value, None, value, None, True)
+
+    def representation_distance_directly(self, representation_1:BitArray, representation_2:BitArray)->float:
+        return hamming_distance(representation_1, representation_2)
+
+    def __str__(self)->str:
+        return self.representation.bin
+
+    def __repr__(self)->str:
+        return self.representation.bin
+
+    def __format__(self, spec:str)->str:
+        return self.representation.bin
+
+def create_optimizer_stub(k_min:int=1, k_max:int=3):
+    optimizer_stub = mocker.MagicMock(spec=VnsOptimizer)
+    type(optimizer_stub).k_min = mocker.PropertyMock(return_value=k_min)
+    type(optimizer_stub).k_max = mocker.PropertyMock(return_value=k_max)
+    optimizer_stub.should_finish.return_value = False
+    optimizer_stub.evaluation = 0
+    return optimizer_stub
+
+class TestVnsLocalSearchSupportStandardBestImprovementBitArray(unittest.TestCase):
+
+    # best neighbor within 1-flip neighborhood is chosen
+    def test_local_search_should_move_to_best_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardBestImprovementBitArray(4)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation.bin, '0001')
+        self.assertEqual(solution.fitness_value, 4)
+
+    # when there is no better neighbor, solution is not changed
+    def test_local_search_without_improvement_should_keep_solution(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='1111'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardBestImprovementBitArray(4)
+        # Act
+        result = ls_support.local_search(2, problem, solution, optimizer_stub)
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(solution.representation.bin, '1111')
+        self.assertEqual(solution.fitness_value, 10)
+        self.assertGreater(optimizer_stub.evaluation, 0)
+
+class TestVnsLocalSearchSupportStandardFirstImprovementBitArray(unittest.TestCase):
+
+    # first better neighbor is accepted
+    def test_local_search_should_move_to_better_neighbor(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='0000'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardFirstImprovementBitArray(4)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation.count(1), 1)
+        self.assertEqual(optimizer_stub.evaluation, 1)
+
+    # when there is no better neighbor, solution is not changed
+    def test_local_search_without_improvement_should_keep_solution(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='1111'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardFirstImprovementBitArray(4)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(solution.representation.bin, '1111')
+
+class TestVnsLocalSearchSupportDontLookBits(unittest.TestCase):
+
+    # after failed local search, unchanged solution is not scanned again
+    def test_failed_local_search_should_not_be_repeated(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='11111'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardBestImprovementBitArray(5, DontLookBits(5))
+        # Act
+        first_result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        first_evaluations = optimizer_stub.evaluation
+        second_result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertFalse(first_result)
+        self.assertFalse(second_result)
+        self.assertEqual(first_evaluations, 5)
+        self.assertEqual(optimizer_stub.evaluation, 5)
+
+    # only moves at positions changed since the failed local search are tried
+    def test_changed_positions_should_be_looked_at(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='11111'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardBestImprovementBitArray(5, DontLookBits(5))
+        ls_support.local_search(1, problem, solution, optimizer_stub)
+        optimizer_stub.evaluation = 0
+        solution.representation.invert(2)
+        solution.evaluate(problem)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation.bin, '11111')
+        self.assertEqual(optimizer_stub.evaluation, 1)
+
+    # change at position resets don't-look bits of related positions
+    def test_change_should_reset_related_positions(self):
+        # Arrange
+        problem = ProblemVoidMinSO("a problem", False)
+        solution = SolutionWeightedOnesBitArray(BitArray(bin='11111'))
+        solution.evaluate(problem)
+        optimizer_stub = create_optimizer_stub()
+        ls_support = VnsLocalSearchSupportStandardFirstImprovementBitArray(16, 
+                DontLookBits(16, related_positions={2: [1, 3]}))
+        ls_support.local_search(1, problem, solution, optimizer_stub)
+        optimizer_stub.evaluation = 0
+        solution.representation.invert(2)
+        solution.evaluate(problem)
+        # Act
+        result = ls_support.local_search(1, problem, solution, optimizer_stub)
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(solution.representation.bin, '11111')
+        # positions 1 and 2 are tried, in that order
+        self.assertEqual(optimizer_stub.evaluation, 2)
+
+    # copy shares don't-look bits template
+    def test_copy_should_keep_dont_look_bits(self):
+        # Arrange
+        dont_look_bits = DontLookBits(5)
+        ls_support = VnsLocalSearchSupportStandardBestImprovementBitArray(5, dont_look_bits)
+        # Act
+        ls_copy = ls_support.copy()
+        # Assert
+        self.assertIs(ls_copy.dont_look_bits, dont_look_bits)
+
+if __name__ == '__main__':
+    unittest.main()
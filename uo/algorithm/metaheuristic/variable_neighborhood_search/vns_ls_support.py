@@ -10,9 +10,13 @@ sys.path.append(directory.parent.parent)
 sys.path.append(directory.parent.parent.parent)
 
 from abc import ABCMeta, abstractmethod
-from typing import TypeVar
+from typing import Optional, TypeVar
 from typing import Generic
 
+from bitstring import BitArray
+
+from uo.utils.dont_look_bits import DontLookBits
+
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
 from uo.algorithm.metaheuristic.single_solution_metaheuristic import SingleSolutionMetaheuristic
@@ -22,17 +26,23 @@ A_co = TypeVar("A_co", covariant=True)
 
 class VnsLocalSearchSupport(Generic[R_co,A_co], metaclass=ABCMeta):
     
-    def __init__(self, dimension:int)->None:
+    def __init__(self, dimension:int, dont_look_bits:Optional[DontLookBits]=None)->None:
         """
         Create new `VnsLocalSearchSupportStandardBestImprovementInt` instance
 
         :param int inner_dimension: determine neighborhood size where local search is executed
+        :param Optional[DontLookBits] dont_look_bits: template for don't-look bits, that are kept separately for
+        each neighborhood size - if `None`, don't-look bits are not used
         """
         if dimension is None:
             raise ValueError('Parameter \'dimension\' must exists.')
         if not isinstance( dimension, int):
             raise TypeError('Parameter \'dimension\' must be int.')
+        if dont_look_bits is not None and not isinstance(dont_look_bits, DontLookBits):
+            raise TypeError('Parameter \'dont_look_bits\' must be \'DontLookBits\' or \'None\'.')
         self.__dimension = dimension
+        self.__dont_look_bits:Optional[DontLookBits] = dont_look_bits
+        self.__dont_look_bits_by_k:dict[int, DontLookBits] = {}
 
     @abstractmethod
     def copy(self):
@@ -54,6 +64,34 @@ class VnsLocalSearchSupport(Generic[R_co,A_co], metaclass=ABCMeta):
         """
         return self.__dimension
 
+    @property
+    def dont_look_bits(self)->Optional[DontLookBits]:
+        """
+        Property getter for the template of don't-look bits
+
+        :return: template of don't-look bits, or `None` if they are not used
+        :rtype: Optional[DontLookBits]
+        """
+        return self.__dont_look_bits
+
+    def synchronized_dont_look_bits(self, k:int, representation:BitArray|int)->Optional[DontLookBits]:
+        """
+        Don't-look bits for the neighborhood of size k, with bits reset at the positions where representation
+        has been changed since the previous local search within that neighborhood
+
+        :param int k: int parameter for VNS
+        :param BitArray|int representation: representation of the solution where local search starts
+        :return: don't-look bits for the neighborhood, or `None` if they are not used
+        :rtype: Optional[DontLookBits]
+        """
+        if self.__dont_look_bits is None:
+            return None
+        if k not in self.__dont_look_bits_by_k:
+            self.__dont_look_bits_by_k[k] = self.__dont_look_bits.copy()
+        dont_look_bits:DontLookBits = self.__dont_look_bits_by_k[k]
+        dont_look_bits.synchronize(representation)
+        return dont_look_bits
+
     @abstractmethod
     def local_search(self, k:int, problem:Problem, solution:Solution[R_co,A_co], 
             optimizer:SingleSolutionMetaheuristic)->bool:
@@ -0,0 +1,200 @@
+"""
+.. _py_vns_ls_support_parallel_bi:
+
+The :mod:`~uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_parallel_bi` contains
+class :class:`~uo.algorithm.metaheuristic.variable_neighborhood_search.VnsLocalSearchSupportParallelBestImprovement`,
+that represents VNS "best improvement" local search support, where k-flip neighborhood is scanned in parallel.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+import os
+import time
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from typing import Callable, Optional, TypeVar
+
+from uo.utils.combination_ranking import combination_count, unrank_combination, next_combination
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.single_solution_metaheuristic import SingleSolutionMetaheuristic
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support import VnsLocalSearchSupport
+
+R_co = TypeVar("R_co", covariant=True)
+A_co = TypeVar("A_co", covariant=True)
+
+def scan_combination_chunk(solution:Solution, problem:Problem, n:int, k:int, rank_start:int, rank_end:int,
+        flip:Callable[[Solution, list[int]], None], deadline:Optional[float])->tuple[Optional[Solution], int]:
+    """
+    Scans neighbors of the solution obtained by flipping k-combinations of positions with ranks within
+    `[rank_start, rank_end)`, in lexicographic order
+
+    :param `Solution` solution: evaluated solution, whose neighborhood is scanned - it is not changed
+    :param `Problem` problem: problem that is solved
+    :param int n: number of positions
+    :param int k: number of positions that are flipped
+    :param int rank_start: rank of the first combination within chunk
+    :param int rank_end: rank after the last combination within chunk
+    :param Callable[[Solution, list[int]], None] flip: function that flips given positions of the solution, in place
+    :param Optional[float] deadline: time (as returned by `time.time()`) when scan should stop, or `None`
+    :return: the best neighbor within chunk that is better than the solution (or `None`), and number of evaluations
+    :rtype: tuple[Optional[Solution], int]
+    """
+    start_sol:Solution = solution.copy()
+    start_sol.copy_from(solution)
+    best_sol:Solution = solution.copy()
+    best_sol.copy_from(solution)
+    better_sol_found:bool = False
+    evaluations:int = 0
+    combination:list[int] = unrank_combination(rank_start, n, k)
+    for _ in range(rank_start, rank_end):
+        if deadline is not None and time.time() >= deadline:
+            break
+        flip(start_sol, combination)
+        evaluations += 1
+        start_sol.evaluate(problem)
+        if start_sol.is_better(best_sol, problem):
+            better_sol_found = True
+            best_sol.copy_from(start_sol)
+        flip(start_sol, combination)
+        if not next_combination(combination, n):
+            break
+    if better_sol_found:
+        return (best_sol, evaluations)
+    return (None, evaluations)
+
+class VnsLocalSearchSupportParallelBestImprovement(VnsLocalSearchSupport[R_co,A_co], metaclass=ABCMeta):
+
+    def __init__(self, dimension:int, worker_count:Optional[int]=None, chunk_count:Optional[int]=None)->None:
+        """
+        Create new `VnsLocalSearchSupportParallelBestImprovement` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param Optional[int] worker_count: number of worker processes - if `None`, number of processors is used,
+        and if `1`, neighborhood is scanned within current process
+        :param Optional[int] chunk_count: number of chunks of combination ranks - if `None`, four chunks per worker
+        """
+        super().__init__(dimension=dimension)
+        if worker_count is None:
+            worker_count = os.cpu_count() or 1
+        if not isinstance(worker_count, int):
+            raise TypeError('Parameter \'worker_count\' must be \'int\' or \'None\'.')
+        if worker_count <= 0:
+            raise ValueError('Parameter \'worker_count\' must be positive.')
+        if chunk_count is None:
+            chunk_count = 4 * worker_count
+        if not isinstance(chunk_count, int):
+            raise TypeError('Parameter \'chunk_count\' must be \'int\' or \'None\'.')
+        if chunk_count <= 0:
+            raise ValueError('Parameter \'chunk_count\' must be positive.')
+        self.__worker_count:int = worker_count
+        self.__chunk_count:int = chunk_count
+        self.__executor:Optional[Executor] = None
+
+    @property
+    def worker_count(self)->int:
+        """
+        Property getter for the number of worker processes
+
+        :return: number of worker processes
+        :rtype: int
+        """
+        return self.__worker_count
+
+    @property
+    def chunk_count(self)->int:
+        """
+        Property getter for the number of chunks of combination ranks
+
+        :return: number of chunks
+        :rtype: int
+        """
+        return self.__chunk_count
+
+    @staticmethod
+    @abstractmethod
+    def flip_positions(solution:Solution, positions:list[int])->None:
+        """
+        Flips given positions of the solution representation, in place
+
+        :param `Solution` solution: solution that is changed
+        :param list[int] positions: positions that are flipped
+        """
+        raise NotImplementedError
+
+    def shutdown(self)->None:
+        """
+        Stops worker processes, if they are started
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def local_search(self, k:int, problem:Problem, solution:Solution,
+            optimizer:SingleSolutionMetaheuristic)->bool:
+        """
+        Executes "best improvement" variant of the local search procedure. Space of k-combinations of positions
+        is split into chunks of consecutive ranks, chunks are scanned by worker processes, and the best move is
+        chosen among the best moves of the chunks. Evaluation budget and time limit of the optimizer are honored.
+        Evaluations are counted, but not written to output one by one.
+
+        :param int k: int parameter for VNS
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `SingleSolutionMetaheuristic` optimizer: metaheuristic optimizer that is executed
+        :return: result of the local search procedure
+        :rtype: if local search is successful
+        """
+        if optimizer.should_finish():
+            return False
+        if k < optimizer.k_min or k > optimizer.k_max:
+            return False
+        total:int = combination_count(self.dimension, k)
+        deadline:Optional[float] = None
+        finish_control:FinishControl = optimizer.finish_control
+        if finish_control.check_evaluations:
+            total = min(total, finish_control.evaluations_max - optimizer.evaluation)
+        if finish_control.check_seconds:
+            deadline = time.time() + finish_control.seconds_max - optimizer.elapsed_seconds()
+        if total <= 0:
+            return False
+        chunk_count:int = min(self.chunk_count, total)
+        bounds:list[int] = [total * i // chunk_count for i in range(chunk_count + 1)]
+        if self.worker_count == 1:
+            results:list[tuple[Optional[Solution], int]] = [scan_combination_chunk(solution, problem,
+                    self.dimension, k, bounds[i], bounds[i+1], self.flip_positions, deadline)
+                    for i in range(chunk_count)]
+        else:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.worker_count)
+            futures:list = [self.__executor.submit(scan_combination_chunk, solution, problem,
+                    self.dimension, k, bounds[i], bounds[i+1], self.flip_positions, deadline)
+                    for i in range(chunk_count)]
+            results:list[tuple[Optional[Solution], int]] = [future.result() for future in futures]
+        best_sol:Optional[Solution] = None
+        for chunk_best, evaluations in results:
+            optimizer.evaluation += evaluations
+            # chunks are ordered by rank, so ties are resolved as in serial scan
+            if chunk_best is not None and (best_sol is None or chunk_best.is_better(best_sol, problem)):
+                best_sol = chunk_best
+        if best_sol is None:
+            return False
+        solution.copy_from(best_sol)
+        return True
+
+    def __getstate__(self)->dict:
+        """
+        State of the instance for pickling, without worker processes
+        """
+        state:dict = self.__dict__.copy()
+        state['_VnsLocalSearchSupportParallelBestImprovement__executor'] = None
+        return state
@@ -0,0 +1,108 @@
+"""
+.. _py_vns_ls_support_parallel_bi_int:
+
+The :mod:`~uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_parallel_bi_int` contains
+class :class:`~uo.algorithm.metaheuristic.variable_neighborhood_search.VnsLocalSearchSupportParallelBestImprovementInt`,
+that represents VNS local search support with parallel neighborhood scan, where `int` representation of the problem 
+has been used.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from typing import Optional, TypeVar
+
+from uo.solution.solution import Solution
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_parallel_bi import \
+        VnsLocalSearchSupportParallelBestImprovement
+
+A_co = TypeVar("A_co", covariant=True)
+
+class VnsLocalSearchSupportParallelBestImprovementInt(VnsLocalSearchSupportParallelBestImprovement[int,A_co]):
+
+    def __init__(self, dimension:int, worker_count:Optional[int]=None, chunk_count:Optional[int]=None)->None:
+        """
+        Create new `VnsLocalSearchSupportParallelBestImprovementInt` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param Optional[int] worker_count: number of worker processes - if `None`, number of processors is used,
+        and if `1`, neighborhood is scanned within current process
+        :param Optional[int] chunk_count: number of chunks of combination ranks - if `None`, four chunks per worker
+        """
+        super().__init__(dimension=dimension, worker_count=worker_count, chunk_count=chunk_count)
+
+    def copy(self):
+        """
+        Copy the `VnsLocalSearchSupportParallelBestImprovementInt` instance
+
+        :return: new `VnsLocalSearchSupportParallelBestImprovementInt` instance with the same properties
+        :rtype: `VnsLocalSearchSupportParallelBestImprovementInt`
+        """
+        obj = VnsLocalSearchSupportParallelBestImprovementInt(self.dimension, self.worker_count, self.chunk_count)
+        return obj
+
+    @staticmethod
+    def flip_positions(solution:Solution, positions:list[int])->None:
+        """
+        Flips given positions of the solution representation, in place
+
+        :param `Solution` solution: solution that is changed
+        :param list[int] positions: positions that are flipped
+        """
+        mask:int = 0
+        for i in positions:
+            mask |= 1 << i
+        solution.representation ^= mask
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
+        group_end:str ='}')->str:
+        """
+        String representation of the vns support structure
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string 
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string 
+        :type group_end: str, optional, default value '}'
+        :return: string representation of vns support instance
+        :rtype: str
+        """        
+        return 'VnsLocalSearchSupportParallelBestImprovementInt'
+
+    def __str__(self)->str:
+        """
+        String representation of the vns support instance
+
+        :return: string representation of the vns support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        Representation of the vns support instance
+
+        :return: string representation of the vns support instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the vns support instance
+
+        :param str spec: format specification
+        :return: formatted vns support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
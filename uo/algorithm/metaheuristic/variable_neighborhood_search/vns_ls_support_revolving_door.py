@@ -0,0 +1,116 @@
+"""
+.. _py_vns_ls_support_revolving_door:
+
+The :mod:`~uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_revolving_door` contains
+class :class:`~uo.algorithm.metaheuristic.variable_neighborhood_search.VnsLocalSearchSupportRevolvingDoor`,
+that represents VNS local search support, where k-flip neighborhood is traversed in revolving-door order.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from abc import ABCMeta, abstractmethod
+
+from typing import TypeVar
+
+from uo.utils.complex_counter_revolving_door import ComplexCounterRevolvingDoor
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.algorithm.metaheuristic.single_solution_metaheuristic import SingleSolutionMetaheuristic
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support import VnsLocalSearchSupport
+
+R_co = TypeVar("R_co", covariant=True)
+A_co = TypeVar("A_co", covariant=True)
+
+class VnsLocalSearchSupportRevolvingDoor(VnsLocalSearchSupport[R_co,A_co], metaclass=ABCMeta):
+
+    def __init__(self, dimension:int, first_improvement:bool=False)->None:
+        """
+        Create new `VnsLocalSearchSupportRevolvingDoor` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param bool first_improvement: if local search stops at the first better neighbor, instead of scanning the
+        whole neighborhood for the best one
+        """
+        super().__init__(dimension=dimension)
+        if not isinstance(first_improvement, bool):
+            raise TypeError('Parameter \'first_improvement\' must be \'bool\'.')
+        self.__first_improvement:bool = first_improvement
+
+    @property
+    def first_improvement(self)->bool:
+        """
+        Property getter for the local search variant
+
+        :return: if local search stops at the first better neighbor
+        :rtype: bool
+        """
+        return self.__first_improvement
+
+    @staticmethod
+    @abstractmethod
+    def flip_positions(solution:Solution, positions:list[int])->None:
+        """
+        Flips given positions of the solution representation, in place
+
+        :param `Solution` solution: solution that is changed
+        :param list[int] positions: positions that are flipped
+        """
+        raise NotImplementedError
+
+    def local_search(self, k:int, problem:Problem, solution:Solution,
+            optimizer:SingleSolutionMetaheuristic)->bool:
+        """
+        Executes local search procedure. Combinations of k positions are visited in revolving-door order, so
+        consecutive neighbors differ in two flipped positions only, and each neighbor is evaluated incrementally
+
+        :param int k: int parameter for VNS
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `SingleSolutionMetaheuristic` optimizer: metaheuristic optimizer that is executed
+        :return: result of the local search procedure
+        :rtype: if local search is successful
+        """
+        if optimizer.should_finish():
+            return False
+        if k < optimizer.k_min or k > optimizer.k_max or k > self.dimension:
+            return False
+        start_sol:Solution = solution.copy()
+        start_sol.copy_from(solution)
+        best_sol:Solution = solution.copy()
+        best_sol.copy_from(solution)
+        better_sol_found:bool = False
+        # initialize indexes and move to the first neighbor
+        indexes:ComplexCounterRevolvingDoor = ComplexCounterRevolvingDoor(k, self.dimension)
+        in_loop:bool = indexes.reset()
+        changed_positions:list[int] = indexes.current_state()
+        self.flip_positions(solution, changed_positions)
+        while in_loop:
+            if optimizer.should_finish():
+                solution.copy_from(start_sol)
+                return False
+            optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+            optimizer.evaluation += 1
+            solution.evaluate_incrementally(problem, changed_positions)
+            optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+            if solution.is_better(best_sol, problem):
+                if self.first_improvement:
+                    return True
+                better_sol_found = True
+                best_sol.copy_from(solution)
+            # move to the next neighbor, that differs in one removed and one added position
+            in_loop = indexes.progress()
+            if in_loop:
+                changed_positions = list(indexes.last_swap)
+                self.flip_positions(solution, changed_positions)
+        if better_sol_found:
+            solution.copy_from(best_sol)
+            return True
+        solution.copy_from(start_sol)
+        return False
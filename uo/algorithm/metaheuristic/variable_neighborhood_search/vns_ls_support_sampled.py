@@ -0,0 +1,172 @@
+"""
+.. _py_vns_ls_support_sampled:
+
+The :mod:`~uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_sampled` contains
+class :class:`~uo.algorithm.metaheuristic.variable_neighborhood_search.VnsLocalSearchSupportSampled`,
+that represents VNS local search support, where only random sample of the k-flip neighborhood is visited.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+import math
+from fractions import Fraction
+from abc import ABCMeta, abstractmethod
+
+from typing import Optional, TypeVar
+
+from uo.utils.combination_ranking import combination_count, sample_combinations
+
+from uo.problem.problem import Problem
+from uo.solution.solution import Solution
+from uo.algorithm.metaheuristic.finish_control import FinishControl
+from uo.algorithm.metaheuristic.single_solution_metaheuristic import SingleSolutionMetaheuristic
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support import VnsLocalSearchSupport
+
+R_co = TypeVar("R_co", covariant=True)
+A_co = TypeVar("A_co", covariant=True)
+
+class VnsLocalSearchSupportSampled(VnsLocalSearchSupport[R_co,A_co], metaclass=ABCMeta):
+
+    def __init__(self, dimension:int, sampling_rate:float=1.0, evaluations_max:Optional[int]=None,
+            first_improvement:bool=False)->None:
+        """
+        Create new `VnsLocalSearchSupportSampled` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param float sampling_rate: part of the k-flip neighborhood that is visited within one local search call,
+        between 0 (exclusive) and 1 (inclusive)
+        :param Optional[int] evaluations_max: maximum number of evaluations within one local search call - if
+        `None`, only sampling rate limits the number of visited neighbors
+        :param bool first_improvement: if local search stops at the first better neighbor, instead of scanning the
+        whole sample for the best one
+        """
+        super().__init__(dimension=dimension)
+        if not isinstance(sampling_rate, (int, float)) or isinstance(sampling_rate, bool):
+            raise TypeError('Parameter \'sampling_rate\' must be \'float\'.')
+        if sampling_rate <= 0 or sampling_rate > 1:
+            raise ValueError('Parameter \'sampling_rate\' must be greater than 0 and not greater than 1.')
+        if evaluations_max is not None and not isinstance(evaluations_max, int):
+            raise TypeError('Parameter \'evaluations_max\' must be \'int\' or \'None\'.')
+        if evaluations_max is not None and evaluations_max <= 0:
+            raise ValueError('Parameter \'evaluations_max\' must be positive.')
+        if not isinstance(first_improvement, bool):
+            raise TypeError('Parameter \'first_improvement\' must be \'bool\'.')
+        self.__sampling_rate:float = sampling_rate
+        self.__evaluations_max:Optional[int] = evaluations_max
+        self.__first_improvement:bool = first_improvement
+
+    @property
+    def sampling_rate(self)->float:
+        """
+        Property getter for the part of the neighborhood that is visited
+
+        :return: sampling rate
+        :rtype: float
+        """
+        return self.__sampling_rate
+
+    @property
+    def evaluations_max(self)->Optional[int]:
+        """
+        Property getter for the maximum number of evaluations within one local search call
+
+        :return: maximum number of evaluations within one local search call, or `None`
+        :rtype: Optional[int]
+        """
+        return self.__evaluations_max
+
+    @property
+    def first_improvement(self)->bool:
+        """
+        Property getter for the local search variant
+
+        :return: if local search stops at the first better neighbor
+        :rtype: bool
+        """
+        return self.__first_improvement
+
+    @staticmethod
+    @abstractmethod
+    def flip_positions(solution:Solution, positions:list[int])->None:
+        """
+        Flips given positions of the solution representation, in place - flipping the same positions again
+        restores the representation
+
+        :param `Solution` solution: solution that is changed
+        :param list[int] positions: positions that are flipped
+        """
+        raise NotImplementedError
+
+    def sample_size(self, k:int, optimizer:SingleSolutionMetaheuristic)->int:
+        """
+        Number of neighbors visited within one local search call, determined by sampling rate, per call budget
+        and remaining evaluation budget of the optimizer
+
+        :param int k: int parameter for VNS
+        :param `SingleSolutionMetaheuristic` optimizer: metaheuristic optimizer that is executed
+        :return: number of neighbors to visit
+        :rtype: int
+        """
+        total:int = combination_count(self.dimension, k)
+        size:int = math.ceil(Fraction(self.sampling_rate) * total)
+        if self.evaluations_max is not None:
+            size = min(size, self.evaluations_max)
+        finish_control:FinishControl = optimizer.finish_control
+        if finish_control.check_evaluations:
+            size = min(size, finish_control.evaluations_max - optimizer.evaluation)
+        return max(size, 0)
+
+    def local_search(self, k:int, problem:Problem, solution:Solution,
+            optimizer:SingleSolutionMetaheuristic)->bool:
+        """
+        Executes local search procedure over random sample of k-flip neighborhood, visited in random order.
+        Sample contains different neighbors, and its size is bounded by sampling rate and evaluation budgets.
+
+        :param int k: int parameter for VNS
+        :param `Problem` problem: problem that is solved
+        :param `Solution` solution: solution used for the problem that is solved
+        :param `SingleSolutionMetaheuristic` optimizer: metaheuristic optimizer that is executed
+        :return: result of the local search procedure
+        :rtype: if local search is successful
+        """
+        if optimizer.should_finish():
+            return False
+        if k < optimizer.k_min or k > optimizer.k_max:
+            return False
+        size:int = self.sample_size(k, optimizer)
+        if size <= 0:
+            return False
+        # quality of the starting solution, restored whenever the neighbor is undone
+        start_objective_value:float = solution.objective_value
+        start_fitness_value:float = solution.fitness_value
+        start_is_feasible:bool = solution.is_feasible
+        best_sol:Solution = solution.copy()
+        better_sol_found:bool = False
+        # sample is generated lazily, so neighbors that are not visited are never drawn
+        for positions in sample_combinations(self.dimension, k, size):
+            if optimizer.should_finish():
+                break
+            self.flip_positions(solution, positions)
+            optimizer.write_output_values_if_needed("before_evaluation", "b_e")
+            optimizer.evaluation += 1
+            solution.evaluate(problem)
+            optimizer.write_output_values_if_needed("after_evaluation", "a_e")
+            if solution.is_better(best_sol, problem):
+                if self.first_improvement:
+                    return True
+                better_sol_found = True
+                best_sol.copy_from(solution)
+            self.flip_positions(solution, positions)
+            solution.objective_value = start_objective_value
+            solution.fitness_value = start_fitness_value
+            solution.is_feasible = start_is_feasible
+        if better_sol_found:
+            solution.copy_from(best_sol)
+            return True
+        return False
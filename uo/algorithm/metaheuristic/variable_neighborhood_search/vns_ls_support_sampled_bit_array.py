@@ -0,0 +1,111 @@
+"""
+.. _py_vns_ls_support_sampled_bit_array:
+
+The :mod:`~uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_sampled_bit_array` contains
+class :class:`~uo.algorithm.metaheuristic.variable_neighborhood_search.VnsLocalSearchSupportSampledBitArray`,
+that represents VNS local search support over random sample of the neighborhood, where `BitArray` representation of 
+the problem has been used.
+"""
+
+import sys
+from pathlib import Path
+directory = Path(__file__).resolve()
+sys.path.append(directory)
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+sys.path.append(directory.parent.parent.parent)
+
+from typing import Optional, TypeVar
+
+from bitstring import BitArray
+
+from uo.solution.solution import Solution
+from uo.algorithm.metaheuristic.variable_neighborhood_search.vns_ls_support_sampled import \
+        VnsLocalSearchSupportSampled
+
+A_co = TypeVar("A_co", covariant=True)
+
+class VnsLocalSearchSupportSampledBitArray(VnsLocalSearchSupportSampled[BitArray,A_co]):
+
+    def __init__(self, dimension:int, sampling_rate:float=1.0, evaluations_max:Optional[int]=None,
+            first_improvement:bool=False)->None:
+        """
+        Create new `VnsLocalSearchSupportSampledBitArray` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param float sampling_rate: part of the k-flip neighborhood that is visited within one local search call
+        :param Optional[int] evaluations_max: maximum number of evaluations within one local search call, or `None`
+        :param bool first_improvement: if local search stops at the first better neighbor, instead of scanning the
+        whole sample for the best one
+        """
+        super().__init__(dimension=dimension, sampling_rate=sampling_rate, evaluations_max=evaluations_max,
+                first_improvement=first_improvement)
+
+    def copy(self):
+        """
+        Copy the `VnsLocalSearchSupportSampledBitArray` instance
+
+        :return: new `VnsLocalSearchSupportSampledBitArray` instance with the same properties
+        :rtype: `VnsLocalSearchSupportSampledBitArray`
+        """
+        obj = VnsLocalSearchSupportSampledBitArray(self.dimension, self.sampling_rate, self.evaluations_max,
+                self.first_improvement)
+        return obj
+
+    @staticmethod
+    def flip_positions(solution:Solution, positions:list[int])->None:
+        """
+        Flips given positions of the solution representation, in place
+
+        :param `Solution` solution: solution that is changed
+        :param list[int] positions: positions that are flipped
+        """
+        solution.representation.invert(positions)
+
+    def string_rep(self, delimiter:str, indentation:int=0, indentation_symbol:str='', group_start:str ='{', 
+        group_end:str ='}')->str:
+        """
+        String representation of the vns support structure
+
+        :param delimiter: delimiter between fields
+        :type delimiter: str
+        :param indentation: level of indentation
+        :type indentation: int, optional, default value 0
+        :param indentation_symbol: indentation symbol
+        :type indentation_symbol: str, optional, default value ''
+        :param group_start: group start string 
+        :type group_start: str, optional, default value '{'
+        :param group_end: group end string 
+        :type group_end: str, optional, default value '}'
+        :return: string representation of vns support instance
+        :rtype: str
+        """        
+        return 'VnsLocalSearchSupportSampledBitArray'
+
+    def __str__(self)->str:
+        """
+        String representation of the vns support instance
+
+        :return: string representation of the vns support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
+
+    def __repr__(self)->str:
+        """
+        Representation of the vns support instance
+
+        :return: string representation of the vns support instance
+        :rtype: str
+        """
+        return self.string_rep('\n')
+
+    def __format__(self, spec:str)->str:
+        """
+        Formatted the vns support instance
+
+        :param str spec: format specification
+        :return: formatted vns support instance
+        :rtype: str
+        """
+        return self.string_rep('|')
@@ -18,11 +18,12 @@ import math
 
 from random import choice
 
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from bitstring import BitArray
 
 from uo.utils.complex_counter_uniform_ascending import ComplexCounterUniformAscending
+from uo.utils.dont_look_bits import DontLookBits
 
 from uo.problem.problem import Problem
 from uo.solution.solution import Solution
@@ -33,11 +34,14 @@ A_co = TypeVar("A_co", covariant=True)
 
 class VnsLocalSearchSupportStandardFirstImprovementBitArray(VnsLocalSearchSupport[BitArray,A_co]):
     
-    def __init__(self, dimension:int)->None:
+    def __init__(self, dimension:int, dont_look_bits:Optional[DontLookBits]=None)->None:
         """
         Create new `VnsLocalSearchSupportStandardFirstImprovementBitArray` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param Optional[DontLookBits] dont_look_bits: template for don't-look bits - if `None`, they are not used
         """
-        super().__init__(dimension=dimension)
+        super().__init__(dimension=dimension, dont_look_bits=dont_look_bits)
 
     def copy(self):
         """
@@ -46,7 +50,7 @@ class VnsLocalSearchSupportStandardFirstImprovementBitArray(VnsLocalSearchSuppor
         :return: new `VnsLocalSearchSupportStandardFirstImprovementBitArray` instance with the same properties
         :rtype: `VnsLocalSearchSupportStandardFirstImprovementBitArray`
         """
-        obj = VnsLocalSearchSupportStandardFirstImprovementBitArray(self.dimension)
+        obj = VnsLocalSearchSupportStandardFirstImprovementBitArray(self.dimension, self.dont_look_bits)
         return obj
 
     def local_search(self, k:int, problem:Problem, solution:Solution, 
@@ -71,17 +75,16 @@ class VnsLocalSearchSupportStandardFirstImprovementBitArray(VnsLocalSearchSuppor
         dim:int = int(math.ceil(math.log2(self.dimension)))
         indexes:ComplexCounterUniformAscending = ComplexCounterUniformAscending(k, dim)
         in_loop:bool = indexes.reset()
+        dont_look_bits:Optional[DontLookBits] = self.synchronized_dont_look_bits(k, solution.representation)
         while in_loop:
             # collect positions for inversion from indexes
-            positions:list[int] = indexes.current_state()
-            # invert and compare, switch and exit if new is better
-            mask:BitArray = BitArray(length=solution.representation.len)
-            for i in positions:
-                partial_mask = BitArray(length=solution.representation.len)
-                partial_mask[-1] = True
-                partial_mask.ror(i)
-                mask |= partial_mask
-            solution.representation ^= mask 
+            positions:set[int] = set(indexes.current_state())
+            # skip move if all its positions failed since the last change at them
+            if dont_look_bits is not None and not dont_look_bits.looks_any(positions):
+                in_loop = indexes.progress()
+                continue
+            # invert in place and compare, switch and exit if new is better
+            solution.representation.invert(positions)
             if optimizer.should_finish():
                 solution.copy_from(start_sol)
                 return False
@@ -91,15 +94,13 @@ class VnsLocalSearchSupportStandardFirstImprovementBitArray(VnsLocalSearchSuppor
             optimizer.write_output_values_if_needed("after_evaluation", "a_e")
             if solution.is_better(start_sol, problem):
                 return True
-            mask:BitArray = BitArray(length=solution.representation.len)
-            for i in positions:
-                partial_mask = BitArray(length=solution.representation.len)
-                partial_mask[-1] = True
-                partial_mask.ror(i)
-                mask |= partial_mask
-            solution.representation ^= mask 
+            # undo the move in place
+            solution.representation.invert(positions)
             # increment indexes and set in_loop accordingly
             in_loop = indexes.progress()
+        # all moves failed, so positions are not looked at until solution changes at them
+        if dont_look_bits is not None:
+            dont_look_bits.set_bits(range(dim))
         solution.copy_from(start_sol)
         return False
 
@@ -18,10 +18,11 @@ sys.path.append(directory.parent.parent.parent)
 from random import choice
 from random import randint
 
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from uo.utils.logger import logger
 from uo.utils.complex_counter_uniform_ascending import ComplexCounterUniformAscending
+from uo.utils.dont_look_bits import DontLookBits
 
 
 from uo.problem.problem import Problem
@@ -33,11 +34,14 @@ A_co = TypeVar("A_co", covariant=True)
 
 class VnsLocalSearchSupportStandardFirstImprovementInt(VnsLocalSearchSupport[int,A_co]):
     
-    def __init__(self, dimension:int)->None:
+    def __init__(self, dimension:int, dont_look_bits:Optional[DontLookBits]=None)->None:
         """
         Create new `VnsLocalSearchSupportStandardBestImprovementBitArray` instance
+
+        :param int dimension: number of positions that can be flipped
+        :param Optional[DontLookBits] dont_look_bits: template for don't-look bits - if `None`, they are not used
         """
-        super().__init__(dimension=dimension)
+        super().__init__(dimension=dimension, dont_look_bits=dont_look_bits)
 
     def copy(self):
         """
@@ -46,7 +50,7 @@ class VnsLocalSearchSupportStandardFirstImprovementInt(VnsLocalSearchSupport[int
         :return: new `VnsLocalSearchSupportStandardFirstImprovementInt` instance with the same properties
         :rtype: `VnsLocalSearchSupportStandardFirstImprovementInt`
         """        
-        obj = VnsLocalSearchSupportStandardFirstImprovementInt(self.dimension)
+        obj = VnsLocalSearchSupportStandardFirstImprovementInt(self.dimension, self.dont_look_bits)
         return obj
         
     def local_search(self, k:int, problem:Problem, solution:Solution, 
@@ -69,9 +73,14 @@ class VnsLocalSearchSupportStandardFirstImprovementInt(VnsLocalSearchSupport[int
         # initialize indexes
         indexes:ComplexCounterUniformAscending = ComplexCounterUniformAscending(k, self.dimension)
         in_loop:bool = indexes.reset()
+        dont_look_bits:Optional[DontLookBits] = self.synchronized_dont_look_bits(k, solution.representation)
         while in_loop:
             # collect positions for inversion from indexes
             positions:list[int] = indexes.current_state()
+            # skip move if all its positions failed since the last change at them
+            if dont_look_bits is not None and not dont_look_bits.looks_any(positions):
+                in_loop = indexes.progress()
+                continue
             # invert and compare, switch and exit if new is better
             mask:int = 0
             for i in positions:
@@ -89,6 +98,9 @@ class VnsLocalSearchSupportStandardFirstImprovementInt(VnsLocalSearchSupport[int
             solution.representation ^= mask
             # increment indexes and set in_loop accordingly
             in_loop = indexes.progress()
+        # all moves failed, so positions are not looked at until solution changes at them
+        if dont_look_bits is not None:
+            dont_look_bits.set_bits(range(self.dimension))
         solution.copy_from(start_sol)
         return False
 
@@ -267,11 +267,12 @@ class Optimizer(metaclass=ABCMeta):
             raise ValueError("Supplied step name '" + step_name + "' is not valid.")
         if should_write:
             line:str = ''
-            fields_def:list[str] = self.output_control.fields_definitions 
-            fields_val:list[str] = ['XXX'] * len(fields_def)
-            fields_val = self.determine_fields_val(fields_def=fields_def, fields_val=fields_val)
-            for f_val in fields_val:
-                s_data:str = str(f_val)
+            for accessor in self.output_control.fields_accessors:
+                try:
+                    s_data:str = str(accessor(self))
+                except BaseException as e:
+                    s_data:str = 'XXX'
+                    logger.debug(e)
                 if s_data == "step_name":
                         s_data = step_name_value
                 output.write( s_data + '\t')
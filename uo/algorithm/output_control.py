@@ -8,7 +8,47 @@ directory = Path(__file__).resolve()
 import sys
 sys.path.append(directory.parent)
 
+import ast
+import re
 from io import TextIOWrapper 
+from operator import attrgetter
+from typing import Any, Callable
+
+# field definition that is chain of attributes of the optimizer, optionally ending with call without arguments
+_ATTRIBUTE_PATH_PATTERN:re.Pattern = re.compile(r'self\.([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)(\(\))?')
+
+def compile_field_definition(field_definition:str)->Callable[[Any], Any]:
+    """
+    Compiles field definition into accessor, that obtains value of the field from the optimizer. Chains of
+    attributes (e.g. `self.best_solution.fitness_value`), optionally ending with method call without arguments, 
+    become attribute getters, and string literals become constants, so obtaining the value does not need parsing.
+    Other expressions are compiled once and evaluated with `self` bound to the optimizer.
+
+    :param str field_definition: field definition, as in `fields_definitions` of the output control
+    :return: function that takes optimizer and returns value of the field - exception is raised if value can not
+    be obtained
+    :rtype: Callable[[Any], Any]
+    """
+    if field_definition[0] == "'" or field_definition[0] == '"':
+        try:
+            value:Any = ast.literal_eval(field_definition)
+            return lambda optimizer: value
+        except (ValueError, SyntaxError):
+            pass
+    match:Optional[re.Match] = _ATTRIBUTE_PATH_PATTERN.fullmatch(field_definition)
+    if match is not None:
+        getter:attrgetter = attrgetter(match.group(1))
+        if match.group(2) is not None:
+            return lambda optimizer: getter(optimizer)()
+        return getter
+    try:
+        code = compile(field_definition, '<field>', 'eval')
+    except SyntaxError as e:
+        error:SyntaxError = e
+        def raise_error(optimizer:Any)->Any:
+            raise error
+        return raise_error
+    return lambda optimizer: eval(code, {}, {'self': optimizer})
 
 class OutputControl:
 
@@ -69,6 +109,7 @@ class OutputControl:
 				self.moments)
         oc.__fields_headings = self.fields_headings.copy()
         oc.__fields_definitions = self.fields_definitions.copy()
+        oc.__fields_accessors = self.fields_accessors.copy()
         oc.__write_before_algorithm = self.__write_before_algorithm
         oc.__write_before_iteration= self.__write_before_iteration
         oc.__write_after_iteration = self.__write_after_iteration
@@ -79,6 +120,27 @@ class OutputControl:
         oc.__write_after_algorithm = self.__write_after_algorithm
         return oc
 
+    def __getstate__(self)->dict:
+        """
+        State for pickling, without compiled accessors - they are not picklable, so they are compiled again from 
+        fields definitions when the state is restored
+
+        :return: state of the output control
+        :rtype: dict
+        """
+        state:dict = self.__dict__.copy()
+        del state['_OutputControl__fields_accessors']
+        return state
+
+    def __setstate__(self, state:dict)->None:
+        """
+        Restores the state after unpickling, and compiles fields definitions into accessors
+
+        :param dict state: state of the output control
+        """
+        self.__dict__.update(state)
+        self.__fields_accessors = [compile_field_definition(f_def) for f_def in self.__fields_definitions]
+
     def __determine_fields_helper__(self, fields:str):
         """
         Helper function that determines fields header list anf field definition lists of the control instance
@@ -101,6 +163,9 @@ class OutputControl:
                     f_def = 'self.' + f_def
                 if f_def not in self.fields_definitions:
                     self.fields_definitions.append(f_def)
+        # definitions are compiled once, so writing of values does not parse them again
+        self.__fields_accessors:list[Callable[[Any], Any]] = [compile_field_definition(f_def) 
+                for f_def in self.fields_definitions]
 
     def __determine_moments_helper__(self, moments:str):
         """
@@ -181,6 +246,16 @@ class OutputControl:
         """
         return self.__fields_definitions
 
+    @property
+    def fields_accessors(self)->list[Callable[[Any], Any]]:
+        """
+        Property getter for `fields_accessors` property 
+
+        :return: list of compiled fields definitions - functions that take optimizer and return value of the field
+        :rtype: list[Callable[[Any], Any]]
+        """
+        return self.__fields_accessors
+
     @property
     def fields(self)->str:
         """
@@ -3,7 +3,7 @@ import unittest
 import unittest.mock as mocker
 
 from datetime import datetime
-from io import TextIOWrapper
+from io import TextIOWrapper, StringIO
 
 from uo.problem.problem import Problem
 from uo.algorithm.output_control import OutputControl
@@ -220,6 +220,21 @@ class Test__Optimizer__(unittest.TestCase):
         self.assertIsNone(optimizer.execution_ended)
         self.assertIsNone(optimizer.best_solution)
 
+    # Values of the fields are written by compiled accessors, with 'XXX' for fields that can not be obtained
+    def test_write_output_values_uses_compiled_fields(self):
+        # Arrange
+        output_control = OutputControl(fields='name')
+        output_control.output_file = StringIO()
+        optimizer = OptimizerVoid(name="Optimizer1",
+                    problem=ProblemVoidMinSO("a problem", True),
+                    output_control=output_control
+            )
+        # Act
+        optimizer.write_output_values_if_needed("after_algorithm", "a_a")
+        # Assert
+        self.assertEqual(output_control.output_file.getvalue(), 
+                "XXX\tXXX\ta_a\tXXX\tXXX\tXXX\tXXX\tOptimizer1\t\n")
+
     # The copy method creates a new instance of Optimizer with the same properties.
     def test_copy_method(self):
         # Arrange
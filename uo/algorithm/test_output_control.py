@@ -1,9 +1,11 @@
 
+import pickle
 from io import TextIOWrapper
 import unittest   
 import unittest.mock as mocker
 
 from uo.algorithm.output_control import OutputControl
+from uo.algorithm.output_control import compile_field_definition
 
 class TestOutputControlProperties(unittest.TestCase):
     
@@ -137,5 +139,83 @@ class TestOutputControl(unittest.TestCase):
         with self.assertRaises(ValueError):
             OutputControl(moments=moments)
 
+    # OutputControl object has one compiled accessor for each field definition
+    def test_fields_accessors_correspond_to_fields_definitions(self):
+        # Arrange
+        fields = 'iteration, evaluation, elapsed_seconds()'
+        # Act
+        oc = OutputControl(fields=fields)
+        # Assert
+        self.assertEqual(len(oc.fields_accessors), len(oc.fields_definitions))
+
+    # Copy of the OutputControl object has accessors for the same fields
+    def test_copy_has_same_number_of_fields_accessors(self):
+        # Arrange
+        oc = OutputControl(fields='iteration, evaluation, elapsed_seconds()')
+        # Act
+        oc_copy = oc.copy()
+        # Assert
+        self.assertEqual(len(oc_copy.fields_accessors), len(oc_copy.fields_definitions))
+
+    # OutputControl object can be pickled, and accessors are compiled again after unpickling
+    def test_pickle_round_trip(self):
+        # Arrange
+        oc = OutputControl(fields='iteration, evaluation, elapsed_seconds(), iteration*2', 
+                moments='after_algorithm, after_iteration')
+        optimizer = mocker.MagicMock()
+        optimizer.iteration = 21
+        # Act
+        oc_restored = pickle.loads(pickle.dumps(oc))
+        # Assert
+        self.assertEqual(oc_restored.fields_definitions, oc.fields_definitions)
+        self.assertEqual(oc_restored.moments, oc.moments)
+        self.assertEqual(len(oc_restored.fields_accessors), len(oc_restored.fields_definitions))
+        index = oc_restored.fields_definitions.index('self.iteration*2')
+        self.assertEqual(oc_restored.fields_accessors[index](optimizer), 42)
+
+class TestCompileFieldDefinition(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = mocker.MagicMock()
+        self.optimizer.iteration = 42
+        self.optimizer.best_solution.fitness_value = 3.5
+        self.optimizer.best_solution.string_representation.return_value = '0101'
+
+    # Chain of attributes is read from the optimizer
+    def test_attribute_chain(self):
+        # Act
+        accessor = compile_field_definition('self.best_solution.fitness_value')
+        # Assert
+        self.assertEqual(accessor(self.optimizer), 3.5)
+
+    # Method at the end of the chain is called
+    def test_method_call(self):
+        # Act
+        accessor = compile_field_definition('self.best_solution.string_representation()')
+        # Assert
+        self.assertEqual(accessor(self.optimizer), '0101')
+
+    # String literal becomes constant
+    def test_string_literal(self):
+        # Act
+        accessor = compile_field_definition('"step_name"')
+        # Assert
+        self.assertEqual(accessor(self.optimizer), 'step_name')
+
+    # Other expressions are evaluated with self bound to the optimizer
+    def test_expression(self):
+        # Act
+        accessor = compile_field_definition('self.iteration*2')
+        # Assert
+        self.assertEqual(accessor(self.optimizer), 84)
+
+    # Invalid expression raises exception when value is obtained, not when it is compiled
+    def test_invalid_expression_raises_when_called(self):
+        # Arrange
+        accessor = compile_field_definition('self.iteration+')
+        # Act & Assert
+        with self.assertRaises(SyntaxError):
+            accessor(self.optimizer)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+""" 
+The :mod:`~uo.solution.representation_sampler` module describes the class 
+:class:`~uo.solution.representation_sampler.RepresentationSampler`, that draws many random native representations 
+of solutions at once.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+
+from abc import ABCMeta, abstractmethod
+from copy import deepcopy
+from typing import Generic, Optional, TypeVar
+
+import numpy as np
+
+from uo.utils.halton_sequence import ScrambledHaltonSequence
+
+R_co = TypeVar("R_co", covariant=True) 
+
+class RepresentationSampler(Generic[R_co], metaclass=ABCMeta):
+    """
+    Sampler of random native representations, that draws whole block of representations from NumPy random 
+    generator at once. In low-discrepancy mode, bits are taken from scrambled Halton sequence instead, so the 
+    samples cover the space more evenly than independent random ones.
+    """
+
+    def __init__(self, dimension:int, random_seed:Optional[int]=None, low_discrepancy:bool=False)->None:
+        """
+        Create new `RepresentationSampler` instance
+
+        :param int dimension: number of bits within representation
+        :param Optional[int] random_seed: seed of the random generator - if `None`, generator is seeded from the 
+        operating system
+        :param bool low_discrepancy: if bits are taken from scrambled Halton sequence - bit is set when the 
+        corresponding coordinate of the point is at least one half
+        """
+        if not isinstance(dimension, int):
+            raise TypeError('Parameter \'dimension\' must be \'int\'.')
+        if dimension <= 0:
+            raise ValueError('Parameter \'dimension\' must be greater than zero.')
+        if random_seed is not None and not isinstance(random_seed, int):
+            raise TypeError('Parameter \'random_seed\' must be \'int\' or \'None\'.')
+        if not isinstance(low_discrepancy, bool):
+            raise TypeError('Parameter \'low_discrepancy\' must be \'bool\'.')
+        self.__dimension:int = dimension
+        self.__random_seed:Optional[int] = random_seed
+        self.__low_discrepancy:bool = low_discrepancy
+        self.__generator:np.random.Generator = np.random.default_rng(random_seed)
+        self.__halton_sequence:Optional[ScrambledHaltonSequence] = None
+        if low_discrepancy:
+            self.__halton_sequence = ScrambledHaltonSequence(dimension, self.__generator)
+
+    def copy(self):
+        """
+        Copy the current sampler, with the same state of the random generator
+
+        :return: new instance with the same properties
+        :rtype: :class:`RepresentationSampler`
+        """
+        return deepcopy(self)
+
+    @property
+    def dimension(self)->int:
+        """
+        Property getter for the number of bits within representation
+
+        :return: number of bits within representation
+        :rtype: int
+        """
+        return self.__dimension
+
+    @property
+    def random_seed(self)->Optional[int]:
+        """
+        Property getter for the seed of the random generator
+
+        :return: seed of the random generator
+        :rtype: Optional[int]
+        """
+        return self.__random_seed
+
+    @property
+    def low_discrepancy(self)->bool:
+        """
+        Property getter for the sampling mode
+
+        :return: if bits are taken from scrambled Halton sequence
+        :rtype: bool
+        """
+        return self.__low_discrepancy
+
+    @property
+    def generator(self)->np.random.Generator:
+        """
+        Property getter for the random generator
+
+        :return: random generator of the sampler
+        :rtype: `np.random.Generator`
+        """
+        return self.__generator
+
+    def reseed(self, seed:int|np.random.SeedSequence)->None:
+        """
+        Replaces the random generator with the new one, seeded with the given seed - e.g. with the independent 
+        stream spawned for the worker process
+
+        :param int|np.random.SeedSequence seed: seed of the new random generator
+        """
+        if not isinstance(seed, int|np.random.SeedSequence):
+            raise TypeError('Parameter \'seed\' must be \'int\' or \'SeedSequence\'.')
+        self.__random_seed = seed if isinstance(seed, int) else None
+        self.__generator = np.random.default_rng(seed)
+        if self.__low_discrepancy:
+            self.__halton_sequence = ScrambledHaltonSequence(self.__dimension, self.__generator)
+
+    def random_bytes(self, count:int)->list[bytes]:
+        """
+        Draws random bits for the given number of representations, packed into bytes - bits after the dimension 
+        within the last byte are random, too (or zeros, in low-discrepancy mode)
+
+        :param int count: number of representations
+        :return: packed random bits, one item per representation
+        :rtype: list[bytes]
+        """
+        if self.__low_discrepancy:
+            bits:np.ndarray = (self.__halton_sequence.points(count) >= 0.5).astype(np.uint8)
+            return [row.tobytes() for row in np.packbits(bits, axis=1)]
+        byte_count:int = (self.__dimension + 7) // 8
+        data:bytes = self.__generator.bytes(count * byte_count)
+        return [data[i * byte_count:(i + 1) * byte_count] for i in range(count)]
+
+    @abstractmethod
+    def sample(self, count:int)->list[R_co]:
+        """
+        Draws random native representations
+
+        :param int count: number of representations
+        :return: random native representations
+        :rtype: list[R_co]
+        """
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+""" 
+The :mod:`~uo.solution.representation_sampler_bit_array` module describes the class 
+:class:`~uo.solution.representation_sampler_bit_array.RepresentationSamplerBitArray`.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+
+from bitstring import BitArray
+
+from uo.solution.representation_sampler import RepresentationSampler
+
+class RepresentationSamplerBitArray(RepresentationSampler[BitArray]):
+    """
+    Sampler of uniformly random bit arrays
+    """
+
+    def sample(self, count:int)->list[BitArray]:
+        """
+        Draws uniformly random bit arrays
+
+        :param int count: number of bit arrays
+        :return: random bit arrays, each with length equal to dimension
+        :rtype: list[BitArray]
+        """
+        return [BitArray(bytes=data, length=self.dimension) for data in self.random_bytes(count)]
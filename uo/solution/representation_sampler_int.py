@@ -0,0 +1,27 @@
+""" 
+The :mod:`~uo.solution.representation_sampler_int` module describes the class 
+:class:`~uo.solution.representation_sampler_int.RepresentationSamplerInt`.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+
+from uo.solution.representation_sampler import RepresentationSampler
+
+class RepresentationSamplerInt(RepresentationSampler[int]):
+    """
+    Sampler of uniformly random non-negative ints, whose bits are within dimension
+    """
+
+    def sample(self, count:int)->list[int]:
+        """
+        Draws uniformly random ints
+
+        :param int count: number of ints
+        :return: random ints, between `0` and `2^dimension-1`
+        :rtype: list[int]
+        """
+        # bits are packed from the most significant one, as in bit array
+        return [int.from_bytes(data, 'big') >> (8 * len(data) - self.dimension) for data in self.random_bytes(count)]
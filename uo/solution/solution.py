@@ -462,6 +462,51 @@ class Solution(Generic[R_co,A_co], metaclass=ABCMeta):
         self.fitness_value = qos.fitness_value;
         self.is_feasible = qos.is_feasible;
 
+    def calculate_quality_incrementally(self, representation:R_co, problem:Problem,
+            changed_positions:list[int]) -> Optional[QualityOfSolution]:
+        """
+        Incremental fitness calculation of the target solution, after the representation is changed at the given
+        positions, while objective value, fitness and feasibility of the solution still describe the previous
+        representation. Default implementation does not support incremental calculation
+
+        :param R_co representation: native representation of the solution, already changed
+        :param Problem problem: problem that is solved
+        :param list[int] changed_positions: positions where representation is changed
+        :return: objective value, fitness value and feasibility of the solution instance, or `None` if incremental
+        calculation is not supported
+        :rtype: `Optional[QualityOfSolution]`
+        """
+        return None
+
+    def calculate_quality_batch(self, representations:list[R_co], problem:Problem)->list[QualityOfSolution]:
+        """
+        Fitness calculation for many native representations at once. Default implementation calculates quality 
+        of each representation directly, one by one - it can be overridden for vectorized calculation
+
+        :param list[R_co] representations: native representations of the solutions
+        :param Problem problem: problem that is solved
+        :return: objective value, fitness value and feasibility for each representation, in the same order
+        :rtype: list[`QualityOfSolution`]
+        """
+        return [self.calculate_quality_directly(representation, problem) for representation in representations]
+
+    def evaluate_incrementally(self, problem:Problem, changed_positions:list[int])->None:
+        """
+        Evaluate current target solution, after its representation is changed at the given positions. If
+        incremental calculation is not supported, solution is evaluated as a whole
+
+        :param Problem problem: problem that is solved
+        :param list[int] changed_positions: positions where representation is changed since the last evaluation
+        """
+        qos:Optional[QualityOfSolution] = self.calculate_quality_incrementally(self.representation, problem,
+                changed_positions)
+        if qos is None:
+            self.evaluate(problem)
+            return
+        self.objective_value = qos.objective_value
+        self.fitness_value = qos.fitness_value
+        self.is_feasible = qos.is_feasible
+
     @abstractmethod
     def representation_distance_directly(self, representation_1:R_co, representation_2:R_co)->float:
         """
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from bitstring import BitArray
+
+from uo.solution.representation_sampler_bit_array import RepresentationSamplerBitArray
+from uo.solution.representation_sampler_int import RepresentationSamplerInt
+
+class TestRepresentationSampler(unittest.TestCase):
+
+    # sampled bit arrays have the given dimension
+    def test_bit_array_sampler_should_draw_bit_arrays_of_dimension(self):
+        # Arrange
+        sampler = RepresentationSamplerBitArray(13, random_seed=42)
+        # Act
+        representations = sampler.sample(50)
+        # Assert
+        self.assertEqual(len(representations), 50)
+        for representation in representations:
+            self.assertIsInstance(representation, BitArray)
+            self.assertEqual(len(representation), 13)
+        self.assertGreater(len(set(r.bin for r in representations)), 40)
+
+    # sampled ints fit within dimension
+    def test_int_sampler_should_draw_ints_within_dimension(self):
+        # Arrange
+        sampler = RepresentationSamplerInt(10, random_seed=42)
+        # Act
+        representations = sampler.sample(200)
+        # Assert
+        self.assertTrue(all(0 <= r < 1024 for r in representations))
+        self.assertGreater(max(representations), 511)
+
+    # samplers with the same seed draw the same representations, and copy keeps the state of the generator
+    def test_same_seed_and_copy_should_draw_same_representations(self):
+        # Arrange
+        sampler1 = RepresentationSamplerBitArray(20, random_seed=7)
+        sampler2 = RepresentationSamplerBitArray(20, random_seed=7)
+        sampler1.sample(3)
+        sampler2.sample(3)
+        sampler_copy = sampler1.copy()
+        # Act
+        representations1 = sampler1.sample(5)
+        representations2 = sampler2.sample(5)
+        representations_copy = sampler_copy.sample(5)
+        # Assert
+        self.assertEqual(representations1, representations2)
+        self.assertEqual(representations_copy, representations1)
+
+    # samplers reseeded with streams spawned from the same seed sequence draw different representations
+    def test_reseed_with_spawned_streams_should_draw_independent_representations(self):
+        # Arrange
+        streams = np.random.SeedSequence(42).spawn(2)
+        sampler1 = RepresentationSamplerBitArray(32)
+        sampler2 = RepresentationSamplerBitArray(32)
+        sampler1.reseed(streams[0])
+        sampler2.reseed(streams[1])
+        # Act
+        representations1 = sampler1.sample(5)
+        representations2 = sampler2.sample(5)
+        # Assert
+        self.assertNotEqual(representations1, representations2)
+        self.assertIsNone(sampler1.random_seed)
+
+    # in low-discrepancy mode, each bit is set in about half of the samples, and ints match bit arrays
+    def test_low_discrepancy_sampler_should_balance_bits(self):
+        # Arrange
+        sampler = RepresentationSamplerBitArray(20, random_seed=3, low_discrepancy=True)
+        sampler_int = RepresentationSamplerInt(20, random_seed=3, low_discrepancy=True)
+        # Act
+        representations = sampler.sample(64)
+        representations_int = sampler_int.sample(64)
+        # Assert
+        bits = np.array([[int(c) for c in r.bin] for r in representations])
+        self.assertTrue(np.all(np.abs(bits.mean(axis=0) - 0.5) <= 0.07))
+        self.assertEqual(representations_int, [r.uint for r in representations])
+        self.assertTrue(sampler.low_discrepancy)
+
+    # non-positive dimension raises ValueError
+    def test_non_positive_dimension_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            RepresentationSamplerInt(0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -132,5 +132,32 @@ class TestSolutionProperties(unittest.TestCase):
     def tearDownClass(cls):
         print("\ntearDownClass TestSolutionProperties")
     
+class TestSolutionEvaluateIncrementally(unittest.TestCase):
+
+    # without incremental calculation, solution is evaluated as a whole
+    def test_evaluate_incrementally_should_fall_back_to_evaluate(self):
+        # Arrange
+        problem = mocker.MagicMock(spec=Problem)
+        solution = SolutionVoidInt(42, 0, 0, False)
+        # Act
+        solution.evaluate_incrementally(problem, [1, 2])
+        # Assert
+        self.assertEqual(solution.fitness_value, 42)
+        self.assertTrue(solution.is_feasible)
+
+    # incremental calculation is used when available
+    def test_evaluate_incrementally_should_use_incremental_calculation(self):
+        # Arrange
+        problem = mocker.MagicMock(spec=Problem)
+        solution = SolutionVoidInt(42, 0, 0, False)
+        solution.calculate_quality_incrementally = mocker.MagicMock(
+                return_value=QualityOfSolution(7, None, 8, None, True))
+        # Act
+        solution.evaluate_incrementally(problem, [1, 2])
+        # Assert
+        solution.calculate_quality_incrementally.assert_called_once_with(solution.representation, problem, [1, 2])
+        self.assertEqual(solution.objective_value, 7)
+        self.assertEqual(solution.fitness_value, 8)
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+
+import numpy as np
+
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import CentralDifferenceGradientProvider
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import SpsaGradientProvider
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import AnalyticGradientProvider
+
+class CountingTask:
+    """
+    Task `sum(weights * x^2)`, that accepts single point or matrix with one point per row
+    """
+    def __init__(self, weights:np.ndarray)->None:
+        self.weights = np.asarray(weights, dtype=float)
+        self.calls = 0
+
+    def __call__(self, x:np.ndarray):
+        self.calls += 1
+        return np.sum(self.weights * x ** 2, axis=-1)
+
+class TestCentralDifferenceGradientProvider(unittest.TestCase):
+
+    def test_gradient_should_be_close_to_exact_gradient(self):
+        # Arrange
+        task = CountingTask([1.0, 2.0, 3.0])
+        x = np.array([0.5, -1.0, 2.0])
+        # Act
+        grad = CentralDifferenceGradientProvider().gradient(0, task, x)
+        # Assert
+        self.assertTrue(np.allclose(grad, 2 * task.weights * x, atol=1e-6))
+
+    def test_constructor_should_raise_value_error_when_eps_is_not_positive(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            CentralDifferenceGradientProvider(eps=0.0)
+
+class TestSpsaGradientProvider(unittest.TestCase):
+
+    def test_gradient_should_call_task_twice_regardless_of_dimension(self):
+        # Arrange
+        task = CountingTask(np.ones(200))
+        # Act
+        SpsaGradientProvider(seed=1).gradient(0, task, np.ones(200))
+        # Assert
+        self.assertEqual(task.calls, 2)
+
+    def test_batched_gradient_should_call_task_once(self):
+        # Arrange
+        task = CountingTask(np.ones(200))
+        # Act
+        SpsaGradientProvider(samples=4, batched=True, seed=1).gradient(0, task, np.ones(200))
+        # Assert
+        self.assertEqual(task.calls, 1)
+
+    def test_batched_gradient_should_be_equal_to_unbatched_gradient_for_same_seed(self):
+        # Arrange
+        task = CountingTask([1.0, 2.0, 3.0, 4.0])
+        x = np.array([0.5, -1.0, 2.0, 0.1])
+        # Act
+        g_unbatched = SpsaGradientProvider(samples=3, seed=5).gradient(0, task, x)
+        g_batched = SpsaGradientProvider(samples=3, batched=True, seed=5).gradient(0, task, x)
+        # Assert
+        self.assertTrue(np.allclose(g_unbatched, g_batched))
+
+    def test_average_of_estimates_should_approach_exact_gradient(self):
+        # Arrange
+        task = CountingTask([1.0, 2.0, 3.0])
+        x = np.array([0.5, -1.0, 2.0])
+        # Act
+        grad = SpsaGradientProvider(samples=5000, batched=True, seed=3).gradient(0, task, x)
+        # Assert
+        self.assertTrue(np.allclose(grad, 2 * task.weights * x, atol=0.5))
+
+    def test_task_generators_should_give_different_perturbations_for_tasks_and_steps(self):
+        # Arrange
+        provider = SpsaGradientProvider(seed=11)
+        task = CountingTask(np.ones(50))
+        x = np.ones(50)
+        # Act
+        step_1 = [provider.gradient(i, task, x, g) for i, g in enumerate(provider.task_generators(2))]
+        step_2 = [provider.gradient(i, task, x, g) for i, g in enumerate(provider.task_generators(2))]
+        # Assert
+        self.assertFalse(np.allclose(step_1[0], step_1[1]))
+        self.assertFalse(np.allclose(step_1[0], step_2[0]))
+
+    def test_task_generators_should_be_reproducible_for_same_seed(self):
+        # Arrange
+        task = CountingTask(np.ones(10))
+        x = np.ones(10)
+        provider_1 = SpsaGradientProvider(seed=11)
+        provider_2 = SpsaGradientProvider(seed=11)
+        # Act
+        g_1 = provider_1.gradient(0, task, x, provider_1.task_generators(1)[0])
+        g_2 = provider_2.gradient(0, task, x, provider_2.task_generators(1)[0])
+        # Assert
+        self.assertTrue(np.array_equal(g_1, g_2))
+
+class TestAnalyticGradientProvider(unittest.TestCase):
+
+    def test_gradient_should_use_analytic_gradient_of_the_task(self):
+        # Arrange
+        task = CountingTask([1.0, 2.0])
+        provider = AnalyticGradientProvider([lambda x: 2 * task.weights * x])
+        x = np.array([1.0, 1.0])
+        # Act
+        grad = provider.gradient(0, task, x)
+        # Assert
+        self.assertTrue(np.array_equal(grad, [2.0, 4.0]))
+        self.assertEqual(task.calls, 0)
+
+    def test_gradient_should_use_fallback_when_task_has_no_analytic_gradient(self):
+        # Arrange
+        task = CountingTask([1.0, 2.0])
+        provider = AnalyticGradientProvider([None])
+        x = np.array([1.0, 1.0])
+        # Act
+        grad = provider.gradient(0, task, x)
+        # Assert
+        self.assertTrue(np.allclose(grad, [2.0, 4.0], atol=1e-6))
+        self.assertEqual(task.calls, 4)
+
+if __name__ == '__main__':
+    unittest.main()
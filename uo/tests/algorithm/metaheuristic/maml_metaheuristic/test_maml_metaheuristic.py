@@ -1,7 +1,10 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import numpy as np
 
 from uo.algorithm.metaheuristic.maml_metaheuristic.maml_metaheuristic import MAMLMetaheuristic
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import AnalyticGradientProvider
+from uo.algorithm.metaheuristic.maml_metaheuristic.gradient_provider import SpsaGradientProvider
 
 def quadratic_task1(x: np.ndarray) -> float:
     return float((x[0] - 1.0) ** 2)
@@ -124,8 +127,136 @@ class TestMAMLMetaheuristicNumeric(unittest.TestCase):
         print(f"Average error has decreased from {avg_errors[0]:.4f} to {avg_errors[-1]:.4f}")
 
 
+class QuadraticTask:
+    """
+    Task `sum((x - center)^2)`, that accepts single point or matrix with one point per row
+    """
+    def __init__(self, center:np.ndarray)->None:
+        self.center = np.asarray(center, dtype=float)
+        self.calls = 0
 
+    def __call__(self, x:np.ndarray):
+        self.calls += 1
+        return np.sum((x - self.center) ** 2, axis=-1)
 
+class TestMAMLMetaheuristicGradients(unittest.TestCase):
+
+    def test_batched_gradient_should_be_equal_to_looped_gradient(self):
+        # Arrange
+        task = QuadraticTask([1.0, -2.0, 0.5])
+        looped = MAMLMetaheuristic([task], seed=3)
+        batched = MAMLMetaheuristic([task], seed=3, batched_tasks=True)
+        x = np.array([0.3, 0.1, -0.7])
+        # Act
+        g_looped = looped._grad(task, x)
+        g_batched = batched._grad(task, x)
+        # Assert
+        self.assertTrue(np.allclose(g_looped, g_batched))
+        self.assertTrue(np.allclose(g_batched, 2 * (x - task.center), atol=1e-6))
+
+    def test_batched_gradient_should_call_task_once(self):
+        # Arrange
+        task = QuadraticTask(np.zeros(5))
+        maml = MAMLMetaheuristic([task], batched_tasks=True)
+        # Act
+        maml._grad(task, np.ones(5))
+        # Assert
+        self.assertEqual(task.calls, 1)
+
+    def test_looped_gradient_should_call_task_twice_per_dimension(self):
+        # Arrange
+        task = QuadraticTask(np.zeros(5))
+        maml = MAMLMetaheuristic([task])
+        # Act
+        maml._grad(task, np.ones(5))
+        # Assert
+        self.assertEqual(task.calls, 10)
+
+    def test_run_with_executor_should_be_equal_to_sequential_run(self):
+        # Arrange
+        tasks = [QuadraticTask([1.0, 2.0]), QuadraticTask([3.0, 0.0]), QuadraticTask([-1.0, 1.0])]
+        sequential = MAMLMetaheuristic(tasks, alpha=0.1, beta=0.1, outer_steps=50, seed=5, batched_tasks=True)
+        theta_sequential = sequential.run(2)
+        # Act
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            parallel = MAMLMetaheuristic(tasks, alpha=0.1, beta=0.1, outer_steps=50, seed=5,
+                    batched_tasks=True, executor=executor)
+            theta_parallel = parallel.run(2)
+        # Assert
+        self.assertTrue(np.allclose(theta_sequential, theta_parallel))
+
+    def test_run_with_process_pool_executor_should_be_equal_to_sequential_run(self):
+        # Arrange
+        tasks = [QuadraticTask([1.0, 2.0]), QuadraticTask([3.0, 0.0]), QuadraticTask([-1.0, 1.0])]
+        sequential = MAMLMetaheuristic(tasks, alpha=0.1, beta=0.1, outer_steps=10, seed=5, batched_tasks=True)
+        theta_sequential = sequential.run(2)
+        # Act
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = MAMLMetaheuristic(tasks, alpha=0.1, beta=0.1, outer_steps=10, seed=5,
+                    batched_tasks=True, executor=executor)
+            theta_parallel = parallel.run(2)
+        # Assert
+        self.assertTrue(np.allclose(theta_sequential, theta_parallel))
+
+    def test_run_should_converge_to_mean_of_task_centers(self):
+        # Arrange
+        tasks = [QuadraticTask([1.0, 2.0]), QuadraticTask([3.0, 0.0])]
+        maml = MAMLMetaheuristic(tasks, alpha=0.1, beta=0.1, outer_steps=300, seed=1, batched_tasks=True)
+        # Act
+        theta = maml.run(2)
+        # Assert
+        self.assertTrue(np.allclose(theta, [2.0, 1.0], atol=1e-3))
+
+    def test_run_with_analytic_gradients_should_not_call_tasks(self):
+        # Arrange
+        tasks = [QuadraticTask([1.0, 2.0]), QuadraticTask([3.0, 0.0])]
+        provider = AnalyticGradientProvider([lambda x, t=t: 2 * (x - t.center) for t in tasks])
+        maml = MAMLMetaheuristic(tasks, alpha=0.1, beta=0.1, outer_steps=300, seed=1, gradient_provider=provider)
+        # Act
+        theta = maml.run(2)
+        # Assert
+        self.assertTrue(np.allclose(theta, [2.0, 1.0], atol=1e-3))
+        self.assertEqual(sum(t.calls for t in tasks), 0)
+
+    def test_run_with_spsa_should_approach_mean_of_task_centers(self):
+        # Arrange
+        tasks = [QuadraticTask(np.full(20, 1.0)), QuadraticTask(np.full(20, 3.0))]
+        theta_start = MAMLMetaheuristic(tasks, outer_steps=0, seed=1).run(20)
+        maml = MAMLMetaheuristic(tasks, alpha=0.05, beta=0.02, outer_steps=1000, seed=1,
+                gradient_provider=SpsaGradientProvider(seed=7))
+        # Act
+        theta = maml.run(20)
+        # Assert
+        self.assertLess(np.linalg.norm(theta - 2.0), 0.5 * np.linalg.norm(theta_start - 2.0))
+        self.assertAlmostEqual(theta.mean(), 2.0, delta=0.3)
+
+    def test_run_with_spsa_and_process_pool_executor_should_be_equal_to_sequential_run(self):
+        # Arrange
+        tasks = [QuadraticTask(np.full(10, 1.0)), QuadraticTask(np.full(10, 3.0))]
+        sequential = MAMLMetaheuristic(tasks, alpha=0.05, beta=0.02, outer_steps=10, seed=1,
+                gradient_provider=SpsaGradientProvider(seed=7))
+        theta_sequential = sequential.run(10)
+        # Act
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = MAMLMetaheuristic(tasks, alpha=0.05, beta=0.02, outer_steps=10, seed=1,
+                    gradient_provider=SpsaGradientProvider(seed=7), executor=executor)
+            theta_parallel = parallel.run(10)
+        # Assert
+        self.assertTrue(np.allclose(theta_sequential, theta_parallel))
+
+    def test_constructor_should_raise_type_error_when_gradient_provider_is_not_gradient_provider(self):
+        # Arrange
+        tasks = [QuadraticTask([0.0])]
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            MAMLMetaheuristic(tasks, gradient_provider=lambda f, x: x)
+
+    def test_constructor_should_raise_type_error_when_executor_is_not_executor(self):
+        # Arrange
+        tasks = [QuadraticTask([0.0])]
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            MAMLMetaheuristic(tasks, executor='executor')
 
 
 if __name__ == "__main__":
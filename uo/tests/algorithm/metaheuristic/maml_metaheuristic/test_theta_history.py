@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from uo.algorithm.metaheuristic.maml_metaheuristic.maml_metaheuristic import MAMLMetaheuristic
+from uo.algorithm.metaheuristic.maml_metaheuristic.theta_history import NoThetaHistory
+from uo.algorithm.metaheuristic.maml_metaheuristic.theta_history import EveryKThetaHistory
+from uo.algorithm.metaheuristic.maml_metaheuristic.theta_history import RingThetaHistory
+from uo.algorithm.metaheuristic.maml_metaheuristic.theta_history import MemmapThetaHistory
+
+def record(history, outer_steps:int, dim:int):
+    history.start(outer_steps, dim)
+    for step in range(outer_steps):
+        history.append(step, np.full(dim, float(step)))
+    history.finish()
+    return history
+
+def task(x:np.ndarray) -> float:
+    return float(np.sum((x - 1.0) ** 2))
+
+class TestThetaHistory(unittest.TestCase):
+
+    def test_no_history_should_record_nothing(self):
+        # Act
+        history = record(NoThetaHistory(), 10, 3)
+        # Assert
+        self.assertEqual(history.values.shape, (0, 3))
+        self.assertEqual(len(history.steps), 0)
+
+    def test_every_k_history_should_record_every_k_th_and_last_step(self):
+        # Act
+        history = record(EveryKThetaHistory(3), 10, 2)
+        # Assert
+        self.assertEqual(history.steps.tolist(), [2, 5, 8, 9])
+        self.assertEqual(history.values[:, 0].tolist(), [2.0, 5.0, 8.0, 9.0])
+
+    def test_every_k_history_with_k_one_should_record_all_steps(self):
+        # Act
+        history = record(EveryKThetaHistory(), 5, 2)
+        # Assert
+        self.assertEqual(history.steps.tolist(), [0, 1, 2, 3, 4])
+
+    def test_ring_history_should_keep_last_values_from_oldest_to_newest(self):
+        # Act
+        history = record(RingThetaHistory(4), 10, 2)
+        # Assert
+        self.assertEqual(history.steps.tolist(), [6, 7, 8, 9])
+        self.assertEqual(history.values[:, 1].tolist(), [6.0, 7.0, 8.0, 9.0])
+
+    def test_ring_history_should_keep_all_values_when_size_is_not_reached(self):
+        # Act
+        history = record(RingThetaHistory(4), 3, 2)
+        # Assert
+        self.assertEqual(history.steps.tolist(), [0, 1, 2])
+
+    def test_memmap_history_should_write_values_to_npy_file(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'theta.npy')
+            # Act
+            history = record(MemmapThetaHistory(file_path, 2), 7, 3)
+            loaded = np.load(file_path)
+            # Assert
+            self.assertEqual(loaded.shape, (4, 3))
+            self.assertEqual(loaded[:, 2].tolist(), [1.0, 3.0, 5.0, 6.0])
+            self.assertEqual(history.steps.tolist(), [1, 3, 5, 6])
+            del history
+
+    def test_constructor_should_raise_value_error_when_size_is_not_positive(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            RingThetaHistory(0)
+
+class TestMAMLMetaheuristicThetaHistory(unittest.TestCase):
+
+    def test_run_should_record_theta_by_history_policy(self):
+        # Arrange
+        maml = MAMLMetaheuristic([task], alpha=0.1, beta=0.1, outer_steps=20, seed=2,
+                theta_history=RingThetaHistory(5))
+        # Act
+        theta = maml.run(2)
+        # Assert
+        self.assertEqual(maml.theta_history.values.shape, (5, 2))
+        self.assertTrue(np.array_equal(maml.theta_history.values[-1], theta))
+
+    def test_run_should_record_nothing_by_default(self):
+        # Arrange
+        maml = MAMLMetaheuristic([task], outer_steps=20, seed=2)
+        # Act
+        maml.run(2)
+        # Assert
+        self.assertEqual(len(maml.theta_history.values), 0)
+
+    def test_constructor_should_raise_type_error_when_theta_history_is_not_theta_history(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            MAMLMetaheuristic([task], theta_history=[])
+
+if __name__ == '__main__':
+    unittest.main()
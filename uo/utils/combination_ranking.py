@@ -0,0 +1,115 @@
+"""
+The :mod:`~uo.utils.combination_ranking` module contains utility functions for lexicographic ranking of
+combinations, so the space of all k-element subsets of {0,...,n-1} can be split into contiguous chunks of ranks.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+import math
+import random
+
+from typing import Iterator
+
+def combination_count(n:int, k:int)->int:
+        """
+        Number of k-element subsets of the set with n elements
+
+        :param int n: number of elements
+        :param int k: number of chosen elements
+        :return: binomial coefficient `C(n,k)`
+        :rtype: int
+        """
+        if not isinstance(n, int):
+                raise TypeError('Parameter \'n\' must be \'int\'.')
+        if not isinstance(k, int):
+                raise TypeError('Parameter \'k\' must be \'int\'.')
+        if n < 0 or k < 0 or k > n:
+                return 0
+        return math.comb(n, k)
+
+def unrank_combination(rank:int, n:int, k:int)->list[int]:
+        """
+        Combination with the given rank, in lexicographic order of all k-element subsets of {0,...,n-1}
+
+        :param int rank: rank of the combination, between `0` and `C(n,k)-1`
+        :param int n: number of elements
+        :param int k: number of chosen elements
+        :return: ascending list of chosen elements
+        :rtype: list[int]
+        """
+        if not isinstance(rank, int):
+                raise TypeError('Parameter \'rank\' must be \'int\'.')
+        if rank < 0 or rank >= combination_count(n, k):
+                raise ValueError('Parameter \'rank\' must be between 0 and C(n,k)-1.')
+        combination:list[int] = []
+        element:int = 0
+        for remaining in range(k, 0, -1):
+                # skip all combinations that start with smaller elements
+                while True:
+                        count:int = math.comb(n - element - 1, remaining - 1)
+                        if rank < count:
+                                break
+                        rank -= count
+                        element += 1
+                combination.append(element)
+                element += 1
+        return combination
+
+def next_combination(combination:list[int], n:int)->bool:
+        """
+        Transforms combination, in place, into the next one in lexicographic order
+
+        :param list[int] combination: ascending list of chosen elements, from {0,...,n-1}
+        :param int n: number of elements
+        :return: if next combination exists - if not, combination is not changed
+        :rtype: bool
+        """
+        k:int = len(combination)
+        i:int = k - 1
+        while i >= 0 and combination[i] == n - k + i:
+                i -= 1
+        if i < 0:
+                return False
+        combination[i] += 1
+        for j in range(i + 1, k):
+                combination[j] = combination[j - 1] + 1
+        return True
+
+def sample_combinations(n:int, k:int, count:int)->Iterator[list[int]]:
+        """
+        Uniformly random sample of different k-element subsets of {0,...,n-1}, generated lazily, so only the 
+        combinations that are actually consumed are drawn.
+        When sample is small relative to the number of all combinations, random subsets are drawn directly and
+        repetitions are rejected; otherwise, random permutation of ranks is generated step by step (Fisher-Yates
+        shuffle, with only swapped positions stored) and ranks are unranked.
+
+        :param int n: number of elements
+        :param int k: number of chosen elements
+        :param int count: number of combinations in sample - if larger than `C(n,k)`, all combinations are generated
+        :return: generator of combinations, each as ascending list of chosen elements, in random order
+        :rtype: Iterator[list[int]]
+        """
+        total:int = combination_count(n, k)
+        count = min(count, total)
+        if count <= 0:
+                return
+        if 2 * count <= total:
+                seen:set[tuple[int, ...]] = set()
+                while len(seen) < count:
+                        combination:tuple[int, ...] = tuple(sorted(random.sample(range(n), k)))
+                        if combination not in seen:
+                                seen.add(combination)
+                                yield list(combination)
+                return
+        # positions of the rank permutation that differ from identity
+        swapped:dict[int, int] = {}
+        for i in range(count):
+                j:int = random.randrange(i, total)
+                rank:int = swapped.get(j, j)
+                swapped[j] = swapped.get(i, i)
+                swapped.pop(i, None)
+                yield unrank_combination(rank, n, k)
@@ -14,19 +14,35 @@ class ComplexCounterBitArrayFull:
     This class describes complex counter with uniform values, that counts full 
     """
 
-    def __init__(self, number_of_counters:int)->None:
+    def __init__(self, number_of_counters:int, prefix_length:int=0, prefix:int=0)->None:
         """
         Create new ComplexCounterBitArrayFull instance
 
         :param int number_of_counters: number of counters within complex counter
-        :param int counter_size: size of each counter within complex counter
+        :param int prefix_length: number of the highest counters that are fixed, so only the part of the space 
+        with the given prefix is counted
+        :param int prefix: value of the fixed highest counters - bit `i` of the prefix is the value of the 
+        counter at position `number_of_counters - prefix_length + i`
         """
         if not isinstance(number_of_counters, int):
                 raise TypeError('Parameter \'number_of_counters\' must be \'int\'.')        
         if number_of_counters <= 0:
                 raise ValueError('Parameter \'number_of_counters\' must be greater than zero.')                    
+        if not isinstance(prefix_length, int):
+                raise TypeError('Parameter \'prefix_length\' must be \'int\'.')        
+        if prefix_length < 0 or prefix_length > number_of_counters:
+                raise ValueError('Parameter \'prefix_length\' must be between 0 and number of counters.')
+        if not isinstance(prefix, int):
+                raise TypeError('Parameter \'prefix\' must be \'int\'.')        
+        if prefix < 0 or prefix >= pow(2, prefix_length):
+                raise ValueError('Parameter \'prefix\' must be between 0 and 2^prefix_length-1.')
         self.__number_of_counters:int = number_of_counters
+        self.__prefix_length:int = prefix_length
+        self.__prefix:int = prefix
+        # counters below this position are free to progress
+        self.__free_counters:int = number_of_counters - prefix_length
         self.__counters:BitArray = BitArray(number_of_counters)
+        self.__set_prefix()
 
     def copy(self):
         """
@@ -35,10 +51,37 @@ class ComplexCounterBitArrayFull:
         :return:  new `ComplexCounterBitArrayFull` instance with the same properties
         :rtype: :class:`uo.utils.ComplexCounterBitArrayFull`
         """
-        cc = ComplexCounterBitArrayFull(self.__number_of_counters)
+        cc = ComplexCounterBitArrayFull(self.__number_of_counters, self.__prefix_length, self.__prefix)
         cc.__counters = BitArray(bin=self.__counters.bin)
         return cc
 
+    @property
+    def prefix_length(self)->int:
+        """
+        Property getter for the number of fixed highest counters
+
+        :return: number of fixed highest counters
+        :rtype: int
+        """
+        return self.__prefix_length
+
+    @property
+    def prefix(self)->int:
+        """
+        Property getter for the value of the fixed highest counters
+
+        :return: value of the fixed highest counters
+        :rtype: int
+        """
+        return self.__prefix
+
+    def __set_prefix(self)->None:
+        """
+        Sets fixed highest counters to the prefix value
+        """
+        for i in range(self.__prefix_length):
+            self.__counters[self.__free_counters + i] = bool(self.__prefix >> i & 1)
+
     def current_state(self)->BitArray:
         """
         Returns current state of the complex counter
@@ -48,6 +91,21 @@ class ComplexCounterBitArrayFull:
         """
         return self.__counters
 
+    def set_state(self, state:BitArray)->None:
+        """
+        Sets the complex counter to the given state, e.g. when enumeration is resumed
+
+        :param BitArray state: state of the complex counter, with the prefix of the counter
+        """
+        if not isinstance(state, BitArray):
+                raise TypeError('Parameter \'state\' must be \'BitArray\'.')
+        if len(state) != self.__number_of_counters:
+                raise ValueError('Parameter \'state\' must have length equal to the number of counters.')
+        for i in range(self.__prefix_length):
+            if state[self.__free_counters + i] != bool(self.__prefix >> i & 1):
+                raise ValueError('Parameter \'state\' must have the prefix of the counter.')
+        self.__counters = state.copy()
+
     def reset(self)->bool:
         """
         Resets the complex counter to its initial position.
@@ -56,6 +114,7 @@ class ComplexCounterBitArrayFull:
         :rtype: bool
         """
         self.__counters.set(False)
+        self.__set_prefix()
         return self.__number_of_counters > 0
 
     def progress(self)->bool:
@@ -65,15 +124,21 @@ class ComplexCounterBitArrayFull:
         :return: if progress is successful
         :rtype: bool
         """
-        if self.__counters.all(True, range(self.__number_of_counters)):
+        if not self.can_progress():
             return False
-        ind_not_max:int = self.__counters.find('0b0')[0]
+        ind_not_max:int = self.__counters.find('0b0', end=self.__free_counters)[0]
         self.__counters[ind_not_max] = True
         self.__counters.set(False, range(0,ind_not_max))
         return True
 
     def can_progress(self)->bool:
-        return not self.__counters.all(True)
+        """
+        Determine if complex counter can progress, within the part of the space with the given prefix.
+
+        :return: if progress is possible
+        :rtype: bool
+        """
+        return not self.__counters.all(True, range(self.__free_counters))
 
 
 # testing the developed class
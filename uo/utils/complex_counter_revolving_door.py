@@ -0,0 +1,123 @@
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+
+from copy import deepcopy
+from typing import Optional
+
+class ComplexCounterRevolvingDoor:
+    """
+    This class describes complex counter that visits all combinations of `number_of_counters` different values
+    from {0,...,`counter_size`-1} in revolving-door (Gray code) order - consecutive combinations differ in
+    exactly one value removed and one value added
+    """
+
+    def __init__(self, number_of_counters:int, counter_size:int)->None:
+        """
+        Create new ComplexCounterRevolvingDoor instance
+
+        :param int number_of_counters: number of counters within complex counter
+        :param int counter_size: size of each counter within complex counter
+        """
+        if not isinstance(number_of_counters, int):
+                raise TypeError('Parameter \'number_of_counters\' must be \'int\'.')
+        if number_of_counters <= 0:
+                raise ValueError('Parameter \'number_of_counters\' must be greater than zero.')
+        if not isinstance(counter_size, int):
+                raise TypeError('Parameter \'counter_size\' must be \'int\'.')
+        if counter_size <= 0:
+                raise ValueError('Parameter \'counter_size\' must be greater than zero.')
+        if counter_size < number_of_counters:
+                raise ValueError('Parameter \'counter_size\' must be greater or equal to parameter \'number_of_counters\'.')
+        self.__number_of_counters:int = number_of_counters
+        self.__counter_size:int = counter_size
+        # counters are kept at positions 1..t, with sentinel at position t+1, as in Knuth's algorithm R
+        self.__counters:list[int] = [0] * (number_of_counters + 2)
+        self.__last_swap:Optional[tuple[int,int]] = None
+        self.reset()
+
+    def copy(self):
+        """
+        Copy the current complex counter
+
+        :return:  new `ComplexCounterRevolvingDoor` instance with the same properties
+        :rtype: :class:`uo.utils.ComplexCounterRevolvingDoor`
+        """
+        ccrd = deepcopy(self)
+        return ccrd
+
+    def current_state(self)->list[int]:
+        """
+        Returns current state of the complex counter
+
+        :return: current state of the complex counter, as ascending list of values
+        :rtype: list[int]
+        """
+        return self.__counters[1:self.__number_of_counters+1]
+
+    @property
+    def last_swap(self)->Optional[tuple[int,int]]:
+        """
+        Property getter for the last change of the complex counter
+
+        :return: value removed and value added during the last progress, or `None` after reset
+        :rtype: Optional[tuple[int,int]]
+        """
+        return self.__last_swap
+
+    def reset(self)->bool:
+        """
+        Resets the complex counter to its initial position.
+
+        :return: if progress is possible after resetting
+        :rtype: bool
+        """
+        for j in range(1, self.__number_of_counters + 1):
+            self.__counters[j] = j - 1
+        self.__counters[self.__number_of_counters + 1] = self.__counter_size
+        self.__last_swap = None
+        return self.__number_of_counters * self.__counter_size > 0
+
+    def progress(self)->bool:
+        """
+        Make the progress to the complex counter. At the same time, determine if complex counter can progress.
+
+        :return: if progress is successful
+        :rtype: bool
+        """
+        c:list[int] = self.__counters
+        t:int = self.__number_of_counters
+        if t % 2 == 1:
+            if c[1] + 1 < c[2]:
+                self.__last_swap = (c[1], c[1] + 1)
+                c[1] += 1
+                return True
+            j:int = 2
+            try_decrease:bool = True
+        else:
+            if c[1] > 0:
+                self.__last_swap = (c[1], c[1] - 1)
+                c[1] -= 1
+                return True
+            j:int = 2
+            try_decrease:bool = False
+        while j <= t:
+            if try_decrease:
+                # c[j] = c[j-1] + 1
+                if c[j] >= j:
+                    self.__last_swap = (c[j], j - 2)
+                    c[j] = c[j-1]
+                    c[j-1] = j - 2
+                    return True
+                j += 1
+            else:
+                # c[j-1] = j - 2
+                if c[j] + 1 < c[j+1]:
+                    self.__last_swap = (j - 2, c[j] + 1)
+                    c[j-1] = c[j]
+                    c[j] += 1
+                    return True
+                j += 1
+            try_decrease = not try_decrease
+        return False
@@ -0,0 +1,154 @@
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+
+from copy import deepcopy
+from typing import Iterable, Optional
+
+from bitstring import BitArray
+
+class DontLookBits:
+    """
+    This class describes don't-look bits - positions where moves recently failed to improve the solution are
+    marked, so they can be skipped until the solution changes at them, or at positions related to them
+    """
+
+    def __init__(self, dimension:int, related_positions:Optional[dict[int, list[int]]]=None)->None:
+        """
+        Create new DontLookBits instance
+
+        :param int dimension: number of positions
+        :param Optional[dict[int, list[int]]] related_positions: positions whose bits are also reset when bit at
+        the key position is reset - if `None`, positions are not related
+        """
+        if not isinstance(dimension, int):
+                raise TypeError('Parameter \'dimension\' must be \'int\'.')
+        if dimension <= 0:
+                raise ValueError('Parameter \'dimension\' must be greater than zero.')
+        if related_positions is not None and not isinstance(related_positions, dict):
+                raise TypeError('Parameter \'related_positions\' must be \'dict\' or \'None\'.')
+        self.__dimension:int = dimension
+        self.__related_positions:Optional[dict[int, list[int]]] = related_positions
+        self.__bits:list[bool] = [False] * dimension
+        self.__reference:Optional[BitArray|int] = None
+
+    def copy(self):
+        """
+        Copy the current don't-look bits
+
+        :return:  new `DontLookBits` instance with the same properties
+        :rtype: :class:`uo.utils.DontLookBits`
+        """
+        dlb = deepcopy(self)
+        return dlb
+
+    @property
+    def dimension(self)->int:
+        """
+        Property getter for the number of positions
+
+        :return: number of positions
+        :rtype: int
+        """
+        return self.__dimension
+
+    @property
+    def related_positions(self)->Optional[dict[int, list[int]]]:
+        """
+        Property getter for the relation between positions
+
+        :return: positions related to each position, or `None`
+        :rtype: Optional[dict[int, list[int]]]
+        """
+        return self.__related_positions
+
+    def is_looking(self, position:int)->bool:
+        """
+        Determines if moves at the position should be tried
+
+        :param int position: position
+        :return: if don't-look bit of the position is not set
+        :rtype: bool
+        """
+        return not self.__bits[position]
+
+    def looks_any(self, positions:Iterable[int])->bool:
+        """
+        Determines if move that changes given positions should be tried
+
+        :param Iterable[int] positions: positions changed by the move
+        :return: if don't-look bit of at least one position is not set
+        :rtype: bool
+        """
+        return any(not self.__bits[i] for i in positions)
+
+    def looking_positions(self)->list[int]:
+        """
+        Positions where moves should be tried
+
+        :return: ascending list of positions whose don't-look bit is not set
+        :rtype: list[int]
+        """
+        return [i for i in range(self.__dimension) if not self.__bits[i]]
+
+    def set_bits(self, positions:Iterable[int])->None:
+        """
+        Sets don't-look bits of the given positions, after moves at them failed
+
+        :param Iterable[int] positions: positions
+        """
+        for i in positions:
+            self.__bits[i] = True
+
+    def reset_bits(self, positions:Iterable[int])->None:
+        """
+        Resets don't-look bits of the given positions and of the positions related to them
+
+        :param Iterable[int] positions: positions
+        """
+        for i in positions:
+            self.__bits[i] = False
+            if self.__related_positions is not None:
+                for j in self.__related_positions.get(i, []):
+                    self.__bits[j] = False
+
+    def reset_all(self)->None:
+        """
+        Resets all don't-look bits
+        """
+        self.__bits = [False] * self.__dimension
+
+    def synchronize(self, representation:BitArray|int)->list[int]:
+        """
+        Resets don't-look bits of the positions where representation differs from the one seen at the previous
+        synchronization (and of the positions related to them), so changes made by any move or shaking are
+        taken into account. At the first synchronization, all bits are reset.
+
+        :param BitArray|int representation: current representation of the solution, as bit array or int
+        :return: positions where representation has been changed
+        :rtype: list[int]
+        """
+        if self.__reference is None:
+            self.reset_all()
+            changed:list[int] = []
+        elif isinstance(representation, BitArray):
+            changed:list[int] = list((self.__reference ^ representation).findall('0b1'))
+        else:
+            difference:int = self.__reference ^ representation
+            changed:list[int] = [i for i in range(difference.bit_length()) if difference >> i & 1]
+        self.reset_bits(i for i in changed if i < self.__dimension)
+        if isinstance(representation, BitArray):
+            self.__reference = representation.copy()
+        else:
+            self.__reference = representation
+        return changed
+
+    def __str__(self)->str:
+        """
+        String representation of the don't-look bits
+
+        :return: string representation of the don't-look bits
+        :rtype: str
+        """
+        return ''.join('1' if b else '0' for b in self.__bits)
@@ -0,0 +1,44 @@
+"""
+The :mod:`~uo.utils.geometric_skip` module contains utility functions that determine positions to be changed
+with some small probability, without drawing random number for every position.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+import math
+from random import random
+
+def geometric_skip_positions(length:int, probability:float)->list[int]:
+        """
+        Determines positions that should be changed, when each of `length` positions is independently changed
+        with the given probability.
+        Gaps between consecutive chosen positions are sampled from geometric distribution, so number of random draws
+        is proportional to the number of chosen positions, instead of the number of all positions.
+
+        :param int length: number of positions
+        :param float probability: probability that single position is chosen
+        :return: ascending list of chosen positions
+        :rtype: list[int]
+        """
+        if not isinstance(length, int):
+                raise TypeError('Parameter \'length\' must be \'int\'.')
+        if not isinstance(probability, int|float):
+                raise TypeError('Parameter \'probability\' must be \'float\'.')
+        if length <= 0 or probability <= 0:
+                return []
+        if probability >= 1:
+                return list(range(length))
+        log_q:float = math.log1p(-probability)
+        positions:list[int] = []
+        pos:int = -1
+        while True:
+                # 1 - random() is in (0, 1], so logarithm is always defined
+                pos += 1 + int(math.log(1.0 - random()) / log_q)
+                if pos >= length:
+                        break
+                positions.append(pos)
+        return positions
@@ -0,0 +1,109 @@
+"""
+The :mod:`~uo.utils.halton_sequence` module contains class :class:`~uo.utils.halton_sequence.ScrambledHaltonSequence`,
+that generates scrambled Halton low-discrepancy points in the unit cube, and the helper function for the first primes.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+
+from typing import Optional
+
+import numpy as np
+
+def first_primes(count:int)->list[int]:
+    """
+    The first prime numbers
+
+    :param int count: number of primes
+    :return: ascending list of the first primes
+    :rtype: list[int]
+    """
+    primes:list[int] = []
+    candidate:int = 2
+    while len(primes) < count:
+        if all(candidate % p != 0 for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+class ScrambledHaltonSequence:
+    """
+    This class describes scrambled Halton sequence - low-discrepancy sequence of points in the unit cube, where
+    coordinate `j` of the point `n` is radical inverse of `n` in base of the `j`-th prime. Digits are scrambled by
+    random permutations, one for each coordinate and digit position, which breaks correlations between coordinates
+    with large bases while keeping the even coverage.
+    """
+
+    def __init__(self, dimension:int, generator:Optional[np.random.Generator]=None)->None:
+        """
+        Create new ScrambledHaltonSequence instance
+
+        :param int dimension: number of coordinates of each point
+        :param Optional[np.random.Generator] generator: random generator for scrambling permutations - if `None`,
+        new generator, seeded from the operating system, is used
+        """
+        if not isinstance(dimension, int):
+            raise TypeError('Parameter \'dimension\' must be \'int\'.')
+        if dimension <= 0:
+            raise ValueError('Parameter \'dimension\' must be greater than zero.')
+        self.__dimension:int = dimension
+        self.__generator:np.random.Generator = generator if generator is not None else np.random.default_rng()
+        self.__bases:list[int] = first_primes(dimension)
+        # permutations of digits, for each coordinate - created when digit position is first needed
+        self.__permutations:list[list[np.ndarray]] = [[] for _ in range(dimension)]
+        self.__index:int = 0
+
+    @property
+    def dimension(self)->int:
+        """
+        Property getter for the number of coordinates of each point
+
+        :return: number of coordinates
+        :rtype: int
+        """
+        return self.__dimension
+
+    @property
+    def index(self)->int:
+        """
+        Property getter for the index of the next point of the sequence
+
+        :return: index of the next point
+        :rtype: int
+        """
+        return self.__index
+
+    def __permutation(self, coordinate:int, position:int)->np.ndarray:
+        """
+        Permutation of digits for the given coordinate and digit position
+        """
+        permutations:list[np.ndarray] = self.__permutations[coordinate]
+        while len(permutations) <= position:
+            permutations.append(self.__generator.permutation(self.__bases[coordinate]))
+        return permutations[position]
+
+    def points(self, count:int)->np.ndarray:
+        """
+        The next points of the sequence
+
+        :param int count: number of points
+        :return: matrix of points, one point per row, with coordinates in `[0,1)`
+        :rtype: np.ndarray
+        """
+        indexes:np.ndarray = np.arange(self.__index, self.__index + count, dtype=np.int64)
+        self.__index += count
+        result:np.ndarray = np.zeros((count, self.__dimension), dtype=np.float64)
+        for j, base in enumerate(self.__bases):
+            # digits of the largest index, plus one scrambled digit for the finer resolution
+            digit_count:int = 1
+            while base ** digit_count <= self.__index:
+                digit_count += 1
+            remaining:np.ndarray = indexes.copy()
+            factor:float = 1.0 / base
+            for position in range(digit_count + 1):
+                result[:, j] += self.__permutation(j, position)[remaining % base] * factor
+                remaining //= base
+                factor /= base
+        return result
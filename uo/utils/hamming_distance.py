@@ -0,0 +1,56 @@
+"""
+The :mod:`~uo.utils.hamming_distance` module contains utility functions for calculating Hamming distance between
+bit sequences, as XOR of the packed sequences followed by counting of the set bits.
+"""
+
+from pathlib import Path
+directory = Path(__file__).resolve()
+import sys
+sys.path.append(directory.parent)
+sys.path.append(directory.parent.parent)
+
+import numpy as np
+
+from bitstring import BitArray
+
+# number of set bits in each byte value
+_BYTE_POPCOUNT:np.ndarray = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+def hamming_distance(representation_1:BitArray|bytes|int, representation_2:BitArray|bytes|int)->int:
+        """
+        Number of positions where two bit sequences differ
+
+        :param BitArray|bytes|int representation_1: first bit sequence, as bit array, packed bytes or int
+        :param BitArray|bytes|int representation_2: second bit sequence, of the same kind as the first one
+        :return: Hamming distance between sequences
+        :rtype: int
+        """
+        if isinstance(representation_1, int) and isinstance(representation_2, int):
+                return (representation_1 ^ representation_2).bit_count()
+        if isinstance(representation_1, BitArray) and isinstance(representation_2, BitArray):
+                if len(representation_1) != len(representation_2):
+                        raise ValueError('Bit arrays must have the same length.')
+                # bits after the end of the bit array are packed as zeros
+                representation_1 = representation_1.tobytes()
+                representation_2 = representation_2.tobytes()
+        if not isinstance(representation_1, (bytes, bytearray)) or \
+                        not isinstance(representation_2, (bytes, bytearray)):
+                raise TypeError('Parameters must be both \'BitArray\', both \'bytes\' or both \'int\'.')
+        if len(representation_1) != len(representation_2):
+                raise ValueError('Byte sequences must have the same length.')
+        return (int.from_bytes(representation_1, 'big') ^ int.from_bytes(representation_2, 'big')).bit_count()
+
+def hamming_distance_matrix(packed:np.ndarray)->np.ndarray:
+        """
+        Hamming distances between all pairs of bit sequences
+
+        :param np.ndarray packed: matrix of packed bytes (`uint8`), one bit sequence per row
+        :return: symmetric matrix of Hamming distances, with zero diagonal
+        :rtype: np.ndarray
+        """
+        if not isinstance(packed, np.ndarray) or packed.dtype != np.uint8 or packed.ndim != 2:
+                raise TypeError('Parameter \'packed\' must be two-dimensional \'np.ndarray\' of \'uint8\'.')
+        distances:np.ndarray = np.zeros((packed.shape[0], packed.shape[0]), dtype=np.int64)
+        for i in range(packed.shape[0]):
+                distances[i] = _BYTE_POPCOUNT[np.bitwise_xor(packed, packed[i])].sum(axis=1)
+        return distances
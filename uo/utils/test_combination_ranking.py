@@ -0,0 +1,78 @@
+import unittest
+from itertools import combinations
+
+from uo.utils.combination_ranking import combination_count, unrank_combination, next_combination, \
+        sample_combinations
+
+class TestCombinationRanking(unittest.TestCase):
+
+    # combination count is binomial coefficient
+    def test_combination_count(self):
+        self.assertEqual(combination_count(5, 2), 10)
+        self.assertEqual(combination_count(3, 4), 0)
+
+    # unranking follows lexicographic order
+    def test_unrank_should_follow_lexicographic_order(self):
+        # Arrange
+        expected = [list(c) for c in combinations(range(6), 3)]
+        # Act
+        actual = [unrank_combination(rank, 6, 3) for rank in range(combination_count(6, 3))]
+        # Assert
+        self.assertEqual(actual, expected)
+
+    # rank out of range raises ValueError
+    def test_unrank_out_of_range_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            unrank_combination(10, 5, 2)
+
+    # successive combinations follow lexicographic order
+    def test_next_combination_should_follow_lexicographic_order(self):
+        # Arrange
+        combination = [0, 1]
+        actual = [list(combination)]
+        # Act
+        while next_combination(combination, 5):
+            actual.append(list(combination))
+        # Assert
+        self.assertEqual(actual, [list(c) for c in combinations(range(5), 2)])
+        self.assertEqual(combination, [3, 4])
+
+    # sample contains different combinations
+    def test_sample_should_contain_different_combinations(self):
+        # Act
+        sample = list(sample_combinations(2000, 3, 500))
+        # Assert
+        self.assertEqual(len(sample), 500)
+        self.assertEqual(len(set(tuple(c) for c in sample)), 500)
+        for c in sample:
+            self.assertEqual(c, sorted(c))
+            self.assertEqual(len(set(c)), 3)
+            self.assertTrue(0 <= c[0] and c[-1] < 2000)
+
+    # sample larger than the number of combinations contains all combinations
+    def test_large_sample_should_contain_all_combinations(self):
+        # Act
+        sample = list(sample_combinations(6, 3, 100))
+        # Assert
+        self.assertEqual(sorted(sample), [list(c) for c in combinations(range(6), 3)])
+
+    # dense sample contains different combinations
+    def test_dense_sample_should_contain_different_combinations(self):
+        # Act
+        sample = list(sample_combinations(10, 3, 100))
+        # Assert
+        self.assertEqual(len(sample), 100)
+        self.assertEqual(len(set(tuple(c) for c in sample)), 100)
+
+    # sample is generated lazily, so drawing first combinations of huge sample is fast
+    def test_sample_should_be_generated_lazily(self):
+        # Arrange
+        total = combination_count(2000, 3)
+        # Act
+        sample = sample_combinations(2000, 3, total)
+        first = [next(sample) for _ in range(10)]
+        # Assert
+        self.assertEqual(len(set(tuple(c) for c in first)), 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -248,4 +248,43 @@ class TestComplexCounterBitArrayFull2(unittest.TestCase):
         cc.progress()
         # Assert
         self.assertIsInstance(cc, ComplexCounterBitArrayFull)
-        self.assertEqual(cc.current_state().bin, '100')
\ No newline at end of file
+        self.assertEqual(cc.current_state().bin, '100')
+    # counter with prefix keeps the highest counters fixed, and counts only the free ones
+    def test_counter_with_prefix_should_count_only_free_counters(self):
+        # Arrange
+        cc = ComplexCounterBitArrayFull(4, prefix_length=2, prefix=2)
+        states = []
+        # Act
+        cc.reset()
+        states.append(cc.current_state().bin)
+        while cc.progress():
+            states.append(cc.current_state().bin)
+        # Assert
+        self.assertEqual(states, ['0001', '1001', '0101', '1101'])
+        self.assertFalse(cc.can_progress())
+
+    # counter with all counters fixed can not progress
+    def test_counter_with_full_prefix_should_not_progress(self):
+        # Arrange
+        cc = ComplexCounterBitArrayFull(3, prefix_length=3, prefix=5)
+        # Act
+        cc.reset()
+        # Assert
+        self.assertEqual(cc.current_state().bin, '101')
+        self.assertFalse(cc.can_progress())
+        self.assertFalse(cc.progress())
+
+    # prefix that does not fit into prefix length raises ValueError
+    def test_prefix_outside_of_range_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            ComplexCounterBitArrayFull(4, prefix_length=2, prefix=4)
+
+    # counter set to the given state continues counting from it
+    def test_set_state_should_continue_from_given_state(self):
+        # Arrange
+        cc = ComplexCounterBitArrayFull(4)
+        # Act
+        cc.set_state(BitArray(bin='1101'))
+        cc.progress()
+        # Assert
+        self.assertEqual(cc.current_state().bin, '0011')
@@ -0,0 +1,64 @@
+import unittest
+from math import comb
+
+from uo.utils.complex_counter_revolving_door import ComplexCounterRevolvingDoor
+
+class TestComplexCounterRevolvingDoor(unittest.TestCase):
+
+    # initial state contains the smallest values
+    def test_create_instance_with_valid_parameters(self):
+        # Arrange & Act
+        cc = ComplexCounterRevolvingDoor(3, 6)
+        # Assert
+        self.assertEqual(cc.current_state(), [0, 1, 2])
+        self.assertIsNone(cc.last_swap)
+
+    # counter size smaller than number of counters raises ValueError
+    def test_counter_size_smaller_than_number_of_counters_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            ComplexCounterRevolvingDoor(4, 3)
+
+    # all combinations are visited exactly once
+    def test_all_combinations_should_be_visited_once(self):
+        for n in range(1, 8):
+            for k in range(1, n + 1):
+                # Arrange
+                cc = ComplexCounterRevolvingDoor(k, n)
+                visited = []
+                # Act
+                in_loop = cc.reset()
+                while in_loop:
+                    visited.append(tuple(cc.current_state()))
+                    in_loop = cc.progress()
+                # Assert
+                self.assertEqual(len(visited), comb(n, k))
+                self.assertEqual(len(set(visited)), comb(n, k))
+
+    # consecutive combinations differ in one removed and one added value, reported as last swap
+    def test_consecutive_combinations_should_differ_in_one_swap(self):
+        # Arrange
+        cc = ComplexCounterRevolvingDoor(3, 7)
+        previous = set(cc.current_state())
+        # Act & Assert
+        while cc.progress():
+            current = set(cc.current_state())
+            removed, added = cc.last_swap
+            self.assertEqual(previous - current, {removed})
+            self.assertEqual(current - previous, {added})
+            previous = current
+
+    # reset returns counter to its initial state
+    def test_reset_complex_counter(self):
+        # Arrange
+        cc = ComplexCounterRevolvingDoor(2, 5)
+        cc.progress()
+        cc.progress()
+        # Act
+        result = cc.reset()
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(cc.current_state(), [0, 1])
+        self.assertIsNone(cc.last_swap)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from bitstring import BitArray
+
+from uo.utils.dont_look_bits import DontLookBits
+
+class TestDontLookBits(unittest.TestCase):
+
+    # initially all positions are looked at
+    def test_initially_all_positions_should_be_looked_at(self):
+        # Arrange
+        dont_look_bits = DontLookBits(4)
+        # Act
+        looking = dont_look_bits.looking_positions()
+        # Assert
+        self.assertEqual(looking, [0, 1, 2, 3])
+
+    # move is tried if at least one of its positions is looked at
+    def test_looks_any_should_check_all_positions(self):
+        # Arrange
+        dont_look_bits = DontLookBits(4)
+        # Act
+        dont_look_bits.set_bits([0, 1, 2])
+        # Assert
+        self.assertFalse(dont_look_bits.looks_any([0, 1]))
+        self.assertTrue(dont_look_bits.looks_any([1, 3]))
+        self.assertFalse(dont_look_bits.is_looking(2))
+
+    # reset of the position also resets related positions
+    def test_reset_should_reset_related_positions(self):
+        # Arrange
+        dont_look_bits = DontLookBits(4, related_positions={1: [0, 3]})
+        dont_look_bits.set_bits(range(4))
+        # Act
+        dont_look_bits.reset_bits([1])
+        # Assert
+        self.assertEqual(dont_look_bits.looking_positions(), [0, 1, 3])
+
+    # synchronization resets positions where bit array representation has been changed
+    def test_synchronize_bit_array_should_reset_changed_positions(self):
+        # Arrange
+        dont_look_bits = DontLookBits(4)
+        representation = BitArray(bin='0110')
+        dont_look_bits.synchronize(representation)
+        dont_look_bits.set_bits(range(4))
+        representation.invert([0, 2])
+        # Act
+        changed = dont_look_bits.synchronize(representation)
+        # Assert
+        self.assertEqual(changed, [0, 2])
+        self.assertEqual(dont_look_bits.looking_positions(), [0, 2])
+
+    # synchronization resets positions where int representation has been changed
+    def test_synchronize_int_should_reset_changed_positions(self):
+        # Arrange
+        dont_look_bits = DontLookBits(4)
+        dont_look_bits.synchronize(0b0110)
+        dont_look_bits.set_bits(range(4))
+        # Act
+        changed = dont_look_bits.synchronize(0b1100)
+        # Assert
+        self.assertEqual(changed, [1, 3])
+        self.assertEqual(dont_look_bits.looking_positions(), [1, 3])
+
+    # dimension should be positive
+    def test_non_positive_dimension_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            DontLookBits(0)
+
+if __name__ == '__main__':
+    unittest.main()
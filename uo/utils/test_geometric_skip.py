@@ -0,0 +1,64 @@
+import unittest
+from random import seed
+
+from uo.utils.geometric_skip import geometric_skip_positions
+
+class TestGeometricSkip(unittest.TestCase):
+
+    # no position is chosen when probability is zero
+    def test_zero_probability_should_return_empty_list(self):
+        # Act
+        positions = geometric_skip_positions(100, 0.0)
+        # Assert
+        self.assertEqual(positions, [])
+
+    # all positions are chosen when probability is one
+    def test_probability_one_should_return_all_positions(self):
+        # Act
+        positions = geometric_skip_positions(10, 1.0)
+        # Assert
+        self.assertEqual(positions, list(range(10)))
+
+    # chosen positions are strictly ascending and within range
+    def test_positions_should_be_ascending_and_in_range(self):
+        # Arrange
+        seed(42)
+        # Act
+        positions = geometric_skip_positions(1000, 0.1)
+        # Assert
+        self.assertTrue(all(0 <= p < 1000 for p in positions))
+        self.assertTrue(all(positions[i] < positions[i+1] for i in range(len(positions)-1)))
+
+    # average number of chosen positions corresponds to the probability
+    def test_average_number_of_positions_should_match_probability(self):
+        # Arrange
+        seed(1234)
+        length = 1000
+        probability = 0.01
+        runs = 2000
+        # Act
+        total = sum(len(geometric_skip_positions(length, probability)) for _ in range(runs))
+        # Assert
+        self.assertAlmostEqual(total / runs, length * probability, delta=0.5)
+
+    # every position has the same chance to be chosen
+    def test_positions_should_be_uniformly_distributed(self):
+        # Arrange
+        seed(4321)
+        length = 10
+        counts = [0] * length
+        # Act
+        for _ in range(20000):
+            for p in geometric_skip_positions(length, 0.2):
+                counts[p] += 1
+        # Assert
+        for c in counts:
+            self.assertAlmostEqual(c / 20000, 0.2, delta=0.02)
+
+    # invalid length type raises TypeError
+    def test_invalid_length_type_should_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            geometric_skip_positions('10', 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
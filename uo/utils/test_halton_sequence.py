@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from uo.utils.halton_sequence import first_primes, ScrambledHaltonSequence
+
+class TestScrambledHaltonSequence(unittest.TestCase):
+
+    # bases are the first primes
+    def test_first_primes(self):
+        self.assertEqual(first_primes(8), [2, 3, 5, 7, 11, 13, 17, 19])
+
+    # points are within unit cube, and the sequence continues between calls
+    def test_points_should_be_within_unit_cube(self):
+        # Arrange
+        sequence = ScrambledHaltonSequence(6, np.random.default_rng(42))
+        # Act
+        points = np.vstack([sequence.points(10), sequence.points(22)])
+        # Assert
+        self.assertEqual(points.shape, (32, 6))
+        self.assertTrue(np.all(points >= 0) and np.all(points < 1))
+        self.assertEqual(sequence.index, 32)
+
+    # each coordinate is stratified - every interval of length 1/base contains the same number of points
+    def test_points_should_be_stratified_in_each_coordinate(self):
+        # Arrange
+        sequence = ScrambledHaltonSequence(3, np.random.default_rng(7))
+        # Act
+        points = sequence.points(30)
+        # Assert
+        for j, base in enumerate([2, 3, 5]):
+            counts = np.bincount(np.floor(points[:, j] * base).astype(int), minlength=base)
+            self.assertTrue(np.all(counts == 30 // base))
+
+    # non-positive dimension raises ValueError
+    def test_non_positive_dimension_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            ScrambledHaltonSequence(0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from bitstring import BitArray
+
+from uo.utils.hamming_distance import hamming_distance, hamming_distance_matrix
+
+class TestHammingDistance(unittest.TestCase):
+
+    # distance between bit arrays is number of differing positions
+    def test_hamming_distance_of_bit_arrays(self):
+        self.assertEqual(hamming_distance(BitArray(bin='1011001110'), BitArray(bin='0011101111')), 3)
+        self.assertEqual(hamming_distance(BitArray(bin='101'), BitArray(bin='101')), 0)
+
+    # distance between ints and between bytes is number of differing bits
+    def test_hamming_distance_of_ints_and_bytes(self):
+        self.assertEqual(hamming_distance(0b1011, 0b0110), 3)
+        self.assertEqual(hamming_distance(b'\xff\x00', b'\x0f\x01'), 5)
+
+    # bit arrays of different length raise ValueError
+    def test_hamming_distance_of_different_lengths_should_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            hamming_distance(BitArray(bin='101'), BitArray(bin='1010'))
+
+    # mixed kinds of sequences raise TypeError
+    def test_hamming_distance_of_mixed_kinds_should_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            hamming_distance(BitArray(bin='101'), 5)
+
+    # matrix contains pairwise distances of packed rows
+    def test_hamming_distance_matrix_should_contain_pairwise_distances(self):
+        # Arrange
+        representations = [BitArray(bin=b) for b in ['1011001110', '0011101111', '1111111111', '0000000000']]
+        packed = np.array([list(r.tobytes()) for r in representations], dtype=np.uint8)
+        # Act
+        distances = hamming_distance_matrix(packed)
+        # Assert
+        for i in range(4):
+            for j in range(4):
+                self.assertEqual(distances[i, j], hamming_distance(representations[i], representations[j]))
+
+    # matrix of non-byte elements raises TypeError
+    def test_hamming_distance_matrix_of_non_bytes_should_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            hamming_distance_matrix(np.zeros((2, 2), dtype=np.int64))
+
+if __name__ == '__main__':
+    unittest.main()